@@ -13,7 +13,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     Platform,
 )
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -22,14 +22,37 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from .api.apartment import DigitalstromApartment
 from .api.client import DigitalstromClient
+from .api.device import DigitalstromDevice
 from .api.exceptions import CannotConnect, InvalidAuth, InvalidCertificate, ServerError
-from .const import CONF_DSUID, CONF_SSL, DOMAIN, WEBSOCKET_WATCHDOG_INTERVAL
+from .const import (
+    CONF_DSUID,
+    CONF_SSL,
+    DOMAIN,
+    FIRMWARE_CACHE_KEY,
+    FIRMWARE_CACHE_VERSION,
+    SCENE_CACHE_KEY,
+    SCENE_CACHE_VERSION,
+    SCENE_REFRESH_DELAY,
+    SCENE_VALUES_UPDATE_DELAY,
+    SIGNAL_CIRCUIT_REMOVED,
+    SIGNAL_CIRCUITS_ADDED,
+    SIGNAL_DEVICE_REMOVED,
+    SIGNAL_DEVICES_ADDED,
+    SIGNAL_ZONE_REMOVED,
+    SIGNAL_ZONES_ADDED,
+    TOPOLOGY_UPDATE_DELAY,
+    TOPOLOGY_UPDATE_INTERVAL,
+)
 from .coordinator import DigitalstromApartmentStatusCoordinator, DigitalstromConfigEntry
+from .store import DigitalstromSceneStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,6 +130,9 @@ async def async_setup_entry(
         await apartment.get_zones()
         await apartment.get_circuits()
         await apartment.get_devices()
+        scene_store = DigitalstromSceneStore(hass, entry.entry_id, apartment)
+        hass.data[DOMAIN][entry.unique_id]["scene_store"] = scene_store
+        await scene_store.async_load_cache()
 
         coordinator = DigitalstromApartmentStatusCoordinator(
             hass=hass,
@@ -122,16 +148,79 @@ async def async_setup_entry(
         raise ConfigEntryNotReady(ex) from ex
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_create_background_task(
+        hass, apartment.get_last_called_scenes(), "digitalstrom_last_called_scenes"
+    )
+
+    async def update_topology(*args: Any) -> None:
+        await async_reconcile_topology(hass, entry)
+
+    topology_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=TOPOLOGY_UPDATE_DELAY.total_seconds(),
+        immediate=False,
+        function=update_topology,
+    )
+    entry.async_on_unload(
+        apartment.register_topology_callback(topology_debouncer.async_schedule_call)
+    )
+    entry.async_on_unload(topology_debouncer.async_shutdown)
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, update_topology, TOPOLOGY_UPDATE_INTERVAL, cancel_on_shutdown=True
+        )
+    )
+
+    scene_refresh_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SCENE_REFRESH_DELAY.total_seconds(),
+        immediate=False,
+        function=coordinator.async_refresh,
+    )
+
+    async def update_scene_values() -> None:
+        if await apartment.update_missing_scene_values():
+            scene_store.async_schedule_save()
+
+    scene_value_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SCENE_VALUES_UPDATE_DELAY.total_seconds(),
+        immediate=False,
+        function=update_scene_values,
+    )
+
+    @callback
+    def refresh_after_scene(devices: list[DigitalstromDevice]) -> None:
+        # Show the cached scene values right away and confirm them with a full
+        # apartment status refresh, scene calls in quick succession share a
+        # single request
+        coordinator.async_update_listeners()
+        scene_refresh_debouncer.async_schedule_call()
+        # Values of scenes called for the first time are read once
+        if apartment.missing_scene_values:
+            scene_value_debouncer.async_schedule_call()
+
+    entry.async_on_unload(apartment.register_scene_impact_callback(refresh_after_scene))
+    entry.async_on_unload(scene_refresh_debouncer.async_shutdown)
+    entry.async_on_unload(scene_value_debouncer.async_shutdown)
+
+    async def resync_after_reconnect(gap: float) -> None:
+        await apartment.resync(gap)
+        # Output states were read from the apartment status
+        coordinator.async_update_listeners()
+
+    entry.async_on_unload(client.register_reconnect_callback(resync_after_reconnect))
 
     async def start_watchdog(event: Any = None) -> None:
-        """Start websocket watchdog."""
+        """Start the event listener, it reconnects with backoff when it fails."""
         if "watchdog" not in hass.data[DOMAIN][entry.unique_id]:
-            hass.data[DOMAIN][entry.unique_id]["watchdog"] = async_track_time_interval(
-                hass,
-                client.event_listener_watchdog,
-                WEBSOCKET_WATCHDOG_INTERVAL,
-                cancel_on_shutdown=True,
+            task = entry.async_create_background_task(
+                hass, client.run_event_listener(), "digitalstrom_event_listener"
             )
+            hass.data[DOMAIN][entry.unique_id]["watchdog"] = task.cancel
 
     async def stop_watchdog(event: Any = None) -> None:
         await async_unload_entry(hass, entry)
@@ -142,14 +231,32 @@ async def async_setup_entry(
         await start_watchdog()
     else:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_watchdog)
-        hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STARTED, client.event_listener_watchdog
-        )
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_watchdog)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+async def async_update_options(
+    hass: HomeAssistant, entry: DigitalstromConfigEntry
+) -> None:
+    """Reload the config entry when the options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: DigitalstromConfigEntry
+) -> None:
+    """Remove the scene and firmware cache of a removed config entry."""
+    await Store(
+        hass, SCENE_CACHE_VERSION, SCENE_CACHE_KEY.format(entry.entry_id)
+    ).async_remove()
+    await Store(
+        hass, FIRMWARE_CACHE_VERSION, FIRMWARE_CACHE_KEY.format(entry.entry_id)
+    ).async_remove()
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: DigitalstromConfigEntry
 ) -> bool:
@@ -165,6 +272,122 @@ async def async_unload_entry(
     return unload_ok
 
 
+async def async_reconcile_topology(
+    hass: HomeAssistant, entry: DigitalstromConfigEntry
+) -> None:
+    """Add and remove entities for devices, circuits and zones of the dSS."""
+    apartment: DigitalstromApartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
+    # Devices with multiple dSUIDs are registered with the dSUID of their parent
+    old_parents = {
+        dsuid: device.get_parent().dsuid for dsuid, device in apartment.devices.items()
+    }
+    try:
+        (
+            added_devices,
+            removed_devices,
+            added_circuits,
+            removed_circuits,
+            added_zones,
+            removed_zones,
+        ) = await apartment.update_topology()
+    except (CannotConnect, InvalidAuth, ServerError) as ex:
+        _LOGGER.debug(f"Topology update failed: {ex}")
+        return
+
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+
+    def remove_device_entry(identifier: str) -> None:
+        if (
+            device_entry := device_registry.async_get_device(
+                identifiers={(DOMAIN, identifier)}
+            )
+        ) is not None:
+            device_registry.async_update_device(
+                device_entry.id, remove_config_entry_id=entry.entry_id
+            )
+
+    def move_device_entry(identifier: str, new_identifier: str) -> None:
+        # The remaining dSUIDs of a device keep its registry entry when the
+        # dSUID it was registered with is removed
+        if (
+            device_entry := device_registry.async_get_device(
+                identifiers={(DOMAIN, identifier)}
+            )
+        ) is None:
+            return
+        if (
+            new_device_entry := device_registry.async_get_device(
+                identifiers={(DOMAIN, new_identifier)}
+            )
+        ) is None:
+            device_registry.async_update_device(
+                device_entry.id, new_identifiers={(DOMAIN, new_identifier)}
+            )
+            return
+        for entity_entry in er.async_entries_for_device(
+            entity_registry, device_entry.id, include_disabled_entities=True
+        ):
+            entity_registry.async_update_entity(
+                entity_entry.entity_id, device_id=new_device_entry.id
+            )
+        remove_device_entry(identifier)
+
+    for zone in apartment.zones.values():
+        if (
+            zone_device := device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{apartment.dsuid}_zone{zone.zone_id}")}
+            )
+        ) is not None and zone_device.name != zone.name:
+            _LOGGER.debug(f'Zone {zone.zone_id} was renamed to "{zone.name}"')
+            device_registry.async_update_device(
+                zone_device.id, name=zone.name, suggested_area=zone.name
+            )
+
+    for device in removed_devices:
+        _LOGGER.debug(f'Removing device "{device.name}" ({device.dsuid})')
+        async_dispatcher_send(hass, SIGNAL_DEVICE_REMOVED.format(device.dsuid))
+        if old_parents.get(device.dsuid) != device.dsuid:
+            continue
+        remaining_devices = [
+            apartment.devices[dsuid]
+            for dsuid, parent_dsuid in old_parents.items()
+            if parent_dsuid == device.dsuid and dsuid in apartment.devices
+        ]
+        if len(remaining_devices) > 0:
+            move_device_entry(device.dsuid, remaining_devices[0].get_parent().dsuid)
+        else:
+            remove_device_entry(device.dsuid)
+
+    for circuit in removed_circuits:
+        _LOGGER.debug(f'Removing circuit "{circuit.name}" ({circuit.dsuid})')
+        async_dispatcher_send(hass, SIGNAL_CIRCUIT_REMOVED.format(circuit.dsuid))
+        remove_device_entry(circuit.dsuid)
+
+    for zone in removed_zones:
+        _LOGGER.debug(f'Removing zone "{zone.name}" ({zone.zone_id})')
+        async_dispatcher_send(
+            hass, SIGNAL_ZONE_REMOVED.format(apartment.dsuid, zone.zone_id)
+        )
+        remove_device_entry(f"{apartment.dsuid}_zone{zone.zone_id}")
+
+    if len(added_devices) > 0:
+        _LOGGER.debug(f"Adding entities for {len(added_devices)} new devices")
+        async_dispatcher_send(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), added_devices
+        )
+    if len(added_circuits) > 0:
+        _LOGGER.debug(f"Adding entities for {len(added_circuits)} new circuits")
+        async_dispatcher_send(
+            hass, SIGNAL_CIRCUITS_ADDED.format(entry.entry_id), added_circuits
+        )
+    if len(added_zones) > 0:
+        _LOGGER.debug(f"Adding entities for {len(added_zones)} new zones")
+        async_dispatcher_send(
+            hass, SIGNAL_ZONES_ADDED.format(entry.entry_id), added_zones
+        )
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: DigitalstromConfigEntry,
@@ -189,6 +412,7 @@ async def migrate_system_dsuid(
 
     entity_registry = er.async_get(hass)
     device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
     device_entries = dr.async_entries_for_config_entry(
         device_registry, config_entry_id=config_entry.entry_id
     )
@@ -1,8 +1,22 @@
+import asyncio
 import logging
+from bisect import bisect_left, insort
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
 from .client import DigitalstromClient
-from .const import BUTTON_BUS_EVENT_TIMEOUT
+from .const import (
+    BUTTON_BUS_EVENT_TIMEOUT,
+    CLIMATE_FALLBACK_INTERVAL,
+    LAST_CALLED_SCENE_QUERY,
+    LAST_CALLED_SCENE_RESYNC_GAP,
+    SCENE_DISCOVERY_CONCURRENCY,
+    SCENE_NAME_QUERY,
+    SCENE_VALUE_CONCURRENCY,
+    TEMPERATURE_CONTROL_GROUP,
+    TEMPERATURE_CONTROL_OPERATION_MODES,
+)
+from .exceptions import CannotConnect, InvalidAuth, ServerError
 
 APARTMENT_SCENES: list = [
     ("Auto Standby", 64, None, None, None),
@@ -25,6 +39,25 @@ APARTMENT_SCENES: list = [
     ("Pollution", 92, None, None, None),
 ]
 
+# Websocket events handled by event_callback
+APARTMENT_EVENTS: list = [
+    "deviceSensorValue",
+    "deviceBinaryInputEvent",
+    "stateChange",
+    "DeviceEvent",
+    "callScene",
+    "callSceneBus",
+    "undoScene",
+    "buttonClick",
+    "apartmentProxyStateChanged",
+    "zoneSensorValue",
+    "HeatingControllerState",
+    "HeatingControllerValue",
+    "HeatingControllerSetup",
+    "sceneNameChanged",
+    "ModelChanged",
+]
+
 
 class DigitalstromApartment:
     def __init__(self, client: DigitalstromClient, system_dsuid: str):
@@ -35,12 +68,32 @@ class DigitalstromApartment:
         self.client = client
         self.dsuid = system_dsuid
         self.devices: dict[str, DigitalstromDevice] = {}
+        # Devices ordered by dSUID, used to find devices with multiple dSUIDs
+        self.sorted_devices: list[DigitalstromDevice] = []
         self.circuits: dict[str, DigitalstromCircuit] = {}
         self.zones: dict[int, DigitalstromZone] = {}
         self.scenes = []
         self.logger = logging.getLogger("digitalstrom_api")
         self.proxy_state_changed: datetime | None = None
-        client.register_event_callback(self.event_callback)
+        self.climate_updated: datetime | None = None
+        self.climate_values_updated: datetime | None = None
+        # The temperature control configuration only changes with a
+        # HeatingControllerSetup event
+        self.climate_config_valid = False
+        self.topology_callbacks: list[Callable[[], None]] = []
+        # Zone and group pairs whose scene lists have to be read again
+        self.stale_scene_groups: set[tuple[int, int]] = set()
+        self.scene_catalogue_callbacks: list[Callable[[], None]] = []
+        # Devices with outputs by zone and group, used to find the outputs
+        # affected by a scene call
+        self.output_devices: dict[tuple[int, int], list[DigitalstromDevice]] = {}
+        self.scene_impact_callbacks: list[
+            Callable[[list[DigitalstromDevice]], None]
+        ] = []
+        # Devices and scenes whose stored output values have to be read, they
+        # are only read when the scene is called
+        self.missing_scene_values: set[tuple[str, int]] = set()
+        client.register_event_callback(self.event_callback, APARTMENT_EVENTS)
         from .scene import DigitalstromApartmentScene
 
         for scene in APARTMENT_SCENES:
@@ -58,79 +111,450 @@ class DigitalstromApartment:
     async def undo_scene(self, scene: int) -> None:
         await self.client.request(f"apartment/undoScene?sceneNumber={scene}")
 
-    def find_split_devices(self) -> None:
-        devices = sorted(self.devices.values(), key=lambda x: int(x.dsuid, 16))
-        for prev, curr in zip(devices, devices[1:]):
-            if (
-                int(curr.dsuid, 16) <= int(prev.dsuid, 16) + 0x100
-                and prev.meter_dsuid == curr.meter_dsuid
-                and (
-                    curr.dsuid_index != 0
-                    or (curr.oem_part_number not in [0, 1])
-                    or not (
-                        prev.dsuid_index == curr.dsuid_index
-                        and prev.oem_part_number == curr.oem_part_number
-                    )
-                )
-            ):
-                parent_device = (
-                    prev if prev.parent_device is None else prev.parent_device
+    @staticmethod
+    def is_split_device(
+        prev: "DigitalstromDevice", curr: "DigitalstromDevice"
+    ) -> bool:
+        # Check if curr is another dSUID of the same physical device as prev
+        return (
+            curr.dsuid_int <= prev.dsuid_int + 0x100
+            and prev.meter_dsuid == curr.meter_dsuid
+            and (
+                curr.dsuid_index != 0
+                or (curr.oem_part_number not in [0, 1])
+                or not (
+                    prev.dsuid_index == curr.dsuid_index
+                    and prev.oem_part_number == curr.oem_part_number
                 )
-                curr.parent_device = parent_device
-                if curr.name not in parent_device.unique_device_names:
-                    parent_device.unique_device_names.append(curr.name)
-                self.logger.debug(f"Merging devices {parent_device.dsuid} {curr.dsuid}")
-                if parent_device.available != curr.available:
+            )
+        )
+
+    def find_split_devices(self, changed_devices: list["DigitalstromDevice"]) -> None:
+        # The grouping of a device only depends on the devices sorted before it,
+        # so each check starts at a changed device and stops as soon as the
+        # following devices keep their parent
+        devices = self.sorted_devices
+        for changed_device in sorted(changed_devices, key=lambda x: x.dsuid_int):
+            start = bisect_left(
+                devices, changed_device.dsuid_int, key=lambda x: x.dsuid_int
+            )
+            for index in range(start, len(devices)):
+                curr = devices[index]
+                parent_device = None
+                prev = devices[index - 1] if index > 0 else None
+                if prev is not None and self.is_split_device(prev, curr):
+                    parent_device = prev.get_parent()
+                if index > start and parent_device is curr.parent_device:
+                    break
+                if parent_device is not None:
                     self.logger.debug(
-                        f"Merged devices have different availability: {parent_device.available} {curr.available}"
+                        f"Merging devices {parent_device.dsuid} {curr.dsuid}"
                     )
+                    if parent_device.available != curr.available:
+                        self.logger.debug(
+                            f"Merged devices have different availability: {parent_device.available} {curr.available}"
+                        )
+                curr.set_parent_device(parent_device)
+
+    def register_topology_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        # Called when the dSS reports that devices were added or removed
+        if callback not in self.topology_callbacks:
+            self.topology_callbacks.append(callback)
+
+        def unregister_topology_callback() -> None:
+            if callback in self.topology_callbacks:
+                self.topology_callbacks.remove(callback)
+
+        return unregister_topology_callback
+
+    async def update_topology(self) -> tuple[list, list, list, list, list, list]:
+        # Reload zones, circuits and devices
+        # Returns the added devices, removed devices, added circuits, removed
+        # circuits, added zones and removed zones
+        old_devices = dict(self.devices)
+        old_circuits = dict(self.circuits)
+        old_zones = dict(self.zones)
+        await self.get_zones()
+        await self.get_circuits()
+        await self.get_devices()
+        added_devices = [
+            device
+            for dsuid, device in self.devices.items()
+            if dsuid not in old_devices
+        ]
+        removed_devices = [
+            device
+            for dsuid, device in old_devices.items()
+            if dsuid not in self.devices
+        ]
+        added_circuits = [
+            circuit
+            for dsuid, circuit in self.circuits.items()
+            if dsuid not in old_circuits
+        ]
+        removed_circuits = [
+            circuit
+            for dsuid, circuit in old_circuits.items()
+            if dsuid not in self.circuits
+        ]
+        added_zones = [
+            zone for zone_id, zone in self.zones.items() if zone_id not in old_zones
+        ]
+        removed_zones = [
+            zone for zone_id, zone in old_zones.items() if zone_id not in self.zones
+        ]
+        return (
+            added_devices,
+            removed_devices,
+            added_circuits,
+            removed_circuits,
+            added_zones,
+            removed_zones,
+        )
 
     async def get_devices(self) -> dict:
         data = await self.client.request("apartment/getDevices")
         data = data.get("result", [])
-        self.logger.debug(f"getDevices {data}")
-        for d in data:
-            if (dsuid := d.get("dSUID")) and (len(dsuid) > 0):
-                if dsuid not in self.devices.keys():
-                    from .device import DigitalstromDevice
+        # Formatting the full response is expensive for large installations
+        self.logger.debug("getDevices %s", data)
+        from .decoder import decode_device
+        from .device import DigitalstromDevice
 
+        present_dsuids = set()
+        changed_devices = []
+        for d in data:
+            if dsuid := d.get("dSUID"):
+                present_dsuids.add(dsuid)
+                if (device := self.devices.get(dsuid)) is None:
                     device = DigitalstromDevice(self.client, self, dsuid)
                     self.devices[dsuid] = device
-                self.devices[dsuid].load_from_dict(d)
-        self.find_split_devices()
+                    decode_device(device, d)
+                    insort(self.sorted_devices, device, key=lambda x: x.dsuid_int)
+                    changed_devices.append(device)
+                    continue
+                if self.decode_known_device(device, d):
+                    changed_devices.append(device)
+        for dsuid in list(self.devices.keys()):
+            if dsuid not in present_dsuids:
+                self.logger.debug(f"Device {dsuid} was removed")
+                removed_device = self.devices.pop(dsuid)
+                index = bisect_left(
+                    self.sorted_devices,
+                    removed_device.dsuid_int,
+                    key=lambda x: x.dsuid_int,
+                )
+                del self.sorted_devices[index]
+                removed_device.set_parent_device(None)
+                for child_device in list(removed_device.child_devices):
+                    child_device.set_parent_device(None)
+                removed_device.update_availability(False)
+                if index < len(self.sorted_devices):
+                    changed_devices.append(self.sorted_devices[index])
+        self.find_split_devices(changed_devices)
+        self.update_output_devices()
         return self.devices
 
+    def decode_known_device(self, device: "DigitalstromDevice", data: dict) -> bool:
+        # Update a known device, returns True if the change affects the
+        # grouping of devices with multiple dSUIDs
+        from .decoder import decode_device
+
+        split_key = device.split_key()
+        decode_device(device, data)
+        return device.split_key() != split_key
+
+    def update_output_devices(self) -> None:
+        output_devices: dict[tuple[int, int], list["DigitalstromDevice"]] = {}
+        for device in self.devices.values():
+            if len(device.output_channels) > 0 and device.zone_id is not None:
+                output_devices.setdefault(
+                    (device.zone_id, device.button_group), []
+                ).append(device)
+        self.output_devices = output_devices
+
+    def get_scene_impact(
+        self, zone_id: int, group_id: int
+    ) -> list["DigitalstromDevice"]:
+        # Devices whose outputs change when a scene is called for a zone and
+        # group, zone 0 and group 0 match all zones and groups
+        if zone_id != 0 and group_id != 0:
+            return list(self.output_devices.get((zone_id, group_id), []))
+        affected_devices = []
+        for (device_zone_id, device_group_id), devices in self.output_devices.items():
+            if zone_id in [0, device_zone_id] and group_id in [0, device_group_id]:
+                affected_devices.extend(devices)
+        return affected_devices
+
+    async def update_missing_scene_values(self) -> bool:
+        # Read the stored output values of called scenes that are not known or
+        # outdated, returns True if any values were read
+        semaphore = asyncio.Semaphore(SCENE_VALUE_CONCURRENCY)
+        updated = False
+
+        async def get_device_scene_value(dsuid: str, scene: int) -> None:
+            nonlocal updated
+            if (device := self.devices.get(dsuid)) is None:
+                return
+            async with semaphore:
+                try:
+                    await device.get_scene_values(scene)
+                    updated = True
+                except (CannotConnect, ServerError) as ex:
+                    self.logger.debug(
+                        f"Reading value of scene {scene} of {dsuid} failed: {ex}"
+                    )
+
+        missing_scene_values = sorted(self.missing_scene_values)
+        self.missing_scene_values.clear()
+        await asyncio.gather(
+            *(
+                get_device_scene_value(dsuid, scene)
+                for dsuid, scene in missing_scene_values
+            )
+        )
+        return updated
+
+    def export_scene_values(self) -> dict:
+        # Outdated values are left out and read again after a restart
+        data = {}
+        for device in self.devices.values():
+            if scene_values := {
+                str(scene): list(values)
+                for scene, values in device.scene_values.items()
+                if scene not in device.stale_scene_values
+            }:
+                data[device.dsuid] = scene_values
+        return data
+
+    def load_scene_values(self, data: dict) -> None:
+        # Restore scene values saved with export_scene_values
+        for dsuid, scene_values in data.items():
+            if (device := self.devices.get(dsuid)) is None:
+                continue
+            for scene, values in scene_values.items():
+                # Values of devices whose outputs changed are read again
+                if len(values) == len(device.output_channels):
+                    device.scene_values[int(scene)] = tuple(values)
+
+    def register_scene_impact_callback(
+        self, callback: Callable[[list["DigitalstromDevice"]], None]
+    ) -> Callable[[], None]:
+        # Called with the affected devices when a scene was called or undone
+        if callback not in self.scene_impact_callbacks:
+            self.scene_impact_callbacks.append(callback)
+
+        def unregister_scene_impact_callback() -> None:
+            if callback in self.scene_impact_callbacks:
+                self.scene_impact_callbacks.remove(callback)
+
+        return unregister_scene_impact_callback
+
     async def get_circuits(self) -> dict:
         data = await self.client.request("apartment/getCircuits")
         self.logger.debug(f"getCircuits {data}")
         if circuits := data.get("circuits"):
+            present_dsuids = set()
             for d in circuits:
                 if (dsuid := d.get("dSUID")) and (len(dsuid) > 0):
+                    present_dsuids.add(dsuid)
                     if dsuid not in self.circuits.keys():
                         from .circuit import DigitalstromCircuit
 
                         circuit = DigitalstromCircuit(self.client, self, dsuid)
                         self.circuits[dsuid] = circuit
                     self.circuits[dsuid].load_from_dict(d)
+            for dsuid in list(self.circuits.keys()):
+                if dsuid not in present_dsuids:
+                    self.logger.debug(f"Circuit {dsuid} was removed")
+                    self.circuits.pop(dsuid)
         return self.circuits
 
     async def get_zones(self) -> dict:
         data = await self.client.request("apartment/getReachableGroups")
         self.logger.debug(f"getReachableGroups {data}")
+        zones_added = False
         if zones := data.get("zones"):
+            present_zone_ids = set()
             for z in zones:
                 if "zoneID" in z:
                     zone_id = int(z["zoneID"])
+                    present_zone_ids.add(zone_id)
                     if zone_id not in self.zones.keys():
                         from .zone import DigitalstromZone
 
                         zone = DigitalstromZone(self.client, self, zone_id)
                         self.zones[zone_id] = zone
-                    self.zones[zone_id].load_from_dict(z)
-                    await zone.get_scenes()
-        await self.get_zone_climate_data()
+                        zone.load_from_dict(z)
+                        zones_added = True
+                    else:
+                        self.zones[zone_id].load_from_dict(z)
+            for zone_id in list(self.zones.keys()):
+                if zone_id not in present_zone_ids:
+                    self.logger.debug(f"Zone {zone_id} was removed")
+                    self.zones.pop(zone_id)
+        if zones_added:
+            # The control mode tells which zones have temperature control, the
+            # other climate values are read with the apartment status
+            try:
+                await self.get_zone_climate_data()
+            except (CannotConnect, ServerError) as ex:
+                self.logger.debug(f"Reading the zone climate status failed: {ex}")
         return self.zones
 
+    def has_climate_zones(self) -> bool:
+        return any(
+            zone.climate_control_mode not in [None, 0] for zone in self.zones.values()
+        )
+
+    async def get_scenes(self, excluded_groups: list[int] | None = None) -> None:
+        # Read the reachable scenes of every zone and group
+        excluded_groups = excluded_groups or []
+        await self.get_scene_lists(
+            [
+                (zone.zone_id, group_id)
+                for zone in self.zones.values()
+                for group_id in zone.group_ids
+                if group_id not in excluded_groups
+            ]
+        )
+
+    async def get_scene_lists(self, scene_groups: list[tuple[int, int]]) -> None:
+        # Read the reachable scenes of the given zone and group pairs
+        async def get_group_scenes(zone: "DigitalstromZone", group_id: int) -> None:
+            await zone.get_scenes(group_id)
+            self.stale_scene_groups.discard((zone.zone_id, group_id))
+
+        await self.gather_zone_groups(scene_groups, get_group_scenes)
+
+    async def get_last_called_scenes(self) -> None:
+        # Seed the last called scene of every zone and group in a single
+        # query, events keep them up to date afterwards
+        try:
+            data = await self.client.request(
+                f"property/query?query={LAST_CALLED_SCENE_QUERY}"
+            )
+        except ServerError as ex:
+            self.logger.debug(f"Last called scene query failed: {ex}")
+            data = {}
+        except (CannotConnect, InvalidAuth) as ex:
+            # The requests per group would fail as well, events still update
+            # the last called scenes
+            self.logger.debug(f"Last called scene query failed: {ex}")
+            return
+        found = False
+        for zone_data in data.get("zones", []):
+            if (zone := self.zones.get(int(zone_data.get("ZoneID", -1)))) is None:
+                continue
+            for group_data in zone_data.get("groups", []):
+                group_id = int(group_data.get("group", -1))
+                if (
+                    scene_id := group_data.get("lastCalledScene")
+                ) is not None and group_id in zone.group_ids:
+                    zone.update_last_called_scene(group_id, int(scene_id))
+                    found = True
+        if found:
+            return
+        # Older firmware without the property, read every zone and group
+        await self.gather_zone_groups(
+            [
+                (zone.zone_id, group_id)
+                for zone in self.zones.values()
+                for group_id in zone.group_ids
+            ],
+            lambda zone, group_id: zone.get_last_called_scene(group_id),
+        )
+
+    async def gather_zone_groups(
+        self,
+        zone_groups: list[tuple[int, int]],
+        function: Callable[["DigitalstromZone", int], Awaitable[None]],
+    ) -> None:
+        # Run a request for every zone and group pair, a few at a time. A
+        # failed pair is logged and left out.
+        semaphore = asyncio.Semaphore(SCENE_DISCOVERY_CONCURRENCY)
+
+        async def run(zone_id: int, group_id: int) -> None:
+            if (zone := self.zones.get(zone_id)) is None:
+                return
+            async with semaphore:
+                try:
+                    await function(zone, group_id)
+                except (CannotConnect, ServerError) as ex:
+                    self.logger.debug(
+                        f"Request for zone {zone_id} group {group_id} failed: {ex}"
+                    )
+
+        await asyncio.gather(
+            *(run(zone_id, group_id) for zone_id, group_id in zone_groups)
+        )
+
+    def register_scene_catalogue_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        # Called when the dSS reports that the scene configuration changed
+        if callback not in self.scene_catalogue_callbacks:
+            self.scene_catalogue_callbacks.append(callback)
+
+        def unregister_scene_catalogue_callback() -> None:
+            if callback in self.scene_catalogue_callbacks:
+                self.scene_catalogue_callbacks.remove(callback)
+
+        return unregister_scene_catalogue_callback
+
+    async def check_scene_revision(self, excluded_groups: list[int]) -> None:
+        # Compare the cached scene lists with all user scene names read in a
+        # single query and mark the zone and group pairs that differ as stale
+        for zone in self.zones.values():
+            for group_id in zone.group_ids:
+                if group_id not in excluded_groups and group_id not in zone.scene_lists:
+                    self.stale_scene_groups.add((zone.zone_id, group_id))
+        data = await self.client.request(f"property/query?query={SCENE_NAME_QUERY}")
+        for zone_data in data.get("zones", []):
+            if (zone := self.zones.get(int(zone_data.get("ZoneID", -1)))) is None:
+                continue
+            for group_data in zone_data.get("groups", []):
+                group_id = int(group_data.get("group", -1))
+                if group_id in excluded_groups or group_id not in zone.scene_lists:
+                    continue
+                names = {
+                    int(scene["scene"]): scene["name"]
+                    for scene in group_data.get("scenes", [])
+                    if scene.get("name") and "scene" in scene
+                }
+                cached_names = {
+                    int(scene["sceneNr"]): scene.get("sceneName")
+                    for scene in zone.scene_lists[group_id].get("userSceneNames", [])
+                    if "sceneNr" in scene
+                }
+                if names != cached_names:
+                    self.stale_scene_groups.add((zone.zone_id, group_id))
+
+    async def update_stale_scenes(self, excluded_groups: list[int]) -> None:
+        await self.get_scene_lists(
+            [
+                (zone_id, group_id)
+                for zone_id, group_id in sorted(self.stale_scene_groups)
+                if group_id not in excluded_groups
+            ]
+        )
+
+    def export_scene_lists(self) -> dict:
+        return {
+            str(zone.zone_id): {
+                str(group_id): data for group_id, data in zone.scene_lists.items()
+            }
+            for zone in self.zones.values()
+        }
+
+    def load_scene_lists(self, data: dict) -> None:
+        # Restore scene lists saved with export_scene_lists
+        for zone_id, scene_lists in data.items():
+            if (zone := self.zones.get(int(zone_id))) is not None:
+                for group_id, group_data in scene_lists.items():
+                    zone.load_scenes(int(group_id), group_data)
+
     async def get_zone_climate_data(self) -> None:
         data = await self.client.request("apartment/getTemperatureControlStatus")
         if zones := data.get("zones"):
@@ -140,6 +564,63 @@ class DigitalstromApartment:
                     zone_id = int(z["id"])
                     if zone_id in self.zones.keys():
                         self.zones[zone_id].load_climate_data_from_dict(z)
+        self.climate_updated = datetime.now()
+
+    async def get_zone_climate_config(self) -> None:
+        data = await self.client.request("apartment/getTemperatureControlConfig")
+        for z in data.get("zones", []):
+            if "id" in z and (zone := self.zones.get(int(z["id"]))) is not None:
+                zone.load_temperature_control_config(z)
+        self.climate_config_valid = True
+
+    async def update_zone_climate_values(self) -> None:
+        # Nominal temperatures and zone sensor readings of all zones, read with
+        # two bulk requests instead of one request per zone. Zones without
+        # temperature control may still report sensor readings.
+        if self.has_climate_zones():
+            if not self.climate_config_valid:
+                await self.get_zone_climate_config()
+            data = await self.client.request("apartment/getTemperatureControlValues")
+            for z in data.get("zones", []):
+                if "id" in z and (zone := self.zones.get(int(z["id"]))) is not None:
+                    zone.load_temperature_control_values(z)
+        data = await self.client.request("apartment/getSensorValues")
+        for z in data.get("zones", []):
+            if "id" in z and (zone := self.zones.get(int(z["id"]))) is not None:
+                zone.load_sensor_values(z)
+        self.climate_values_updated = datetime.now()
+
+    async def update_device_states(self) -> None:
+        # Refresh sensor values, binary inputs and availability of the known
+        # devices, added or removed devices are left to the topology update
+        data = await self.client.request("apartment/getDevices")
+        data = data.get("result", [])
+        known_devices = 0
+        changed_devices = []
+        for d in data:
+            if (device := self.devices.get(d.get("dSUID"))) is None:
+                continue
+            known_devices += 1
+            if self.decode_known_device(device, d):
+                changed_devices.append(device)
+        self.find_split_devices(changed_devices)
+        self.update_output_devices()
+        if known_devices != len(data) or known_devices != len(self.devices):
+            for callback in self.topology_callbacks:
+                callback()
+
+    async def resync(self, gap: float) -> None:
+        # Read the state that may have changed through events missed while the
+        # event listener was disconnected
+        self.logger.debug(f"Resynchronizing after a {gap:.1f}s event listener gap")
+        await self.update_device_states()
+        self.climate_updated = None
+        self.climate_values_updated = None
+        await self.update_apartment_status()
+        if gap >= LAST_CALLED_SCENE_RESYNC_GAP:
+            await self.get_last_called_scenes()
+        for scene in self.scenes:
+            scene.force_update = True
 
     async def update_apartment_status(self) -> None:
         """Uses the new API to fetch the apartment status"""
@@ -151,7 +632,7 @@ class DigitalstromApartment:
             return
         included = data.get("included", {})
         ds_devices = included.get("dsDevices", [])
-        # zones = included.get("zones", [])
+        zones = included.get("zones", [])
         # clusters = included.get("clusters", [])
         # user_defined_states = included.get("userDefinedStates", [])
         # attributes = data.get("attributes", {})
@@ -162,10 +643,55 @@ class DigitalstromApartment:
             ):
                 if (device := self.devices.get(dsuid)) is not None:
                     device.update_device_status(device_data)
+        climate_zone_ids = set()
+        for zone_data in zones:
+            if (zone_id := zone_data.get("id")) is not None and (
+                zone := self.zones.get(int(zone_id))
+            ):
+                if zone.load_zone_status(zone_data):
+                    climate_zone_ids.add(zone.zone_id)
+        try:
+            await self.update_zone_climate_fallback(climate_zone_ids)
+        except (CannotConnect, ServerError) as ex:
+            # Tried again after the interval, the device states are valid
+            self.logger.debug(f"Reading the zone climate status failed: {ex}")
+            self.climate_updated = datetime.now()
+        if (
+            self.climate_values_updated is None
+            or self.climate_values_updated < datetime.now() - CLIMATE_FALLBACK_INTERVAL
+        ):
+            try:
+                await self.update_zone_climate_values()
+            except (CannotConnect, ServerError) as ex:
+                # Tried again after the interval, the device states are valid
+                self.logger.debug(f"Reading the zone climate values failed: {ex}")
+                self.climate_values_updated = datetime.now()
+
+    async def update_zone_climate_fallback(self, climate_zone_ids: set[int]) -> None:
+        # Read the climate values missing in the apartment status from the
+        # legacy endpoints, one zone at a time or all zones in one request
+        missing_zones = [
+            zone
+            for zone in self.zones.values()
+            if zone.zone_id not in climate_zone_ids
+            and zone.climate_control_mode not in [None, 0]
+        ]
+        if len(missing_zones) == 0:
+            return
+        if (
+            self.climate_updated is not None
+            and self.climate_updated > datetime.now() - CLIMATE_FALLBACK_INTERVAL
+        ):
+            return
+        if len(missing_zones) == 1:
+            await missing_zones[0].get_climate_data()
+            self.climate_updated = datetime.now()
+        else:
+            await self.get_zone_climate_data()
 
     async def event_callback(self, data: dict) -> None:
         if name := data.get("name"):
-            self.logger.debug(f"event {data}")
+            self.logger.debug("event %s", data)
             if name == "deviceSensorValue":
                 dsuid = data["source"]["dsid"]
                 index = int(data["properties"]["sensorIndex"])
@@ -199,16 +725,18 @@ class DigitalstromApartment:
                         device.update_availability(True)
 
             elif name == "DeviceEvent":
-                if (
-                    (action := data["properties"]["action"])
-                    and (dsuid := data["source"].get("dsid"))
-                    and (device := self.devices.get(dsuid))
-                ):
+                action = data["properties"]["action"]
+                device = self.devices.get(data["source"].get("dsid"))
+                if action and device:
                     if action == "ready":
                         device.update_availability(True)
                     if action == "removed":
                         device.update_availability(False)
                         # TODO: clear output channels
+                if (action == "ready" and device is None) or action == "removed":
+                    # A device was added to or removed from the installation
+                    for callback in self.topology_callbacks:
+                        callback()
 
             elif name in ["callScene", "callSceneBus"]:
                 dsuid = data["properties"].get(
@@ -245,6 +773,42 @@ class DigitalstromApartment:
 
             if name in ["callScene", "undoScene"]:
                 scene_id = int(data["properties"].get("sceneID"))
+                source = data["source"]
+                if source.get("isGroup") or source.get("isApartment"):
+                    # Scenes called for zone 0 apply to all zones
+                    zone_id = int(source.get("zoneID", 0))
+                    group_id = int(source.get("groupID", 0))
+                    for zone in self.zones.values():
+                        if zone_id not in [0, zone.zone_id]:
+                            continue
+                        if name == "callScene":
+                            zone.update_last_called_scene(group_id, scene_id)
+                        else:
+                            zone.undo_last_called_scene(group_id, scene_id)
+                    if affected_devices := self.get_scene_impact(zone_id, group_id):
+                        if name == "callScene":
+                            for device in affected_devices:
+                                if (
+                                    not device.apply_scene_values(scene_id)
+                                    or scene_id in device.stale_scene_values
+                                ):
+                                    self.missing_scene_values.add(
+                                        (device.dsuid, scene_id)
+                                    )
+                        for callback in self.scene_impact_callbacks:
+                            callback(affected_devices)
+                if (
+                    name == "callScene"
+                    and data["source"].get("isGroup")
+                    and int(data["source"]["groupID"]) == TEMPERATURE_CONTROL_GROUP
+                    and scene_id in TEMPERATURE_CONTROL_OPERATION_MODES
+                ):
+                    # Temperature control scenes set the operation mode, zone 0
+                    # addresses all zones
+                    zone_id = int(data["source"].get("zoneID", 0))
+                    for zone in self.zones.values():
+                        if zone_id in [0, zone.zone_id]:
+                            zone.update_climate({"climate_operation_mode": scene_id})
                 if scene_id >= 64:
                     for scene in self.scenes:
                         if (
@@ -275,6 +839,41 @@ class DigitalstromApartment:
             #     ):
             #         await device.output_channels_get_values() # TODO
 
+            elif name == "zoneSensorValue":
+                zone_id = int(data["source"].get("zoneID", 0))
+                if (zone := self.zones.get(zone_id)) is not None:
+                    zone.update_climate_sensor(
+                        int(data["properties"]["sensorType"]),
+                        float(data["properties"]["sensorValueFloat"]),
+                    )
+
+            elif name in ["HeatingControllerState", "HeatingControllerValue"]:
+                # The properties use the keys of getTemperatureControlStatus
+                properties = data["properties"]
+                zone_id = properties.get("ZoneID", data["source"].get("zoneID"))
+                if zone_id is not None and (zone := self.zones.get(int(zone_id))):
+                    zone.load_climate_data_from_dict({"id": zone_id, **properties})
+
+            elif name == "HeatingControllerSetup":
+                # Reload the configuration and values with the next status update
+                self.climate_config_valid = False
+                self.climate_values_updated = None
+
+            elif name in ["sceneNameChanged", "ModelChanged"]:
+                # The revision check finds the scene lists affected by a change
+                properties = data.get("properties", {})
+                if "zoneID" in properties and "groupID" in properties:
+                    self.stale_scene_groups.add(
+                        (int(properties["zoneID"]), int(properties["groupID"]))
+                    )
+                if name == "ModelChanged":
+                    # Saved scenes may have changed, the known values are still
+                    # shown but read again when the scene is called next time
+                    for device in self.devices.values():
+                        device.stale_scene_values.update(device.scene_values)
+                for callback in self.scene_catalogue_callbacks:
+                    callback()
+
             elif name == "apartmentProxyStateChanged":
                 self.proxy_state_changed = datetime.now()
                 # TODO: update all output channels
@@ -7,18 +7,23 @@ from .exceptions import ServerError
 
 
 class DigitalstromChannel:
+    __slots__ = ("device", "index", "update_callbacks", "last_value")
+
     def __init__(self, device: DigitalstromDevice, index: int | str):
         self.device = device
         self.index = index
-        self.update_callbacks: list[Callable] = []
+        # Allocated on first registration, most channels never get a callback
+        self.update_callbacks: list[Callable] | None = None
         self.last_value: float | bool | str | None = None
 
     def register_update_callback(self, callback: Callable) -> Callable[[], None]:
+        if self.update_callbacks is None:
+            self.update_callbacks = []
         if callback not in self.update_callbacks:
             self.update_callbacks.append(callback)
 
         def unregister_update_callback() -> None:
-            if callback in self.update_callbacks:
+            if self.update_callbacks is not None and callback in self.update_callbacks:
                 self.update_callbacks.remove(callback)
 
         return unregister_update_callback
@@ -27,11 +32,14 @@ class DigitalstromChannel:
         self, state: float | bool | str | None, extra: int | dict | None = None
     ) -> None:
         self.last_value = state
-        for callback in self.update_callbacks:
-            callback(state, extra)
+        if self.update_callbacks is not None:
+            for callback in self.update_callbacks:
+                callback(state, extra)
 
 
 class DigitalstromSensorChannel(DigitalstromChannel):
+    __slots__ = ("sensor_type", "valid")
+
     def __init__(
         self, device: DigitalstromDevice, index: int, sensor_type: int, valid: bool
     ):
@@ -41,6 +49,8 @@ class DigitalstromSensorChannel(DigitalstromChannel):
 
 
 class DigitalstromBinaryInputChannel(DigitalstromChannel):
+    __slots__ = ("input_type", "inverted")
+
     def __init__(
         self, device: DigitalstromDevice, index: int, input_type: int, inverted: bool
     ):
@@ -50,6 +60,17 @@ class DigitalstromBinaryInputChannel(DigitalstromChannel):
 
 
 class DigitalstromOutputChannel(DigitalstromChannel):
+    __slots__ = (
+        "channel_id",
+        "channel_name",
+        "channel_type",
+        "prepared_value",
+        "target_value",
+        "initial_value",
+        "start_time",
+        "end_time",
+    )
+
     def __init__(
         self,
         device: DigitalstromDevice,
@@ -115,12 +136,16 @@ class DigitalstromOutputChannel(DigitalstromChannel):
 
 
 class DigitalstromButtonChannel(DigitalstromChannel):
+    __slots__ = ("bus_event_received",)
+
     def __init__(self, device: DigitalstromDevice):
         super().__init__(device, 0)
         self.bus_event_received: datetime | None = None
 
 
 class DigitalstromMeterSensorChannel:
+    __slots__ = ("circuit", "index")
+
     def __init__(self, circuit: DigitalstromCircuit, identifier: str):
         self.circuit = circuit
         self.index = identifier
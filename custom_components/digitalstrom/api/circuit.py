@@ -4,6 +4,23 @@ from .exceptions import ServerError
 
 
 class DigitalstromCircuit:
+    __slots__ = (
+        "client",
+        "dsuid",
+        "apartment",
+        "name",
+        "manufacturer",
+        "dsid",
+        "hw_name",
+        "hw_version",
+        "sw_version",
+        "available",
+        "has_metering",
+        "has_metering_producer",
+        "has_blinking",
+        "sensors",
+    )
+
     def __init__(
         self, client: DigitalstromClient, apartment: DigitalstromApartment, dsuid: str
     ):
@@ -1,16 +1,31 @@
 import asyncio
 import binascii
-import json
+import logging
+import random
 import re
 import socket
+import time
 import urllib.parse
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 from typing import Any
 
 import aiohttp
 
-from .const import EVENT_LISTENER_TIMEOUT, SESSION_TOKEN_TIMEOUT, SSL_FINGERPRINT_REGEX
+from .const import (
+    EVENT_LISTENER_CONNECTED,
+    EVENT_LISTENER_CONNECTING,
+    EVENT_LISTENER_DISCONNECTED,
+    EVENT_LISTENER_TIMEOUT,
+    EVENT_LISTENER_WAITING,
+    EVENT_SUBSCRIPTION_ID,
+    RECONNECT_DELAY_MAX,
+    RECONNECT_DELAY_MIN,
+    RECONNECT_DELAY_RESET,
+    SESSION_TOKEN_TIMEOUT,
+    SSL_FINGERPRINT_REGEX,
+    WEBSOCKET_HEARTBEAT,
+)
 from .exceptions import (
     CannotConnect,
     InvalidAuth,
@@ -18,6 +33,8 @@ from .exceptions import (
     InvalidFingerprint,
     ServerError,
 )
+from .json_backend import json_loads as default_json_loads
+from .stats import DigitalstromClientStats
 
 
 class DigitalstromClient:
@@ -27,11 +44,17 @@ class DigitalstromClient:
         port: int,
         ssl: str | bool | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
+        json_loads: Callable[[str | bytes], Any] | None = None,
+        heartbeat: float | None = WEBSOCKET_HEARTBEAT,
     ):
         # ssl:
         #  False -> Ignore server certificate
         #  True, None -> Verify server certificate
         #  str -> Verify server certificate using fingerprint
+        # json_loads:
+        #  None -> Use orjson or ujson if available, json otherwise
+        # heartbeat:
+        #  Websocket ping interval in seconds, None -> rely on EVENT_LISTENER_TIMEOUT
         self.host = host
         self.port = port
         self.ssl: str | bool | aiohttp.Fingerprint | None = None
@@ -41,7 +64,33 @@ class DigitalstromClient:
         self._app_token: str | None = None
         self._session_token: str | None = None
         self._ws: aiohttp.ClientSession | None = None
-        self._event_callbacks: list[Callable[[dict], Awaitable[None]]] = []
+        self._ws_session_token: str | None = None
+        # Callbacks with the event names they handle, None for all events
+        self._event_callbacks: dict[
+            Callable[[dict], Awaitable[None]], frozenset[str] | None
+        ] = {}
+        # Callbacks per event name, events without an entry go to
+        # _all_event_callbacks
+        self._event_dispatch: dict[str, list[Callable[[dict], Awaitable[None]]]] = {}
+        self._all_event_callbacks: list[Callable[[dict], Awaitable[None]]] = []
+        # Event names subscribed for the session token of the event listener
+        self._subscribed_event_names: set[str] = set()
+        self._subscribed_session_token: str | None = None
+        # Subscription updates run one at a time in the background
+        self._subscription_lock = asyncio.Lock()
+        self._subscription_tasks: set[asyncio.Task] = set()
+        self._reconnect_callbacks: list[Callable[[float], Awaitable[None]]] = []
+        # Time the event listener lost its connection, None before the first one
+        self._disconnected_at: float | None = None
+        self.heartbeat = heartbeat
+        self.logger = logging.getLogger("digitalstrom_api")
+        self.reconnect_delay_min = RECONNECT_DELAY_MIN
+        self.reconnect_delay_max = RECONNECT_DELAY_MAX
+        self.event_listener_state = EVENT_LISTENER_DISCONNECTED
+        self._event_listener_state_callbacks: list[Callable[[str], None]] = []
+        self._event_listener_stopped = False
+        self.stats = DigitalstromClientStats()
+        self.json_loads = json_loads or default_json_loads
         if type(ssl) is bool:
             self.ssl = None if ssl else False
         elif type(ssl) is str:
@@ -53,6 +102,16 @@ class DigitalstromClient:
             self.ssl = aiohttp.Fingerprint(binascii.unhexlify(ssl_clean))
 
     async def _request_raw(self, url: str, cookies: dict | None = None) -> dict:
+        start = time.monotonic()
+        try:
+            return await self._request_raw_inner(url, cookies, start)
+        except Exception as e:
+            self.stats.record_error(url, e)
+            raise
+
+    async def _request_raw_inner(
+        self, url: str, cookies: dict | None, start: float
+    ) -> dict:
         if type(self.ssl) is not bool and type(self.ssl) is not aiohttp.Fingerprint:
             raise InvalidFingerprint()
         async with aiohttp.ClientSession(
@@ -68,9 +127,11 @@ class DigitalstromClient:
                         raise ServerError(
                             f"Unexpected status code received: {response.status}"
                         )
+                    body = await response.read()
+                    self.stats.record_request(url, time.monotonic() - start, len(body))
                     try:
-                        data = await response.json()
-                    except json.decoder.JSONDecodeError as e:
+                        data = self.json_loads(body)
+                    except ValueError as e:
                         raise ServerError(f"Failed to decode JSON: {e}") from None
                     if (is_ok := data.get("ok")) and is_ok:
                         if result := data.get("result"):
@@ -98,6 +159,16 @@ class DigitalstromClient:
                 raise CannotConnect(e) from None
 
     async def _request_raw_new(self, url: str, cookies: dict | None = None) -> dict:
+        start = time.monotonic()
+        try:
+            return await self._request_raw_new_inner(url, cookies, start)
+        except Exception as e:
+            self.stats.record_error(url, e)
+            raise
+
+    async def _request_raw_new_inner(
+        self, url: str, cookies: dict | None, start: float
+    ) -> dict:
         if type(self.ssl) is not bool and type(self.ssl) is not aiohttp.Fingerprint:
             raise InvalidFingerprint()
         async with aiohttp.ClientSession(
@@ -113,12 +184,14 @@ class DigitalstromClient:
                         raise ServerError(
                             f"Unexpected status code received: {response.status}"
                         )
+                    body = await response.read()
+                    self.stats.record_request(url, time.monotonic() - start, len(body))
                     try:
-                        data = await response.json()
+                        data = self.json_loads(body)
                         if type(data) is dict:
                             return data
                         return {"result": data}
-                    except json.decoder.JSONDecodeError as e:
+                    except ValueError as e:
                         raise ServerError(f"Failed to decode JSON: {e}") from None
             except aiohttp.client_exceptions.ServerFingerprintMismatch as e:
                 raise InvalidCertificate(e) from None
@@ -131,6 +204,7 @@ class DigitalstromClient:
         data = await self._request_raw(
             f"system/loginApplication?loginToken={self._app_token}"
         )
+        self.stats.token_renewals += 1
         return str(data["token"])
 
     async def request_app_token(
@@ -197,17 +271,185 @@ class DigitalstromClient:
         return data
 
     def register_event_callback(
-        self, callback: Callable[[dict], Awaitable[None]]
+        self,
+        callback: Callable[[dict], Awaitable[None]],
+        event_names: Iterable[str] | None = None,
     ) -> None:
         # Register an event callback
-        self._event_callbacks.append(callback)
+        # event_names limits the callback to these events, None for all events
+        # the event listener is subscribed to
+        self._event_callbacks[callback] = (
+            None if event_names is None else frozenset(event_names)
+        )
+        self._event_callbacks_changed()
 
     def unregister_event_callback(
         self, callback: Callable[[dict], Awaitable[None]]
     ) -> None:
         # Unregister an event callback
         if callback in self._event_callbacks:
-            self._event_callbacks.remove(callback)
+            del self._event_callbacks[callback]
+            self._event_callbacks_changed()
+
+    def register_reconnect_callback(
+        self, callback: Callable[[float], Awaitable[None]]
+    ) -> Callable[[], None]:
+        # Called with the length of the gap in seconds after the event listener
+        # reconnected, used to read the state that may have changed meanwhile
+        if callback not in self._reconnect_callbacks:
+            self._reconnect_callbacks.append(callback)
+
+        def unregister_reconnect_callback() -> None:
+            if callback in self._reconnect_callbacks:
+                self._reconnect_callbacks.remove(callback)
+
+        return unregister_reconnect_callback
+
+    async def _resync_after_reconnect(self) -> None:
+        if self._disconnected_at is None:
+            return
+        gap = time.monotonic() - self._disconnected_at
+        self._disconnected_at = None
+        start = time.monotonic()
+        request_count = self.stats.request_count
+        failed = False
+        for callback in list(self._reconnect_callbacks):
+            try:
+                await callback(gap)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                # A failed resync must not prevent receiving events
+                self.logger.debug(f"Resync after reconnect failed: {ex!r}")
+                failed = True
+        self.stats.record_resync(
+            gap,
+            time.monotonic() - start,
+            self.stats.request_count - request_count,
+            failed,
+        )
+
+    def wanted_event_names(self) -> set[str]:
+        # Event names needed by the registered callbacks
+        event_names: set[str] = set()
+        for callback_event_names in self._event_callbacks.values():
+            if callback_event_names is not None:
+                event_names.update(callback_event_names)
+        return event_names
+
+    def _event_callbacks_changed(self) -> None:
+        all_event_names = self.wanted_event_names()
+        self._event_dispatch = {
+            name: [
+                callback
+                for callback, event_names in self._event_callbacks.items()
+                if event_names is None or name in event_names
+            ]
+            for name in all_event_names
+        }
+        self._all_event_callbacks = [
+            callback
+            for callback, event_names in self._event_callbacks.items()
+            if event_names is None
+        ]
+        if self._ws_session_token is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self._update_event_subscriptions_or_reconnect())
+            self._subscription_tasks.add(task)
+            task.add_done_callback(self._subscription_tasks.discard)
+
+    async def _update_event_subscriptions_or_reconnect(self) -> None:
+        session_token = self._ws_session_token
+        try:
+            await self.update_event_subscriptions()
+        except (CannotConnect, InvalidAuth, ServerError) as ex:
+            # The dSS only sends subscribed events, reconnect to subscribe
+            # again and read the state that changed meanwhile
+            if session_token is not None and session_token == self._ws_session_token:
+                self.logger.debug(f"Event subscription failed, reconnecting: {ex}")
+                await self._close_event_listener()
+
+    async def update_event_subscriptions(self) -> None:
+        # Subscribe the event listener session to the wanted events only
+        # Updates run one at a time so the subscribed names stay in sync with
+        # the dSS, errors are raised to the caller
+        async with self._subscription_lock:
+            if (session_token := self._ws_session_token) is None:
+                return
+            if session_token != self._subscribed_session_token:
+                # Subscriptions belong to the session token of a connection
+                self._subscribed_session_token = session_token
+                self._subscribed_event_names = set()
+            wanted_event_names = self.wanted_event_names()
+            cookies = dict(token=session_token)
+            for name in sorted(self._subscribed_event_names - wanted_event_names):
+                if session_token != self._ws_session_token:
+                    return
+                await self._request_raw(
+                    f"event/unsubscribe?name={name}&subscriptionID={EVENT_SUBSCRIPTION_ID}",
+                    cookies,
+                )
+                self._subscribed_event_names.discard(name)
+            for name in sorted(wanted_event_names - self._subscribed_event_names):
+                if session_token != self._ws_session_token:
+                    return
+                await self._request_raw(
+                    f"event/subscribe?name={name}&subscriptionID={EVENT_SUBSCRIPTION_ID}",
+                    cookies,
+                )
+                self._subscribed_event_names.add(name)
+
+    def register_event_listener_state_callback(
+        self, callback: Callable[[str], None]
+    ) -> Callable[[], None]:
+        if callback not in self._event_listener_state_callbacks:
+            self._event_listener_state_callbacks.append(callback)
+
+        def unregister_event_listener_state_callback() -> None:
+            if callback in self._event_listener_state_callbacks:
+                self._event_listener_state_callbacks.remove(callback)
+
+        return unregister_event_listener_state_callback
+
+    def _set_event_listener_state(self, state: str) -> None:
+        if state == self.event_listener_state:
+            return
+        self.event_listener_state = state
+        for callback in list(self._event_listener_state_callbacks):
+            callback(state)
+
+    async def run_event_listener(self) -> None:
+        # Keep the event listener connected until stop_event_listener is called
+        # Reconnects use exponential backoff with jitter
+        self._event_listener_stopped = False
+        attempt = 0
+        while not self._event_listener_stopped:
+            start = time.monotonic()
+            connects = self.stats.websocket_connects
+            try:
+                await self.start_event_listener()
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                # Keep retrying whatever failed, like a certificate that is
+                # not valid yet or a timeout
+                self.logger.debug(f"Event listener failed: {ex!r}")
+            if self._event_listener_stopped:
+                break
+            if (
+                self.stats.websocket_connects > connects
+                and time.monotonic() - start > RECONNECT_DELAY_RESET
+            ):
+                attempt = 0
+            delay = min(
+                self.reconnect_delay_max, self.reconnect_delay_min * 2**attempt
+            )
+            attempt += 1
+            self._set_event_listener_state(EVENT_LISTENER_WAITING)
+            await asyncio.sleep(random.uniform(delay / 2, delay))
 
     async def start_event_listener(self) -> None:
         # Start the event listener
@@ -215,23 +457,37 @@ class DigitalstromClient:
         if type(self.ssl) is not bool and type(self.ssl) is not aiohttp.Fingerprint:
             raise InvalidFingerprint()
         if self._ws is not None:
-            await self.stop_event_listener()
+            await self._close_event_listener()
+        self._set_event_listener_state(EVENT_LISTENER_CONNECTING)
+        session_token = await self.request_session_token()
         self._ws = aiohttp.ClientSession(
             connector=aiohttp.TCPConnector(family=socket.AF_INET, ssl=self.ssl),
-            cookies=dict(token=await self.request_session_token()),
+            cookies=dict(token=session_token),
             loop=self._loop,
         )
+        connected = False
         try:
             async with self._ws.ws_connect(
-                url=f"wss://{self.host}:{self.port}/websocket"
+                url=f"wss://{self.host}:{self.port}/websocket",
+                heartbeat=self.heartbeat,
             ) as ws:
+                connected = True
+                self.stats.websocket_connects += 1
+                self._set_event_listener_state(EVENT_LISTENER_CONNECTED)
+                self._ws_session_token = session_token
+                await self.update_event_subscriptions()
+                # Events received meanwhile are handled after the resync
+                await self._resync_after_reconnect()
                 async for msg in ws:
                     try:
                         if msg.type == aiohttp.WSMsgType.TEXT:
                             self.last_event = datetime.now()
-                            event = json.loads(msg.data)
-                            if event.get("name"):
-                                for callback in self._event_callbacks:
+                            event = self.json_loads(msg.data)
+                            if name := event.get("name"):
+                                self.stats.record_event(name)
+                                for callback in self._event_dispatch.get(
+                                    name, self._all_event_callbacks
+                                ):
                                     await callback(event)
                         elif msg.type == aiohttp.WSMsgType.CLOSED:
                             break
@@ -241,28 +497,37 @@ class DigitalstromClient:
                         pass
         except aiohttp.ClientError as e:
             raise CannotConnect(e) from None
+        finally:
+            if self._ws_session_token is not None and self._disconnected_at is None:
+                self._disconnected_at = time.monotonic()
+            self._ws_session_token = None
+            if connected:
+                # Failed connect attempts are not disconnects
+                self.stats.websocket_disconnects += 1
+            self._set_event_listener_state(EVENT_LISTENER_DISCONNECTED)
 
     async def stop_event_listener(self) -> None:
         # Stop the event listener
+        self._event_listener_stopped = True
+        for task in list(self._subscription_tasks):
+            task.cancel()
+        await self._close_event_listener()
+
+    async def _close_event_listener(self) -> None:
         if self._ws is not None:
             await self._ws.close()
             self._ws = None
 
     def event_listener_connected(self) -> bool:
         # Check if the event listener is connected
+        # Without heartbeat a dead connection is only noticed by missing events
         return (
             (self._ws is not None)
             and (not self._ws.closed)
+            and (self.event_listener_state == EVENT_LISTENER_CONNECTED)
             and (
-                (self.last_event is None)
+                (self.heartbeat is not None)
+                or (self.last_event is None)
                 or (self.last_event > datetime.now() - EVENT_LISTENER_TIMEOUT)
             )
         )
-
-    async def event_listener_watchdog(self, time: Any) -> None:
-        # Restart the event listener if it's not running
-        if not self.event_listener_connected():
-            try:
-                await self.start_event_listener()
-            except CannotConnect:
-                pass
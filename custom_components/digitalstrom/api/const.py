@@ -3,7 +3,83 @@ from datetime import timedelta
 SSL_FINGERPRINT_REGEX = r"[^0-9a-fA-F]|0[xX]"
 SESSION_TOKEN_TIMEOUT = timedelta(seconds=50)
 EVENT_LISTENER_TIMEOUT = timedelta(seconds=120)
+# Websocket ping interval in seconds, the connection is closed if no pong is
+# received within half of the interval
+WEBSOCKET_HEARTBEAT = 5
+# Reconnect delay limits in seconds, the delay doubles after every failed
+# attempt and is reset once a connection stayed up for RECONNECT_DELAY_RESET
+RECONNECT_DELAY_MIN = 1
+RECONNECT_DELAY_MAX = 300
+RECONNECT_DELAY_RESET = 60
+EVENT_LISTENER_DISCONNECTED = "disconnected"
+EVENT_LISTENER_CONNECTING = "connecting"
+EVENT_LISTENER_CONNECTED = "connected"
+EVENT_LISTENER_WAITING = "waiting"
+EVENT_LISTENER_STATES = [
+    EVENT_LISTENER_DISCONNECTED,
+    EVENT_LISTENER_CONNECTING,
+    EVENT_LISTENER_CONNECTED,
+    EVENT_LISTENER_WAITING,
+]
 BUTTON_BUS_EVENT_TIMEOUT = timedelta(seconds=10)
+# Number of getReachableScenes requests sent at the same time
+SCENE_DISCOVERY_CONCURRENCY = 4
+# Number of scene value requests sent at the same time, an apartment scene
+# may need a request for every output device
+SCENE_VALUE_CONCURRENCY = 2
+# Property query returning the user scene names of all zones and groups
+SCENE_NAME_QUERY = "/apartment/zones/*(ZoneID)/groups/*(group)/scenes/*(scene,name)"
+# Property query returning the last called scene of all zones and groups
+LAST_CALLED_SCENE_QUERY = "/apartment/zones/*(ZoneID)/groups/*(group,lastCalledScene)"
+# Event listener gap in seconds after which the last called scenes are read
+# again, scene calls are rarely missed during a quick reconnect
+LAST_CALLED_SCENE_RESYNC_GAP = 10
+# Group used for the temperature control scenes, the scene number is the new
+# operation mode of the zone
+TEMPERATURE_CONTROL_GROUP = 48
+TEMPERATURE_CONTROL_OPERATION_MODES = range(16)
+# Zone sensor types reported by zoneSensorValue events and the zone attribute
+# they update
+ZONE_CLIMATE_SENSOR_TYPES = {
+    9: "current_temperature",
+    50: "target_temperature",
+    51: "control_value",
+}
+# Climate values in the temperatureControl object of the zones included in the
+# apartment status and the zone attribute they update
+ZONE_STATUS_CLIMATE_ATTRIBUTES = {
+    "controlMode": ("climate_control_mode", int),
+    "controlState": ("climate_control_state", int),
+    "operationMode": ("climate_operation_mode", int),
+    "temperatureValue": ("current_temperature", float),
+    "nominalValue": ("target_temperature", float),
+    "controlValue": ("control_value", float),
+}
+# Nominal temperatures in getTemperatureControlValues, the position in the list
+# is the operation mode they belong to
+TEMPERATURE_CONTROL_NOMINAL_VALUES = [
+    "Off",
+    "Comfort",
+    "Economy",
+    "NotUsed",
+    "Night",
+    "Holiday",
+    "Cooling",
+    "CoolingOff",
+]
+# Zone sensor readings in getSensorValues
+ZONE_SENSOR_VALUES = [
+    "TemperatureValue",
+    "HumidityValue",
+    "CO2concentrationValue",
+    "BrightnessValue",
+]
+# Zones without climate values in the apartment status, the nominal values and
+# the zone sensor readings are read at most this often, events keep them up to
+# date in between
+CLIMATE_FALLBACK_INTERVAL = timedelta(minutes=10)
+# Subscription used to limit the websocket events to the ones that are handled
+EVENT_SUBSCRIPTION_ID = 7531
 INVERTED_BINARY_INPUTS = {
     "EnOcean single contact (D5-00-01)": "always_invert",
     "IC Alarm 400 Modul": "always_invert",
@@ -23,3 +99,7 @@ SUPPORTED_OUTPUT_CHANNELS = [
     "shadeOpeningAngleIndoor",
     "powerLevel",
 ]
+# Upper bounds of the request latency histogram buckets in milliseconds
+LATENCY_HISTOGRAM_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+# Sliding window in seconds used to calculate the websocket event rate
+STATS_EVENT_RATE_WINDOW = 60
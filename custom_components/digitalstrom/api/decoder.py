@@ -0,0 +1,117 @@
+import re
+from functools import lru_cache
+
+from .channel import (
+    DigitalstromBinaryInputChannel,
+    DigitalstromButtonChannel,
+    DigitalstromOutputChannel,
+    DigitalstromSensorChannel,
+)
+from .const import INVERTED_BINARY_INPUTS, NOT_DIMMABLE_OUTPUT_MODES
+from .device import DigitalstromDevice
+
+OEM_PRODUCT_URL_REGEX = re.compile(r"https?://(www\.)?(?P<domain>[a-zA-Z0-9-.]+)")
+UNUSED_BUTTON_USAGES = ("auto_unused", "manual_unused")
+
+
+@lru_cache(maxsize=256)
+def get_manufacturer(oem_product_url: str) -> str:
+    # Most devices of an installation share a handful of product URLs
+    if (match := OEM_PRODUCT_URL_REGEX.match(oem_product_url)) and (
+        domain := match.group("domain")
+    ):
+        return domain
+    return oem_product_url
+
+
+def decode_device(device: DigitalstromDevice, data: dict) -> None:
+    # Load one entry of the apartment/getDevices response into a device
+    get = data.get
+    if get("dSUID") != device.dsuid:
+        return
+    info_key = device.info_key()
+
+    if dsid := get("id"):
+        device.dsid = dsid
+    if (name := get("name")) is not None:
+        if name:
+            device.name = name
+        if not device.unique_device_names:
+            device.unique_device_names.append(device.name)
+    if hw_info := get("hwInfo"):
+        device.hw_info = hw_info
+    if oem_product_url := get("OemProductURL"):
+        device.oem_product_url = oem_product_url
+        device.manufacturer = get_manufacturer(oem_product_url)
+    if zone_id := get("zoneID"):
+        device.zone_id = int(zone_id)
+    if meter_dsuid := get("meterDSUID"):
+        device.meter_dsuid = meter_dsuid
+    if "dSUIDIndex" in data:
+        device.dsuid_index = data["dSUIDIndex"]
+    if "OemPartNumber" in data:
+        device.oem_part_number = data["OemPartNumber"]
+
+    if button_usage := get("buttonUsage"):
+        if button_usage == "used":
+            device.button_used = True
+        elif button_usage in UNUSED_BUTTON_USAGES:
+            device.button_used = False
+        else:
+            device.button_used = None
+        if device.button_used is not None and device.button is None:
+            device.button = DigitalstromButtonChannel(device)
+    if button_group := get("buttonGroupMembership"):
+        device.button_group = int(button_group)
+
+    if sensors := get("sensors"):
+        device_sensors = device.sensors
+        for index, sensor_data in enumerate(sensors):
+            valid = bool(sensor_data.get("valid"))
+            value = sensor_data.get("value") if valid else None
+            if (sensor := device_sensors.get(index)) is None:
+                sensor = DigitalstromSensorChannel(
+                    device, index, sensor_data.get("type"), valid
+                )
+                device_sensors[index] = sensor
+            sensor.update(value, valid)
+
+    if binary_inputs := get("binaryInputs"):
+        device_binary_inputs = device.binary_inputs
+        for index, input_data in enumerate(binary_inputs):
+            raw_state = input_data.get("state")
+            if (binary_input := device_binary_inputs.get(index)) is None:
+                invert_mode = INVERTED_BINARY_INPUTS.get(device.hw_info, "default")
+                if invert_mode == "always_invert":
+                    inverted = True
+                elif invert_mode == "never_invert":
+                    inverted = False
+                else:
+                    inverted = get("AKMInputProperty") == "inverted"
+                binary_input = DigitalstromBinaryInputChannel(
+                    device, index, input_data.get("inputType"), inverted
+                )
+                device_binary_inputs[index] = binary_input
+            binary_input.update(raw_state == 1, raw_state)
+
+    if (output_mode := get("outputMode")) is not None:
+        device.output_dimmable = output_mode not in NOT_DIMMABLE_OUTPUT_MODES
+        if output_mode > 0 and (output_channels := get("outputChannels")):
+            device_output_channels = device.output_channels
+            for channel_data in output_channels:
+                index = channel_data["channelIndex"]
+                if index not in device_output_channels:
+                    device_output_channels[index] = DigitalstromOutputChannel(
+                        device,
+                        index,
+                        channel_data["channelId"],
+                        channel_data["channelName"],
+                        channel_data["channelType"],
+                    )
+
+    if device.info_key() != info_key:
+        device.invalidate_info()
+        if device.parent_device is not None:
+            device.parent_device.update_unique_device_names()
+    if "isPresent" in data and device.parent_device is None:
+        device.update_availability(data["isPresent"])
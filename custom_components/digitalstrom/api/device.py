@@ -1,19 +1,47 @@
-import re
 from collections.abc import Callable
 from datetime import datetime
 from typing import Self
 
 from .apartment import DigitalstromApartment
 from .client import DigitalstromClient
-from .const import (
-    INVERTED_BINARY_INPUTS,
-    NOT_DIMMABLE_OUTPUT_MODES,
-    SUPPORTED_OUTPUT_CHANNELS,
-)
+from .const import SUPPORTED_OUTPUT_CHANNELS
 from .exceptions import ServerError
 
 
 class DigitalstromDevice:
+    __slots__ = (
+        "client",
+        "apartment",
+        "dsuid",
+        "dsuid_int",
+        "dsid",
+        "name",
+        "hw_info",
+        "oem_product_url",
+        "manufacturer",
+        "zone_id",
+        "button_used",
+        "button_group",
+        "output_dimmable",
+        "sensors",
+        "binary_inputs",
+        "output_channels",
+        "button",
+        "meter_dsuid",
+        "dsuid_index",
+        "oem_part_number",
+        "parent_device",
+        "child_devices",
+        "info_version",
+        "available",
+        "availability_callbacks",
+        "reading_power_state_supported",
+        "unique_device_names",
+        "output_channel_log_count",
+        "scene_values",
+        "stale_scene_values",
+    )
+
     def __init__(
         self, client: DigitalstromClient, apartment: DigitalstromApartment, dsuid: str
     ):
@@ -27,6 +55,10 @@ class DigitalstromDevice:
         self.client = client
         self.apartment = apartment
         self.dsuid = dsuid
+        # Parsed once for sorting and the split device detection. Those compare
+        # whole dSUIDs numerically, the serial and subdevice parts are not read
+        # separately anywhere, so they are not cached.
+        self.dsuid_int = int(dsuid, 16)
         self.dsid = ""
         self.name = ""
         self.hw_info = ""
@@ -44,46 +76,107 @@ class DigitalstromDevice:
         self.dsuid_index: int | None = None
         self.oem_part_number: int | None = None
         self.parent_device: Self | None = None
+        self.child_devices: list[Self] = []
+        # Incremented whenever data shown in the device info changes
+        self.info_version = 0
         self.available = False
-        self.availability_callbacks: list[Callable] = []
+        self.availability_callbacks: list[Callable] | None = None
         self.reading_power_state_supported: bool | None = None
         self.unique_device_names: list[str] = []
         self.output_channel_log_count = 0
+        # Output values stored per scene, in the order of output_channels
+        self.scene_values: dict[int, tuple[float | None, ...]] = {}
+        self.stale_scene_values: set[int] = set()
 
     def get_parent(self) -> Self:
-        if self.parent_device is not None and self.parent_device != self:
-            return self.parent_device.get_parent()
+        # parent_device always points to the first dSUID of a split device
+        if self.parent_device is not None:
+            return self.parent_device
         return self
 
+    def set_parent_device(self, parent_device: Self | None) -> None:
+        if parent_device is self:
+            parent_device = None
+        if parent_device is self.parent_device:
+            return
+        if (old_parent_device := self.parent_device) is not None:
+            old_parent_device.child_devices.remove(self)
+            old_parent_device.update_unique_device_names()
+        self.parent_device = parent_device
+        if parent_device is not None:
+            parent_device.child_devices.append(self)
+            parent_device.update_unique_device_names()
+            # Availability is owned by the parent device
+            if self.available != parent_device.available:
+                self.available = parent_device.available
+                if self.availability_callbacks is not None:
+                    for callback in self.availability_callbacks:
+                        callback(self.available)
+        self.invalidate_info()
+
+    def update_unique_device_names(self) -> None:
+        unique_device_names = [self.name]
+        for child_device in self.child_devices:
+            if child_device.name not in unique_device_names:
+                unique_device_names.append(child_device.name)
+        if unique_device_names != self.unique_device_names:
+            self.unique_device_names = unique_device_names
+            self.invalidate_info()
+
+    def invalidate_info(self) -> None:
+        # Entities of all dSUIDs of a split device show the parent's info
+        self.info_version += 1
+        for child_device in self.child_devices:
+            child_device.info_version += 1
+
+    def info_key(self) -> tuple:
+        return (
+            self.name,
+            self.hw_info,
+            self.manufacturer,
+            self.zone_id,
+            self.meter_dsuid,
+        )
+
+    def split_key(self) -> tuple:
+        # Attributes used to detect devices with multiple dSUIDs
+        return (self.meter_dsuid, self.dsuid_index, self.oem_part_number)
+
     def update_availability(self, available: bool) -> None:
-        parent = self.get_parent()
-        if parent != self:
-            parent.update_availability(available)
+        # All dSUIDs of a split device share the availability of the parent,
+        # so an unchanged value can be detected without looking at the parent
+        if self.available == available:
             return
-        if not self.available == available:
-            self.available = available
-            for callback in self.availability_callbacks:
-                callback(available)
+        parent = self.get_parent()
+        callbacks = []
+        for device in [parent, *parent.child_devices]:
+            device.available = available
+            if device.availability_callbacks is not None:
+                callbacks.extend(device.availability_callbacks)
+        for callback in callbacks:
+            callback(available)
 
     def register_availability_callback(
         self, callback: Callable[[bool], None]
     ) -> Callable[[], None]:
+        if self.availability_callbacks is None:
+            self.availability_callbacks = []
         if callback not in self.availability_callbacks:
             self.availability_callbacks.append(callback)
 
         def unregister_availability_callback() -> None:
-            if callback in self.availability_callbacks:
+            if (
+                self.availability_callbacks is not None
+                and callback in self.availability_callbacks
+            ):
                 self.availability_callbacks.remove(callback)
 
         return unregister_availability_callback
 
     def load_from_dict(self, data: dict) -> None:
-        if (dsuid := data.get("dSUID")) and (dsuid == self.dsuid):
-            self._load_general(data)
-            self._load_button(data)
-            self._load_sensors(data)
-            self._load_binary_inputs(data)
-            self._load_outputs(data)
+        from .decoder import decode_device
+
+        decode_device(self, data)
 
     def output_channels_clear_prepared_values(self) -> None:
         for index in self.output_channels.keys():
@@ -134,6 +227,43 @@ class DigitalstromDevice:
                     output_channel.channel_type, None
                 )
 
+    async def get_scene_values(self, scene: int) -> None:
+        channels = [
+            output_channel.channel_type
+            for output_channel in self.output_channels.values()
+            if output_channel.channel_type in SUPPORTED_OUTPUT_CHANNELS
+        ]
+        result = {}
+        # Devices without supported channels store an empty entry, so that
+        # they are not read again
+        if len(channels) > 0:
+            channel_values_str = ";".join(channels)
+            result = await self.client.request(
+                f"device/getOutputChannelSceneValue2?dsuid={self.dsuid}&sceneNumber={scene}&channels={channel_values_str}"
+            )
+        result_channel_values = {}
+        for channel in result.get("channels", []):
+            if (channel_id := channel.get("channel")) is not None:
+                result_channel_values[channel_id] = channel.get("value")
+        self.scene_values[scene] = tuple(
+            result_channel_values.get(output_channel.channel_type)
+            for output_channel in self.output_channels.values()
+        )
+        self.stale_scene_values.discard(scene)
+
+    def apply_scene_values(self, scene: int) -> bool:
+        # Show the values stored for a called scene until the next status
+        # update, returns False if they are not known
+        if (scene_values := self.scene_values.get(scene)) is None:
+            return False
+        for output_channel, value in zip(self.output_channels.values(), scene_values):
+            if value is not None:
+                output_channel.target_value = value
+                output_channel.initial_value = None
+                output_channel.start_time = None
+                output_channel.end_time = None
+        return True
+
     async def get_power_state(self) -> float | None:
         if self.reading_power_state_supported == False:
             return None
@@ -159,124 +289,6 @@ class DigitalstromDevice:
             f"device/undoScene?dsuid={self.dsuid}&sceneNumber={scene}"
         )
 
-    def _load_general(self, data: dict) -> None:
-        if (dsid := data.get("id")) and (len(dsid) > 0):
-            self.dsid = dsid
-        if (name := data.get("name")) is not None:
-            if len(name) > 0:
-                self.name = name
-            if len(self.unique_device_names) == 0:
-                self.unique_device_names.append(self.name)
-        if (hw_info := data.get("hwInfo")) and (len(hw_info) > 0):
-            self.hw_info = hw_info
-
-        if (oem_product_url := data.get("OemProductURL")) and (
-            len(oem_product_url)
-        ) > 0:
-            self.oem_product_url = oem_product_url
-            match = re.match(
-                r"https?://(www\.)?(?P<domain>[a-zA-Z0-9-.]+)", oem_product_url
-            )
-            if (
-                match
-                and (domain := match.groupdict().get("domain"))
-                and len(domain) > 0
-            ):
-                self.manufacturer = domain
-            else:
-                self.manufacturer = oem_product_url
-
-        if zone_id := data.get("zoneID"):
-            self.zone_id = int(zone_id)
-
-        if meter_dsuid := data.get("meterDSUID"):
-            self.meter_dsuid = meter_dsuid
-
-        if "dSUIDIndex" in data.keys():
-            self.dsuid_index = data["dSUIDIndex"]
-
-        if "OemPartNumber" in data.keys():
-            self.oem_part_number = data["OemPartNumber"]
-
-        if "isPresent" in data.keys():
-            self.available = data["isPresent"]
-
-    def _load_button(self, data: dict) -> None:
-        if button_usage := data.get("buttonUsage"):
-            from .channel import DigitalstromButtonChannel
-
-            if button_usage == "used":
-                self.button_used = True
-                self.button = DigitalstromButtonChannel(self)
-            elif button_usage in ["auto_unused", "manual_unused"]:
-                self.button_used = False
-                self.button = DigitalstromButtonChannel(self)
-            else:
-                self.button_used = None
-        if button_group := data.get("buttonGroupMembership"):
-            self.button_group = int(button_group)
-
-    def _load_sensors(self, data: dict) -> None:
-        if sensors := data.get("sensors"):
-            for index in range(len(sensors)):
-                sensor_dict = sensors[index]
-                sensor_type = sensor_dict.get("type")
-                valid = bool(sensor_dict.get("valid"))
-                value = sensor_dict.get("value")
-                if not valid:
-                    value = None
-                if sensor := self.sensors.get(index):
-                    sensor.update(value, valid)
-                else:
-                    from .channel import DigitalstromSensorChannel
-
-                    sensor = DigitalstromSensorChannel(self, index, sensor_type, valid)
-                    sensor.update(value, valid)
-                    self.sensors[index] = sensor
-
-    def _load_binary_inputs(self, data: dict) -> None:
-        if binary_inputs := data.get("binaryInputs"):
-            inverted = data.get("AKMInputProperty") == "inverted"
-            invert_mode = INVERTED_BINARY_INPUTS.get(self.hw_info, "default")
-            if invert_mode == "always_invert":
-                inverted = True
-            elif invert_mode == "never_invert":
-                inverted = False
-            for index in range(len(binary_inputs)):
-                input_dict = binary_inputs[index]
-                group = input_dict.get("targetGroup")
-                input_type = input_dict.get("inputType")
-                input_id = input_dict.get("inputId")
-                raw_state = input_dict.get("state")
-                state = raw_state == 1
-                if binary_input := self.binary_inputs.get(index):
-                    binary_input.update(state, raw_state)
-                else:
-                    from .channel import DigitalstromBinaryInputChannel
-
-                    binary_input = DigitalstromBinaryInputChannel(
-                        self, index, input_type, inverted
-                    )
-                    binary_input.update(state, raw_state)
-                    self.binary_inputs[index] = binary_input
-
-    def _load_outputs(self, data: dict) -> None:
-        output_mode = data.get("outputMode")
-        if output_mode is not None:
-            self.output_dimmable = output_mode not in NOT_DIMMABLE_OUTPUT_MODES
-            if output_mode > 0 and (output_channels := data.get("outputChannels")):
-                for output_channel in output_channels:
-                    index = output_channel["channelIndex"]
-                    if index not in self.output_channels.keys():
-                        channel_id = output_channel["channelId"]
-                        channel_name = output_channel["channelName"]
-                        channel_type = output_channel["channelType"]
-                        from .channel import DigitalstromOutputChannel
-
-                        self.output_channels[index] = DigitalstromOutputChannel(
-                            self, index, channel_id, channel_name, channel_type
-                        )
-
     def update_device_status(self, data: dict) -> None:
         """Updates the status of outputs (brightness, ...) using data from the new API"""
         if data.get("type") != "dsDeviceStatus":
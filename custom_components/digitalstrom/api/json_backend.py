@@ -0,0 +1,20 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson is shipped with Home Assistant, ujson and the standard library are
+# only used when it is not available
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+    json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        JSON_BACKEND = "ujson"
+        json_loads = ujson.loads
+    except ImportError:
+        JSON_BACKEND = "json"
+        json_loads = json.loads
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 from typing import override
 
@@ -7,6 +8,8 @@ from .zone import DigitalstromZone
 
 
 class DigitalstromScene:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -74,6 +77,8 @@ class DigitalstromApartmentScene(DigitalstromScene):
 
 
 class DigitalstromZoneScene(DigitalstromScene):
+    __slots__ = ("zone", "name", "number", "group", "update_callbacks")
+
     def __init__(
         self,
         zone: DigitalstromZone,
@@ -85,6 +90,26 @@ class DigitalstromZoneScene(DigitalstromScene):
         self.name = name
         self.number = number
         self.group = group
+        self.update_callbacks: list[Callable[[], None]] = []
+
+    def register_update_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        if callback not in self.update_callbacks:
+            self.update_callbacks.append(callback)
+
+        def unregister_update_callback() -> None:
+            if callback in self.update_callbacks:
+                self.update_callbacks.remove(callback)
+
+        return unregister_update_callback
+
+    def update_name(self, name: str | None) -> None:
+        if name == self.name:
+            return
+        self.name = name
+        for callback in self.update_callbacks:
+            callback()
 
     @override
     async def call(self, force: bool = False) -> None:
@@ -0,0 +1,172 @@
+import time
+from collections import deque
+
+from .const import LATENCY_HISTOGRAM_BUCKETS, STATS_EVENT_RATE_WINDOW
+
+
+class DigitalstromEndpointStats:
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.count = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.total_bytes = 0
+        # One bucket per upper bound in LATENCY_HISTOGRAM_BUCKETS plus overflow
+        self.histogram = [0] * (len(LATENCY_HISTOGRAM_BUCKETS) + 1)
+
+    def record(self, latency: float, size: int) -> None:
+        self.count += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self.total_bytes += size
+        latency_ms = latency * 1000
+        for index, upper_bound in enumerate(LATENCY_HISTOGRAM_BUCKETS):
+            if latency_ms <= upper_bound:
+                self.histogram[index] += 1
+                return
+        self.histogram[-1] += 1
+
+    def as_dict(self) -> dict:
+        labels = [f"<={b}ms" for b in LATENCY_HISTOGRAM_BUCKETS] + [
+            f">{LATENCY_HISTOGRAM_BUCKETS[-1]}ms"
+        ]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "average_latency_ms": (
+                round(self.total_latency / self.count * 1000, 1) if self.count else None
+            ),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "total_bytes": self.total_bytes,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class DigitalstromClientStats:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.endpoints: dict[str, DigitalstromEndpointStats] = {}
+        self.errors: dict[str, int] = {}
+        self.token_renewals = 0
+        self.websocket_connects = 0
+        self.websocket_disconnects = 0
+        self.events_total = 0
+        self.events_by_name: dict[str, int] = {}
+        # Event listener gaps and the resynchronization after reconnecting
+        self.resyncs = 0
+        self.resync_failures = 0
+        self.resync_requests = 0
+        self.last_gap = 0.0
+        self.max_gap = 0.0
+        self.total_gap = 0.0
+        self.last_resync_duration = 0.0
+        self.total_resync_duration = 0.0
+        # (second, count) pairs for the sliding event rate window
+        self._event_seconds: deque[list[int]] = deque()
+
+    @staticmethod
+    def endpoint_name(url: str) -> str:
+        # Strip the query string so requests are grouped per endpoint
+        return url.split("?", 1)[0]
+
+    def _endpoint(self, url: str) -> DigitalstromEndpointStats:
+        name = self.endpoint_name(url)
+        if (endpoint := self.endpoints.get(name)) is None:
+            endpoint = DigitalstromEndpointStats(name)
+            self.endpoints[name] = endpoint
+        return endpoint
+
+    def record_request(self, url: str, latency: float, size: int) -> None:
+        self._endpoint(url).record(latency, size)
+
+    def record_error(self, url: str, error: Exception) -> None:
+        self._endpoint(url).errors += 1
+        error_class = type(error).__name__
+        self.errors[error_class] = self.errors.get(error_class, 0) + 1
+
+    def record_event(self, name: str) -> None:
+        self.events_total += 1
+        self.events_by_name[name] = self.events_by_name.get(name, 0) + 1
+        second = int(time.monotonic())
+        if self._event_seconds and self._event_seconds[-1][0] == second:
+            self._event_seconds[-1][1] += 1
+        else:
+            self._event_seconds.append([second, 1])
+            self._prune_event_seconds(second)
+
+    def record_resync(
+        self, gap: float, duration: float, requests: int, failed: bool
+    ) -> None:
+        self.resyncs += 1
+        if failed:
+            self.resync_failures += 1
+        self.resync_requests += requests
+        self.last_gap = gap
+        self.max_gap = max(self.max_gap, gap)
+        self.total_gap += gap
+        self.last_resync_duration = duration
+        self.total_resync_duration += duration
+
+    def _prune_event_seconds(self, now: int) -> None:
+        while (
+            self._event_seconds
+            and self._event_seconds[0][0] <= now - STATS_EVENT_RATE_WINDOW
+        ):
+            self._event_seconds.popleft()
+
+    @property
+    def events_per_second(self) -> float:
+        self._prune_event_seconds(int(time.monotonic()))
+        return sum(c for _, c in self._event_seconds) / STATS_EVENT_RATE_WINDOW
+
+    @property
+    def websocket_reconnects(self) -> int:
+        return max(self.websocket_connects - 1, 0)
+
+    @property
+    def request_count(self) -> int:
+        return sum(e.count for e in self.endpoints.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def average_latency_ms(self) -> float | None:
+        count = self.request_count
+        if count == 0:
+            return None
+        total = sum(e.total_latency for e in self.endpoints.values())
+        return round(total / count * 1000, 1)
+
+    def as_dict(self) -> dict:
+        return {
+            "uptime_s": round(time.monotonic() - self.started),
+            "request_count": self.request_count,
+            "error_count": self.error_count,
+            "average_latency_ms": self.average_latency_ms,
+            "errors": dict(self.errors),
+            "token_renewals": self.token_renewals,
+            "websocket_connects": self.websocket_connects,
+            "websocket_disconnects": self.websocket_disconnects,
+            "websocket_reconnects": self.websocket_reconnects,
+            "events_total": self.events_total,
+            "events_per_second": round(self.events_per_second, 2),
+            "events_by_name": dict(self.events_by_name),
+            "resync": {
+                "count": self.resyncs,
+                "failures": self.resync_failures,
+                "requests": self.resync_requests,
+                "last_gap_s": round(self.last_gap, 1),
+                "max_gap_s": round(self.max_gap, 1),
+                "total_gap_s": round(self.total_gap, 1),
+                "last_duration_ms": round(self.last_resync_duration * 1000, 1),
+                "total_duration_ms": round(self.total_resync_duration * 1000, 1),
+            },
+            "endpoints": {
+                name: endpoint.as_dict()
+                for name, endpoint in sorted(self.endpoints.items())
+            },
+        }
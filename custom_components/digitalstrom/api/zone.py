@@ -1,8 +1,39 @@
+from collections.abc import Callable
+
 from .apartment import DigitalstromApartment
 from .client import DigitalstromClient
+from .const import (
+    TEMPERATURE_CONTROL_NOMINAL_VALUES,
+    ZONE_CLIMATE_SENSOR_TYPES,
+    ZONE_SENSOR_VALUES,
+    ZONE_STATUS_CLIMATE_ATTRIBUTES,
+)
 
 
 class DigitalstromZone:
+    __slots__ = (
+        "client",
+        "zone_id",
+        "apartment",
+        "name",
+        "group_ids",
+        "scenes",
+        "scene_lists",
+        "last_called_scenes",
+        "previous_scenes",
+        "scene_callbacks",
+        "climate_control_mode",
+        "climate_control_state",
+        "climate_operation_mode",
+        "current_temperature",
+        "target_temperature",
+        "control_value",
+        "nominal_values",
+        "sensor_values",
+        "temperature_control_config",
+        "climate_callbacks",
+    )
+
     def __init__(
         self, client: DigitalstromClient, apartment: DigitalstromApartment, zone_id: int
     ):
@@ -14,12 +45,23 @@ class DigitalstromZone:
         self.name = ""
         self.group_ids: list[int] = []
         self.scenes: dict[str, DigitalstromZoneScene] = {}
+        # getReachableScenes result per group, kept to cache the scene lists
+        self.scene_lists: dict[int, dict] = {}
+        # Last called scene per group, kept up to date by callScene events
+        self.last_called_scenes: dict[int, int] = {}
+        self.previous_scenes: dict[int, int] = {}
+        self.scene_callbacks: list[Callable[[int], None]] = []
         self.climate_control_mode: int | None = None
         self.climate_control_state: int | None = None
         self.climate_operation_mode: int | None = None
         self.current_temperature: float | None = None
         self.target_temperature: float | None = None
         self.control_value: float | None = None
+        # Nominal temperature per operation mode and zone sensor readings
+        self.nominal_values: dict[str, float] = {}
+        self.sensor_values: dict[str, float] = {}
+        self.temperature_control_config: dict | None = None
+        self.climate_callbacks: list[Callable[[], None]] = []
 
     async def call_scene(
         self, scene: int, group_id: int | None = None, force: bool = False
@@ -50,48 +92,172 @@ class DigitalstromZone:
             zone_id = int(data["zoneID"])
             if zone_id == self.zone_id:
                 if (name := data.get("name")) and (len(name) > 0):
-                    self.name = name
+                    if name != self.name:
+                        self.name = name
+                        # The zone name is the suggested area of its devices
+                        for device in self.apartment.devices.values():
+                            if device.zone_id == self.zone_id:
+                                device.invalidate_info()
                 if (group_ids := data.get("groups")) and (len(group_ids) > 0):
                     self.group_ids = group_ids
 
+    def register_climate_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        if callback not in self.climate_callbacks:
+            self.climate_callbacks.append(callback)
+
+        def unregister_climate_callback() -> None:
+            if callback in self.climate_callbacks:
+                self.climate_callbacks.remove(callback)
+
+        return unregister_climate_callback
+
+    def update_climate(self, values: dict[str, int | float | dict]) -> None:
+        # Only notify the callbacks if one of the values actually changed
+        changed = False
+        for attribute, value in values.items():
+            if getattr(self, attribute) != value:
+                setattr(self, attribute, value)
+                changed = True
+        if changed:
+            for callback in self.climate_callbacks:
+                callback()
+
+    def update_climate_sensor(self, sensor_type: int, value: float) -> None:
+        if (attribute := ZONE_CLIMATE_SENSOR_TYPES.get(sensor_type)) is not None:
+            self.update_climate({attribute: value})
+
     def load_climate_data_from_dict(self, data: dict) -> None:
         if "id" in data:
             zone_id = int(data["id"])
             if zone_id == self.zone_id:
+                values: dict[str, int | float] = {}
                 if (control_mode := data.get("ControlMode", None)) is not None:
-                    self.climate_control_mode = int(control_mode)
+                    values["climate_control_mode"] = int(control_mode)
                 if (control_state := data.get("ControlState", None)) is not None:
-                    self.climate_control_state = int(control_state)
+                    values["climate_control_state"] = int(control_state)
                 if (operation_mode := data.get("OperationMode", None)) is not None:
-                    self.climate_operation_mode = int(operation_mode)
+                    values["climate_operation_mode"] = int(operation_mode)
                 if (
                     current_temperature := data.get("TemperatureValue", None)
                 ) is not None:
-                    self.current_temperature = float(current_temperature)
+                    values["current_temperature"] = float(current_temperature)
                 if (target_temperature := data.get("NominalValue", None)) is not None:
-                    self.target_temperature = float(target_temperature)
+                    values["target_temperature"] = float(target_temperature)
                 if (control_value := data.get("ControlValue", None)) is not None:
-                    self.control_value = float(control_value)
+                    values["control_value"] = float(control_value)
+                self.update_climate(values)
+
+    def load_temperature_control_config(self, data: dict) -> None:
+        # Loaded from apartment/getTemperatureControlConfig
+        self.temperature_control_config = data
+        if (control_mode := data.get("ControlMode")) is not None:
+            self.update_climate({"climate_control_mode": int(control_mode)})
+
+    def load_temperature_control_values(self, data: dict) -> None:
+        # Loaded from apartment/getTemperatureControlValues
+        nominal_values = dict(self.nominal_values)
+        for key in TEMPERATURE_CONTROL_NOMINAL_VALUES:
+            if (value := data.get(key)) is not None:
+                nominal_values[key] = float(value)
+        self.update_climate({"nominal_values": nominal_values})
+
+    def load_sensor_values(self, data: dict) -> None:
+        # Loaded from apartment/getSensorValues, every value is a separate dict
+        sensor_values = dict(self.sensor_values)
+        for value_data in data.get("values", []):
+            for key in ZONE_SENSOR_VALUES:
+                if (value := value_data.get(key)) is not None:
+                    sensor_values[key] = float(value)
+        self.update_climate({"sensor_values": sensor_values})
+
+    def load_zone_status(self, data: dict) -> bool:
+        # Load the climate values of a zone included in the apartment status,
+        # returns False if the firmware does not provide them
+        attributes = data.get("attributes", {})
+        if not (temperature_control := attributes.get("temperatureControl")):
+            return False
+        values: dict[str, int | float] = {}
+        for key, (attribute, value_type) in ZONE_STATUS_CLIMATE_ATTRIBUTES.items():
+            if (value := temperature_control.get(key)) is not None:
+                values[attribute] = value_type(value)
+        self.update_climate(values)
+        return True
+
+    async def get_climate_data(self) -> None:
+        data = await self.client.request(
+            f"zone/getTemperatureControlStatus?id={self.zone_id}"
+        )
+        self.load_climate_data_from_dict({**data, "id": self.zone_id})
+
+    def register_scene_callback(
+        self, callback: Callable[[int], None]
+    ) -> Callable[[], None]:
+        # Called with the group id when the last called scene of a group changed
+        if callback not in self.scene_callbacks:
+            self.scene_callbacks.append(callback)
+
+        def unregister_scene_callback() -> None:
+            if callback in self.scene_callbacks:
+                self.scene_callbacks.remove(callback)
+
+        return unregister_scene_callback
+
+    def update_last_called_scene(self, group_id: int, scene_id: int) -> None:
+        if (current := self.last_called_scenes.get(group_id)) == scene_id:
+            return
+        if current is not None:
+            self.previous_scenes[group_id] = current
+        self.last_called_scenes[group_id] = scene_id
+        for callback in self.scene_callbacks:
+            callback(group_id)
+
+    def undo_last_called_scene(self, group_id: int, scene_id: int) -> None:
+        # Undoing the current scene restores the one called before
+        if self.last_called_scenes.get(group_id) != scene_id:
+            return
+        if (previous := self.previous_scenes.pop(group_id, None)) is not None:
+            self.last_called_scenes[group_id] = previous
+        else:
+            self.last_called_scenes.pop(group_id)
+        for callback in self.scene_callbacks:
+            callback(group_id)
+
+    async def get_last_called_scene(self, group_id: int) -> None:
+        result = await self.client.request(
+            f"zone/getLastCalledScene?id={self.zone_id}&groupID={group_id}"
+        )
+        if (scene_id := result.get("scene")) is not None:
+            self.update_last_called_scene(group_id, int(scene_id))
+
+    async def get_scenes(self, group_id: int) -> None:
+        result = await self.client.request(
+            f"zone/getReachableScenes?id={self.zone_id}&groupID={group_id}"
+        )
+        self.load_scenes(group_id, result)
 
-    async def get_scenes(self) -> None:
+    def load_scenes(self, group_id: int, data: dict) -> None:
         from .scene import DigitalstromZoneScene
 
-        for group_id in self.group_ids:
-            result = await self.client.request(
-                f"zone/getReachableScenes?id={self.zone_id}&groupID={group_id}"
-            )
-            reachable_scenes = result.get("reachableScenes", [])
-            named_scenes = result.get("userSceneNames", [])
-            for scene in named_scenes:
-                if number := scene.get("sceneNr"):
-                    identifier = f"{group_id}_{int(number)}"
-                    if identifier not in self.scenes.keys():
-                        self.scenes[identifier] = DigitalstromZoneScene(
-                            self, int(number), group_id, scene.get("sceneName", None)
-                        )
-            for number in reachable_scenes:
-                identifier = f"{group_id}_{int(number)}"
-                if identifier not in self.scenes.keys():
-                    self.scenes[identifier] = DigitalstromZoneScene(
-                        self, int(number), group_id, None
-                    )
+        self.scene_lists[group_id] = data
+        reachable_scenes = data.get("reachableScenes", [])
+        named_scenes = {}
+        for scene in data.get("userSceneNames", []):
+            if (number := scene.get("sceneNr")) is not None:
+                named_scenes[int(number)] = scene.get("sceneName", None)
+        numbers = [*named_scenes, *(int(number) for number in reachable_scenes)]
+        for identifier, zone_scene in list(self.scenes.items()):
+            # Scenes of the group that are no longer reported were removed
+            if zone_scene.group == group_id and zone_scene.number not in numbers:
+                del self.scenes[identifier]
+        for number in numbers:
+            identifier = f"{group_id}_{number}"
+            name = named_scenes.get(number)
+            if (zone_scene := self.scenes.get(identifier)) is None:
+                self.scenes[identifier] = DigitalstromZoneScene(
+                    self, number, group_id, name
+                )
+            else:
+                # Renamed, or the name was removed in the dSS
+                zone_scene.update_name(name)
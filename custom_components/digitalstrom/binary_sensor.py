@@ -7,11 +7,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromBinaryInputChannel
-from .const import DOMAIN
+from .api.device import DigitalstromDevice
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .coordinator import DigitalstromConfigEntry
 from .entity import DigitalstromEntity
 
@@ -179,12 +181,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
-    binary_sensors = []
-    for device in apartment.devices.values():
-        for binary_sensor in device.binary_inputs.values():
-            binary_sensors.append(DigitalstromBinarySensor(binary_sensor))
-    _LOGGER.debug("Adding %i binary sensors", len(binary_sensors))
-    async_add_entities(binary_sensors)
+
+    @callback
+    def async_add_binary_sensors(devices: list[DigitalstromDevice]) -> None:
+        binary_sensors = []
+        for device in devices:
+            for binary_sensor in device.binary_inputs.values():
+                binary_sensors.append(DigitalstromBinarySensor(binary_sensor))
+        _LOGGER.debug("Adding %i binary sensors", len(binary_sensors))
+        async_add_entities(binary_sensors)
+
+    async_add_binary_sensors(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_binary_sensors
+        )
+    )
 
 
 class DigitalstromBinarySensor(BinarySensorEntity, DigitalstromEntity):
@@ -1,9 +1,7 @@
+import asyncio
 import logging
-from datetime import timedelta
 from typing import Any, override
 
-import async_timeout
-
 from homeassistant.components.climate import (
     ATTR_HVAC_MODE,
     PRESET_AWAY,
@@ -17,23 +15,30 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_TENTHS, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api.apartment import DigitalstromApartment
-from .api.exceptions import InvalidAuth
+from .api.const import TEMPERATURE_CONTROL_GROUP
+from .api.exceptions import CannotConnect, InvalidAuth, ServerError
 from .api.zone import DigitalstromZone
-from .const import DOMAIN
-from .coordinator import DigitalstromConfigEntry
+from .const import (
+    CLIMATE_COMMAND_DELAY,
+    DOMAIN,
+    SIGNAL_ZONE_REMOVED,
+    SIGNAL_ZONES_ADDED,
+)
+from .coordinator import DigitalstromApartmentStatusCoordinator, DigitalstromConfigEntry
+from .entity import async_remove_on_signal
 
 _LOGGER = logging.getLogger(__name__)
 
-PARALLEL_UPDATES = 1
+# Service calls wait until their debounced command was sent, calls for other
+# zones must not queue behind them
+PARALLEL_UPDATES = 0
 
 PRESET_OFF = "off"
 PRESET_HOLIDAY = "holiday"
@@ -76,49 +81,37 @@ async def async_setup_entry(
 ) -> None:
     """Set up the climate platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
-    coordinator = DigitalstromClimateCoordinator(hass, apartment)
-    await coordinator.async_config_entry_first_refresh()
-    climate_entities = []
-    for zone in apartment.zones.values():
-        if zone.climate_control_mode == 1:
-            climate_entities.append(DigitalstromClimateEntity(coordinator, zone))
-        elif zone.climate_control_mode != 0 and zone.climate_control_mode is not None:
-            _LOGGER.debug(
-                f"Zone '{zone.name}' has temperature control mode {zone.climate_control_mode}. Only PID mode (1) is supported."
-            )
-    _LOGGER.debug("Adding %i climate entities", len(climate_entities))
-    async_add_entities(climate_entities)
-    if len(climate_entities) == 0:
-        _LOGGER.debug("No climate entities added, shutting down coordinator")
-        await coordinator.async_shutdown()
-
+    coordinator = entry.runtime_data
 
-class DigitalstromClimateCoordinator(DataUpdateCoordinator):
-    """My custom coordinator."""
+    @callback
+    def async_add_climate_entities(zones: list[DigitalstromZone]) -> None:
+        climate_entities = []
+        for zone in zones:
+            if zone.climate_control_mode == 1:
+                climate_entities.append(DigitalstromClimateEntity(coordinator, zone))
+            elif (
+                zone.climate_control_mode != 0
+                and zone.climate_control_mode is not None
+            ):
+                _LOGGER.debug(
+                    f"Zone '{zone.name}' has temperature control mode {zone.climate_control_mode}. Only PID mode (1) is supported."
+                )
+        _LOGGER.debug("Adding %i climate entities", len(climate_entities))
+        async_add_entities(climate_entities)
 
-    def __init__(self, hass: HomeAssistant, apartment: DigitalstromApartment):
-        """Initialize my coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Digitalstrom Climate",
-            update_interval=timedelta(seconds=60),
+    async_add_climate_entities(list(apartment.zones.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ZONES_ADDED.format(entry.entry_id), async_add_climate_entities
         )
-        self.apartment = apartment
-
-    @override
-    async def _async_update_data(self) -> dict[str, Any]:
-        try:
-            async with async_timeout.timeout(10):
-                await self.apartment.get_zone_climate_data()
-        except InvalidAuth as err:
-            raise ConfigEntryAuthFailed from err
-        return {}
+    )
 
 
 class DigitalstromClimateEntity(CoordinatorEntity, ClimateEntity):
     def __init__(
-        self, coordinator: DigitalstromClimateCoordinator, zone: DigitalstromZone
+        self,
+        coordinator: DigitalstromApartmentStatusCoordinator,
+        zone: DigitalstromZone,
     ):
         super().__init__(coordinator)
         self.zone = zone
@@ -145,17 +138,33 @@ class DigitalstromClimateEntity(CoordinatorEntity, ClimateEntity):
             PRESET_PASSIVE_COOLING,
         ]
         self._enable_turn_on_off_backwards_compatibility = False
+        # Requested values that were not yet sent to the dSS, shown optimistically
         self._target_climate_operation_mode: int | None = None
+        self._target_temperature: float | None = None
+        # Incremented with every request, the requested values are only
+        # cleared if no request followed while the command was sent
+        self._command_generation = 0
+        self._command_debouncer: Debouncer | None = None
+        # Resolved once the queued values were sent, awaited by the service
+        # calls of a burst so that they see a failure
+        self._command_result: asyncio.Future[None] | None = None
+
+    @property
+    def operation_mode(self) -> int | None:
+        """Return the requested or else the current operation mode."""
+        if self._target_climate_operation_mode is not None:
+            return self._target_climate_operation_mode
+        return self.zone.climate_operation_mode
 
     @property
     @override
     def hvac_mode(self) -> HVACMode | None:
         """Return current operation ie. heat, cool, idle."""
-        if self.zone.climate_operation_mode in [0, 7, 9]:
+        if self.operation_mode in [0, 7, 9]:
             return HVACMode.OFF
-        if self.zone.climate_operation_mode in [1, 2, 3, 4, 5]:
+        if self.operation_mode in [1, 2, 3, 4, 5]:
             return HVACMode.HEAT
-        if self.zone.climate_operation_mode in [6, 8, 10, 11, 12, 13, 14]:
+        if self.operation_mode in [6, 8, 10, 11, 12, 13, 14]:
             return HVACMode.COOL
         return None
 
@@ -173,7 +182,7 @@ class DigitalstromClimateEntity(CoordinatorEntity, ClimateEntity):
     @override
     def preset_mode(self) -> str | None:
         """Return current preset mode."""
-        return ID_TO_PRESET.get(self.zone.climate_operation_mode, None)
+        return ID_TO_PRESET.get(self.operation_mode, None)
 
     @property
     @override
@@ -185,6 +194,8 @@ class DigitalstromClimateEntity(CoordinatorEntity, ClimateEntity):
     @override
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
+        if self._target_temperature is not None:
+            return self._target_temperature
         return self.zone.target_temperature
 
     def _get_new_climate_operation_mode(
@@ -208,89 +219,153 @@ class DigitalstromClimateEntity(CoordinatorEntity, ClimateEntity):
                 return 6 if old_climate_operation_mode == 7 else 11
         return old_climate_operation_mode
 
-    async def _async_set_climate_operation_mode(
-        self, climate_operation_mode: int | None
+    async def _async_queue_climate_command(
+        self,
+        climate_operation_mode: int | None,
+        target_temperature: float | None = None,
     ) -> None:
-        """Set climate operation mode."""
-        self._target_climate_operation_mode = climate_operation_mode
-        if climate_operation_mode is None:
+        """Show the requested values and send them once the user stopped."""
+        if climate_operation_mode is not None:
+            self._target_climate_operation_mode = climate_operation_mode
+        if target_temperature is not None:
+            self._target_temperature = target_temperature
+        self._command_generation += 1
+        self.async_write_ha_state()
+        if self._command_debouncer is None:
             return
-        await self.zone.call_scene(climate_operation_mode, 48)
-        await self.coordinator.async_request_refresh()
+        if self._command_result is None:
+            self._command_result = self.hass.loop.create_future()
+        command_result = self._command_result
+        await self._command_debouncer.async_call()
+        await command_result
+
+    async def _async_send_climate_command(self) -> None:
+        """Send the queued target temperature and operation mode."""
+        operation_mode = self._target_climate_operation_mode
+        target_temperature = self._target_temperature
+        command_generation = self._command_generation
+        command_result = self._command_result
+        self._command_result = None
+        try:
+            if target_temperature is not None:
+                await self.zone.set_target_temperature(
+                    target_temperature, operation_mode
+                )
+            if (
+                operation_mode is not None
+                and operation_mode != self.zone.climate_operation_mode
+            ):
+                await self.zone.call_scene(operation_mode, TEMPERATURE_CONTROL_GROUP)
+            await self.zone.get_climate_data()
+        except (CannotConnect, InvalidAuth, ServerError) as ex:
+            _LOGGER.debug(f"Climate command for zone {self.zone.zone_id} failed: {ex}")
+        else:
+            if command_result is not None:
+                command_result.set_result(None)
+        finally:
+            # The requested values are no longer shown, unless they were
+            # requested again while the command was sent
+            if self._command_generation == command_generation:
+                self._target_climate_operation_mode = None
+                self._target_temperature = None
+            self.async_write_ha_state()
+            if command_result is not None and not command_result.done():
+                command_result.set_exception(self._command_error())
+
+    def _command_error(self) -> HomeAssistantError:
+        return HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="climate_command_failed",
+            translation_placeholders={"zone": self.zone.name},
+        )
+
+    @callback
+    def _cancel_climate_command(self) -> None:
+        """Release service calls waiting for a command that is not sent."""
+        if self._command_result is not None and not self._command_result.done():
+            self._command_result.set_exception(self._command_error())
+        self._command_result = None
 
     @override
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature (and operation mode if set)."""
-        _LOGGER.debug(
-            f"async_set_temperature {kwargs} ({self.zone.climate_operation_mode})"
-        )
-        if self._target_climate_operation_mode is None:
-            self._target_climate_operation_mode = self.zone.climate_operation_mode
-        new_climate_operation_mode = self._target_climate_operation_mode
+        _LOGGER.debug(f"async_set_temperature {kwargs} ({self.operation_mode})")
+        new_climate_operation_mode = self.operation_mode
         if ATTR_HVAC_MODE in kwargs:
             new_climate_operation_mode = self._get_new_climate_operation_mode(
-                self._target_climate_operation_mode, kwargs[ATTR_HVAC_MODE]
-            )
-        if ATTR_TEMPERATURE in kwargs:
-            await self.zone.set_target_temperature(
-                kwargs[ATTR_TEMPERATURE], new_climate_operation_mode
+                self.operation_mode, kwargs[ATTR_HVAC_MODE]
             )
-            _LOGGER.debug(
-                f"set target temperature done ({self.zone.climate_operation_mode})"
-            )
-        await self._async_set_climate_operation_mode(new_climate_operation_mode)
+        await self._async_queue_climate_command(
+            new_climate_operation_mode, kwargs.get(ATTR_TEMPERATURE)
+        )
 
     @override
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new operation mode."""
-        _LOGGER.debug(
-            f"async_set_hvac_mode {hvac_mode} ({self.zone.climate_operation_mode})"
-        )
+        _LOGGER.debug(f"async_set_hvac_mode {hvac_mode} ({self.operation_mode})")
         new_climate_operation_mode = self._get_new_climate_operation_mode(
-            self.zone.climate_operation_mode, hvac_mode
+            self.operation_mode, hvac_mode
         )
-        await self._async_set_climate_operation_mode(new_climate_operation_mode)
+        await self._async_queue_climate_command(new_climate_operation_mode)
 
     @override
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
-        _LOGGER.debug(
-            f"async_set_preset_mode {preset_mode} ({self.zone.climate_operation_mode})"
-        )
+        _LOGGER.debug(f"async_set_preset_mode {preset_mode} ({self.operation_mode})")
         if preset_mode not in PRESET_TO_SCENE:
             return
-        if self.zone.climate_operation_mode is None:
+        if self.operation_mode is None:
             return
         scene_id = PRESET_TO_SCENE[preset_mode]
-        if self.zone.climate_operation_mode >= 9 and scene_id <= 5:
+        if self.operation_mode >= 9 and scene_id <= 5:
             scene_id += 9
-        await self._async_set_climate_operation_mode(scene_id)
+        await self._async_queue_climate_command(scene_id)
 
     @override
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
-        _LOGGER.debug(f"async_turn_on ({self.zone.climate_operation_mode})")
-        if self.zone.climate_operation_mode == 7:
+        _LOGGER.debug(f"async_turn_on ({self.operation_mode})")
+        if self.operation_mode == 7:
             await self.async_set_preset_mode(PRESET_PASSIVE_COOLING)
-        elif self.zone.climate_operation_mode in [0, 9]:
+        elif self.operation_mode in [0, 9]:
             await self.async_set_preset_mode(PRESET_ECO)
 
     @override
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
-        _LOGGER.debug(f"async_turn_off ({self.zone.climate_operation_mode})")
-        if self.zone.climate_operation_mode in [6, 7]:
+        _LOGGER.debug(f"async_turn_off ({self.operation_mode})")
+        if self.operation_mode in [6, 7]:
             await self.async_set_preset_mode(PRESET_PASSIVE_COOLING_OFF)
         else:
             await self.async_set_preset_mode(PRESET_OFF)
 
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        self._command_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=CLIMATE_COMMAND_DELAY.total_seconds(),
+            immediate=False,
+            function=self._async_send_climate_command,
+        )
+        self.async_on_remove(self._command_debouncer.async_shutdown)
+        self.async_on_remove(self._cancel_climate_command)
+        async_remove_on_signal(
+            self,
+            SIGNAL_ZONE_REMOVED.format(self.zone.apartment.dsuid, self.zone.zone_id),
+        )
+        self.async_on_remove(
+            self.zone.register_climate_callback(self._handle_coordinator_update)
+        )
+
     @callback
     @override
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if not self.enabled:
             return
-        self._target_climate_operation_mode = self.zone.climate_operation_mode
         self.async_write_ha_state()
 
     @property
@@ -10,7 +10,7 @@ from urllib.parse import urlparse
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import (
     CONF_HOST,
     CONF_PASSWORD,
@@ -18,7 +18,8 @@ from homeassistant.const import (
     CONF_TOKEN,
     CONF_USERNAME,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
@@ -31,12 +32,16 @@ from .api.exceptions import (
 )
 from .const import (
     CONF_DSUID,
+    CONF_EXCLUDED_SCENE_GROUPS,
+    CONF_FIRMWARE_CHECK_INTERVAL,
     CONF_SSL,
+    DEFAULT_FIRMWARE_CHECK_INTERVAL,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_USERNAME,
     DOMAIN,
     IGNORE_SSL_VERIFICATION,
+    SCENE_GROUPS,
 )
 from .coordinator import DigitalstromConfigEntry
 
@@ -94,6 +99,12 @@ class DigitalstromConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: DigitalstromConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return DigitalstromOptionsFlow()
+
     def __init__(self, *args: Any, **kwargs: Any):
         self._host: str = DEFAULT_HOST
         self._port: int = DEFAULT_PORT
@@ -261,3 +272,34 @@ class DigitalstromConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._ssl = IGNORE_SSL_VERIFICATION
         self._token = self._existing_entry.data.get(CONF_TOKEN, self._token)
         return await self.async_step_user(user_input)
+
+
+class DigitalstromOptionsFlow(OptionsFlow):
+    """Handle the options of a digitalSTROM config entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Select the excluded scene groups and the firmware check interval."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_EXCLUDED_SCENE_GROUPS,
+                        default=self.config_entry.options.get(
+                            CONF_EXCLUDED_SCENE_GROUPS, []
+                        ),
+                    ): cv.multi_select(SCENE_GROUPS),
+                    vol.Optional(
+                        CONF_FIRMWARE_CHECK_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_FIRMWARE_CHECK_INTERVAL,
+                            DEFAULT_FIRMWARE_CHECK_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
+                }
+            ),
+        )
@@ -4,6 +4,8 @@ from datetime import timedelta
 
 CONF_DSUID: str = "dsuid"
 CONF_SSL: str = "ssl"
+CONF_EXCLUDED_SCENE_GROUPS: str = "excluded_scene_groups"
+CONF_FIRMWARE_CHECK_INTERVAL: str = "firmware_check_interval"
 
 DEFAULT_HOST: str = "dss.local"
 DEFAULT_PORT: int = 8080
@@ -12,7 +14,61 @@ IGNORE_SSL_VERIFICATION = "ignore"
 
 DOMAIN = "digitalstrom"
 
-WEBSOCKET_WATCHDOG_INTERVAL = timedelta(seconds=10)
-
 APARTMENT_SCENE_UPDATE_INTERVAL = timedelta(seconds=59)
 APARTMENT_SCENE_UPDATE_INTERVAL_IF_CHANGED = timedelta(seconds=29)
+
+# Firmware checks of all circuits, the interval can be changed in the options
+DEFAULT_FIRMWARE_CHECK_INTERVAL: int = 24  # hours
+FIRMWARE_CACHE_KEY = "digitalstrom.firmware.{}"
+FIRMWARE_CACHE_VERSION = 1
+# The progress of a firmware update is checked with increasing delays
+FIRMWARE_INSTALL_CHECK_DELAY = timedelta(seconds=10)
+FIRMWARE_INSTALL_CHECK_MAX_DELAY = timedelta(minutes=5)
+FIRMWARE_INSTALL_TIMEOUT = timedelta(hours=2)
+
+# Climate changes are sent once the user stopped changing them for this long
+CLIMATE_COMMAND_DELAY = timedelta(seconds=2)
+
+# Groups that can be excluded from the scene discovery
+SCENE_GROUPS: dict[str, str] = {
+    "1": "Light",
+    "2": "Shade",
+    "3": "Heating",
+    "4": "Audio",
+    "5": "Video",
+    "6": "Security",
+    "7": "Access",
+    "8": "Joker",
+    "9": "Cooling",
+    "10": "Ventilation",
+    "11": "Window",
+    "12": "Recirculation",
+    "13": "Awnings",
+    "48": "Temperature control",
+}
+# Reachable scenes are cached so that scene entities are available right away
+SCENE_CACHE_KEY = "digitalstrom.scenes.{}"
+SCENE_CACHE_VERSION = 1
+SCENE_CACHE_SAVE_DELAY = timedelta(seconds=30)
+# Scene lists are compared with the scene names of the dSS after configuration
+# change events and periodically
+SCENE_CATALOGUE_UPDATE_DELAY = timedelta(seconds=10)
+SCENE_CATALOGUE_UPDATE_INTERVAL = timedelta(hours=1)
+
+# A scene call that affects outputs refreshes the status of the whole apartment
+# after this delay, one apartment/status request covers all devices
+SCENE_REFRESH_DELAY = timedelta(milliseconds=500)
+# Output values of called scenes that are not cached yet are read after this
+# delay, so that a burst of scene calls is read together
+SCENE_VALUES_UPDATE_DELAY = timedelta(seconds=5)
+
+TOPOLOGY_UPDATE_INTERVAL = timedelta(minutes=15)
+TOPOLOGY_UPDATE_DELAY = timedelta(seconds=10)
+
+SIGNAL_DEVICES_ADDED = "digitalstrom_devices_added_{}"
+SIGNAL_DEVICE_REMOVED = "digitalstrom_device_removed_{}"
+SIGNAL_CIRCUITS_ADDED = "digitalstrom_circuits_added_{}"
+SIGNAL_CIRCUIT_REMOVED = "digitalstrom_circuit_removed_{}"
+SIGNAL_ZONES_ADDED = "digitalstrom_zones_added_{}"
+SIGNAL_ZONE_REMOVED = "digitalstrom_zone_removed_{}_{}"
+SIGNAL_SCENE_REMOVED = "digitalstrom_scene_removed_{}"
@@ -1,12 +1,23 @@
+import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import override
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api.apartment import DigitalstromApartment
+from .api.exceptions import CannotConnect, InvalidAuth
+from .const import (
+    CONF_FIRMWARE_CHECK_INTERVAL,
+    DEFAULT_FIRMWARE_CHECK_INTERVAL,
+    FIRMWARE_CACHE_KEY,
+    FIRMWARE_CACHE_VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,4 +47,73 @@ class DigitalstromApartmentStatusCoordinator(DataUpdateCoordinator[None]):
 
     @override
     async def _async_update_data(self) -> None:
-        await self.apartment.update_apartment_status()
+        try:
+            await self.apartment.update_apartment_status()
+        except InvalidAuth as err:
+            raise ConfigEntryAuthFailed from err
+
+
+class DigitalstromFirmwareCoordinator(DataUpdateCoordinator[dict[str, str | None]]):
+    """Check the firmware of all circuits, the result is the status per dSUID."""
+
+    config_entry: DigitalstromConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: DigitalstromConfigEntry,
+        apartment: DigitalstromApartment,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Digitalstrom Firmware",
+            update_interval=timedelta(
+                hours=entry.options.get(
+                    CONF_FIRMWARE_CHECK_INTERVAL, DEFAULT_FIRMWARE_CHECK_INTERVAL
+                )
+            ),
+            config_entry=entry,
+        )
+        self.apartment = apartment
+        self.store: Store[dict] = Store(
+            hass, FIRMWARE_CACHE_VERSION, FIRMWARE_CACHE_KEY.format(entry.entry_id)
+        )
+        self.last_checked: datetime | None = None
+
+    async def async_load(self) -> None:
+        """Load the results of the last check."""
+        if (cache := await self.store.async_load()) is None:
+            return
+        self.last_checked = dt_util.parse_datetime(cache["checked"])
+        self.data = cache["status"]
+
+    def check_due(self) -> bool:
+        """Return True if the cached results are missing or outdated."""
+        if self.last_checked is None or self.data is None:
+            return True
+        if any(dsuid not in self.data for dsuid in self.apartment.circuits):
+            return True
+        return dt_util.utcnow() - self.last_checked >= self.update_interval
+
+    @override
+    async def _async_update_data(self) -> dict[str, str | None]:
+        circuits = list(self.apartment.circuits.values())
+        try:
+            results = await asyncio.gather(
+                *(circuit.update_available() for circuit in circuits)
+            )
+        except InvalidAuth as err:
+            raise ConfigEntryAuthFailed from err
+        except CannotConnect as err:
+            raise UpdateFailed(err) from err
+        # Keep the previous result of circuits that could not be checked
+        data = dict(self.data or {})
+        for circuit, status in zip(circuits, results):
+            if status is not None:
+                data[circuit.dsuid] = status
+        self.last_checked = dt_util.utcnow()
+        await self.store.async_save(
+            {"checked": self.last_checked.isoformat(), "status": data}
+        )
+        return data
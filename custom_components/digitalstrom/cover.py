@@ -9,10 +9,12 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromOutputChannel
-from .const import DOMAIN
+from .api.device import DigitalstromDevice
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .coordinator import DigitalstromApartmentStatusCoordinator, DigitalstromConfigEntry
 from .entity import DigitalstromCoordinatorEntity
 
@@ -29,8 +31,27 @@ async def async_setup_entry(
     """Set up the cover platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
     coordinator = entry.runtime_data
-    covers = []
-    for device in apartment.devices.values():
+
+    @callback
+    def async_add_covers(devices: list[DigitalstromDevice]) -> None:
+        covers = create_covers(coordinator, devices)
+        _LOGGER.debug("Adding %i covers", len(covers))
+        async_add_entities(covers)
+
+    async_add_covers(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_covers
+        )
+    )
+
+
+def create_covers(
+    coordinator: DigitalstromApartmentStatusCoordinator,
+    devices: list[DigitalstromDevice],
+) -> list[CoverEntity]:
+    covers: list[CoverEntity] = []
+    for device in devices:
         position_outdoor = None
         angle_outdoor = None
         position_indoor = None
@@ -62,8 +83,7 @@ async def async_setup_entry(
             )
         if position_indoor is not None:
             covers.append(DigitalstromCover(coordinator, position_indoor, angle_indoor))
-    _LOGGER.debug("Adding %i covers", len(covers))
-    async_add_entities(covers)
+    return covers
 
 
 class DigitalstromCover(DigitalstromCoordinatorEntity, CoverEntity):
@@ -0,0 +1,34 @@
+"""Diagnostics support for the digitalSTROM integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_SSL, DOMAIN
+from .coordinator import DigitalstromConfigEntry
+
+TO_REDACT = {CONF_TOKEN, CONF_SSL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: DigitalstromConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.unique_id]
+    client = data["client"]
+    apartment = data["apartment"]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "topology": {
+            "devices": len(apartment.devices),
+            "circuits": len(apartment.circuits),
+            "zones": len(apartment.zones),
+            "zone_scenes": sum(len(z.scenes) for z in apartment.zones.values()),
+        },
+        "event_listener_connected": client.event_listener_connected(),
+        "client_stats": client.stats.as_dict(),
+    }
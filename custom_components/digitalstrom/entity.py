@@ -1,15 +1,63 @@
 from typing import Any, override
 
 from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api.device import DigitalstromDevice
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DEVICE_REMOVED
 from .coordinator import DigitalstromApartmentStatusCoordinator
 
 
+def get_device_info(device: DigitalstromDevice) -> DeviceInfo:
+    """Build the device info of the physical device a dSUID belongs to."""
+    zone_name = ""
+    if (device.zone_id is not None) and (
+        zone := device.apartment.zones.get(device.zone_id)
+    ):
+        zone_name = zone.name
+    parent_device = device.get_parent()
+    device_name = parent_device.name
+    if len(device_name) == 0:
+        for n in parent_device.unique_device_names:
+            if len(n) > 0:
+                device_name = n
+                break
+    di = DeviceInfo(
+        identifiers={(DOMAIN, parent_device.dsuid)},
+        name=device_name,
+        manufacturer=parent_device.manufacturer,
+        model=parent_device.hw_info,
+        # sw_version=parent_device.sw_version,
+        suggested_area=zone_name,
+    )
+    if parent_device.meter_dsuid is not None:
+        di["via_device"] = (DOMAIN, parent_device.meter_dsuid)
+    return di
+
+
+async def async_remove_entity(entity: Entity) -> None:
+    """Remove an entity whose device, circuit, zone or scene was removed."""
+    entity_registry = er.async_get(entity.hass)
+    if entity_registry.async_get(entity.entity_id) is not None:
+        entity_registry.async_remove(entity.entity_id)
+    else:
+        await entity.async_remove(force_remove=True)
+
+
+@callback
+def async_remove_on_signal(entity: Entity, signal: str) -> None:
+    """Remove the entity when its circuit, zone or scene is removed from the dSS."""
+
+    async def async_removed() -> None:
+        await async_remove_entity(entity)
+
+    entity.async_on_remove(async_dispatcher_connect(entity.hass, signal, async_removed))
+
+
 class DigitalstromEntity(Entity):
     """Define a base digitalSTROM entity."""
 
@@ -18,57 +66,49 @@ class DigitalstromEntity(Entity):
         self.device = device
         self._attr_unique_id: str = f"{self.device.dsuid}_{entity_identifier}"
         self._attr_should_poll = False
+        self._attr_available = device.available
         self._has_state = False
+        self._device_info: DeviceInfo | None = None
+        self._device_info_version: int | None = None
 
     @override
     async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._attr_available = self.device.available
         self.async_on_remove(
-            self.device.get_parent().register_availability_callback(
-                self.availability_callback
+            self.device.register_availability_callback(self.availability_callback)
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_REMOVED.format(self.device.dsuid),
+                self.async_device_removed,
             )
         )
 
+    async def async_device_removed(self) -> None:
+        """Remove the entity after its device was removed from the dSS."""
+        await async_remove_entity(self)
+
     @property
     @override
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
-        zone_name = ""
-        if (self.device.zone_id is not None) and (
-            zone := self.device.apartment.zones.get(self.device.zone_id)
-        ):
-            zone_name = zone.name
-        parent_device = self.device.get_parent()
-        device_name = parent_device.name
-        if len(device_name) == 0:
-            for n in parent_device.unique_device_names:
-                if len(n) > 0:
-                    device_name = n
-                    break
-        di = DeviceInfo(
-            identifiers={(DOMAIN, parent_device.dsuid)},
-            name=device_name,
-            manufacturer=parent_device.manufacturer,
-            model=parent_device.hw_info,
-            # sw_version=parent_device.sw_version,
-            suggested_area=zone_name,
-        )
-        if parent_device.meter_dsuid is not None:
-            di["via_device"] = (DOMAIN, parent_device.meter_dsuid)
-        return di
-
-    @property
-    @override
-    def available(self) -> bool:
-        return self.device.get_parent().available
+        # Only rebuilt when the device model reports a change
+        if self._device_info_version != self.device.info_version:
+            self._device_info = get_device_info(self.device)
+            self._device_info_version = self.device.info_version
+        return self._device_info
 
     def availability_callback(self, available: bool) -> None:
+        self._attr_available = available
         if not self.enabled:
             return
         self.async_write_ha_state()
 
 
 class DigitalstromCoordinatorEntity(
-    CoordinatorEntity[DigitalstromApartmentStatusCoordinator]
+    CoordinatorEntity[DigitalstromApartmentStatusCoordinator], DigitalstromEntity
 ):
     """Define a digitalSTROM coordinator entity."""
 
@@ -80,57 +120,12 @@ class DigitalstromCoordinatorEntity(
     ):
         """Initialize the entity."""
         super().__init__(coordinator)
-        self.device = device
-        self._attr_unique_id: str = f"{self.device.dsuid}_{entity_identifier}"
-        self._attr_should_poll = False
-        self._has_state = False
-
-    @override
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.device.get_parent().register_availability_callback(
-                self.availability_callback
-            )
-        )
-
-    @property
-    @override
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        zone_name = ""
-        if (self.device.zone_id is not None) and (
-            zone := self.device.apartment.zones.get(self.device.zone_id)
-        ):
-            zone_name = zone.name
-        parent_device = self.device.get_parent()
-        device_name = parent_device.name
-        if len(device_name) == 0:
-            for n in parent_device.unique_device_names:
-                if len(n) > 0:
-                    device_name = n
-                    break
-        di = DeviceInfo(
-            identifiers={(DOMAIN, parent_device.dsuid)},
-            name=device_name,
-            manufacturer=parent_device.manufacturer,
-            model=parent_device.hw_info,
-            # sw_version=parent_device.sw_version,
-            suggested_area=zone_name,
-        )
-        if parent_device.meter_dsuid is not None:
-            di["via_device"] = (DOMAIN, parent_device.meter_dsuid)
-        return di
+        DigitalstromEntity.__init__(self, device, entity_identifier)
 
     @property
     @override
     def available(self) -> bool:
-        return self.device.get_parent().available
-
-    def availability_callback(self, available: bool) -> None:
-        if not self.enabled:
-            return
-        self.async_write_ha_state()
+        return self._attr_available
 
     @callback
     @override
@@ -3,10 +3,12 @@ from typing import override
 
 from homeassistant.components.event import EventDeviceClass, EventEntity
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromButtonChannel
-from .const import DOMAIN
+from .api.device import DigitalstromDevice
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .coordinator import DigitalstromConfigEntry
 from .entity import DigitalstromEntity
 
@@ -53,12 +55,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the event platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
-    events = []
-    for device in apartment.devices.values():
-        if device.button:
-            events.append(DigitalstromButtonEvent(device.button))
-    _LOGGER.debug("Adding %i events", len(events))
-    async_add_entities(events)
+
+    @callback
+    def async_add_events(devices: list[DigitalstromDevice]) -> None:
+        events = []
+        for device in devices:
+            if device.button:
+                events.append(DigitalstromButtonEvent(device.button))
+        _LOGGER.debug("Adding %i events", len(events))
+        async_add_entities(events)
+
+    async_add_events(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_events
+        )
+    )
 
 
 class DigitalstromButtonEvent(EventEntity, DigitalstromEntity):
@@ -13,10 +13,12 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromOutputChannel
-from .const import DOMAIN
+from .api.device import DigitalstromDevice
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .coordinator import DigitalstromApartmentStatusCoordinator, DigitalstromConfigEntry
 from .entity import DigitalstromCoordinatorEntity
 
@@ -33,8 +35,27 @@ async def async_setup_entry(
     """Set up the light platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
     coordinator = entry.runtime_data
-    lights = []
-    for device in apartment.devices.values():
+
+    @callback
+    def async_add_lights(devices: list[DigitalstromDevice]) -> None:
+        lights = create_lights(coordinator, devices)
+        _LOGGER.debug("Adding %i lights", len(lights))
+        async_add_entities(lights)
+
+    async_add_lights(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_lights
+        )
+    )
+
+
+def create_lights(
+    coordinator: DigitalstromApartmentStatusCoordinator,
+    devices: list[DigitalstromDevice],
+) -> list[LightEntity]:
+    lights: list[LightEntity] = []
+    for device in devices:
         brightness = None
         color_temp = None
         hue = None
@@ -66,8 +87,7 @@ async def async_setup_entry(
                     color_y,
                 )
             )
-    _LOGGER.debug("Adding %i lights", len(lights))
-    async_add_entities(lights)
+    return lights
 
 
 class DigitalstromLight(DigitalstromCoordinatorEntity, LightEntity):
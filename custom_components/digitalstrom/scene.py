@@ -2,13 +2,32 @@ import logging
 from typing import Any, override
 
 from homeassistant.components.scene import Scene as SceneEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
+from .api.exceptions import CannotConnect, InvalidAuth, ServerError
 from .api.scene import DigitalstromZoneScene
-from .const import DOMAIN
+from .api.zone import DigitalstromZone
+from .const import (
+    CONF_EXCLUDED_SCENE_GROUPS,
+    DOMAIN,
+    SCENE_CATALOGUE_UPDATE_DELAY,
+    SCENE_CATALOGUE_UPDATE_INTERVAL,
+    SIGNAL_SCENE_REMOVED,
+    SIGNAL_ZONE_REMOVED,
+    SIGNAL_ZONES_ADDED,
+)
 from .coordinator import DigitalstromConfigEntry
+from .entity import async_remove_on_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,13 +108,129 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
+    excluded_groups = [
+        int(group) for group in entry.options.get(CONF_EXCLUDED_SCENE_GROUPS, [])
+    ]
+    scene_store = hass.data[DOMAIN][entry.unique_id]["scene_store"]
+    entity_registry = er.async_get(hass)
+    added_scenes: set[str] = set()
+    known_scenes: set[str] = set()
 
-    zone_scenes = []
-    for zone in apartment.zones.values():
-        for zone_scene in zone.scenes.values():
-            zone_scenes.append(DigitalstromZoneSceneEntity(zone_scene))
-    _LOGGER.debug("Adding %i zone scenes", len(zone_scenes))
-    async_add_entities(zone_scenes)
+    @callback
+    def async_add_scenes() -> None:
+        zone_scenes = []
+        for zone in apartment.zones.values():
+            for zone_scene in zone.scenes.values():
+                unique_id = get_scene_unique_id(zone_scene)
+                known_scenes.add(unique_id)
+                if unique_id in added_scenes or zone_scene.group in excluded_groups:
+                    continue
+                # Unnamed scenes of other groups are only added if the user
+                # enabled them before
+                if zone_scene.name is None and zone_scene.group not in [1, 2]:
+                    entity_id = entity_registry.async_get_entity_id(
+                        Platform.SCENE, DOMAIN, unique_id
+                    )
+                    if entity_id is None or (
+                        (registry_entry := entity_registry.async_get(entity_id))
+                        is not None
+                        and registry_entry.disabled
+                    ):
+                        continue
+                added_scenes.add(unique_id)
+                zone_scenes.append(DigitalstromZoneSceneEntity(zone_scene))
+        _LOGGER.debug("Adding %i zone scenes", len(zone_scenes))
+        async_add_entities(zone_scenes)
+
+    @callback
+    def async_remove_scenes() -> None:
+        # Remove the scenes that are no longer reported by the dSS, including
+        # the disabled ones that were never added
+        unique_ids = {
+            get_scene_unique_id(zone_scene)
+            for zone in apartment.zones.values()
+            for zone_scene in zone.scenes.values()
+        }
+        for unique_id in known_scenes - unique_ids:
+            known_scenes.discard(unique_id)
+            if unique_id in added_scenes:
+                added_scenes.discard(unique_id)
+                async_dispatcher_send(hass, SIGNAL_SCENE_REMOVED.format(unique_id))
+            elif entity_id := entity_registry.async_get_entity_id(
+                Platform.SCENE, DOMAIN, unique_id
+            ):
+                entity_registry.async_remove(entity_id)
+
+    if scene_store.loaded:
+        async_add_scenes()
+
+    async def discover_scenes() -> None:
+        try:
+            if not scene_store.loaded:
+                await apartment.get_scenes(excluded_groups)
+            else:
+                # Only read the scene lists that changed since they were cached
+                await apartment.check_scene_revision(excluded_groups)
+                await apartment.update_stale_scenes(excluded_groups)
+        except (CannotConnect, InvalidAuth, ServerError) as ex:
+            # Scene lists that were not read are marked stale and read by the
+            # next update, the ones already read are added
+            _LOGGER.debug(f"Scene discovery failed: {ex}")
+        scene_store.async_schedule_save()
+        async_remove_scenes()
+        async_add_scenes()
+
+    entry.async_create_background_task(
+        hass, discover_scenes(), "digitalstrom_scene_discovery"
+    )
+
+    async def update_scenes(*args: Any) -> None:
+        try:
+            await apartment.check_scene_revision(excluded_groups)
+            await apartment.update_stale_scenes(excluded_groups)
+        except (CannotConnect, InvalidAuth, ServerError) as ex:
+            _LOGGER.debug(f"Scene update failed: {ex}")
+            return
+        scene_store.async_schedule_save()
+        async_remove_scenes()
+        async_add_scenes()
+
+    scene_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SCENE_CATALOGUE_UPDATE_DELAY.total_seconds(),
+        immediate=False,
+        function=update_scenes,
+    )
+    entry.async_on_unload(
+        apartment.register_scene_catalogue_callback(
+            scene_debouncer.async_schedule_call
+        )
+    )
+    entry.async_on_unload(scene_debouncer.async_shutdown)
+
+    @callback
+    def async_zones_added(zones: list[DigitalstromZone]) -> None:
+        # The scene lists of new zones are read by the next update
+        scene_debouncer.async_schedule_call()
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ZONES_ADDED.format(entry.entry_id), async_zones_added
+        )
+    )
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            update_scenes,
+            SCENE_CATALOGUE_UPDATE_INTERVAL,
+            cancel_on_shutdown=True,
+        )
+    )
+
+
+def get_scene_unique_id(zone_scene: DigitalstromZoneScene) -> str:
+    return f"{zone_scene.zone.apartment.dsuid}_zone{zone_scene.zone.zone_id}_group{zone_scene.group}_scene{zone_scene.number}"
 
 
 class DigitalstromZoneSceneEntity(SceneEntity):
@@ -103,6 +238,13 @@ class DigitalstromZoneSceneEntity(SceneEntity):
         self.scene = zone_scene
         self.entity_id = f"scene.{self.scene.zone.apartment.dsuid}_zone{self.scene.zone.zone_id}_group{self.scene.group}_scene{self.scene.number}"
         self._attr_has_entity_name = True
+        self.set_translation()
+        if self.scene.name is None and self.scene.group not in [1, 2]:
+            self._attr_entity_registry_enabled_default = False
+        self._attr_should_poll = False
+        self._attr_unique_id: str = get_scene_unique_id(self.scene)
+
+    def set_translation(self) -> None:
         if self.scene.name is not None:
             self._attr_translation_placeholders = {"name": self.scene.name}
             self._attr_translation_key = GROUP_MAP.get(
@@ -119,18 +261,63 @@ class DigitalstromZoneSceneEntity(SceneEntity):
             self._attr_translation_key = GROUP_MAP.get(
                 f"g{self.scene.group}s{self.scene.number}", key
             )
-
-            if self.scene.group not in [1, 2]:
-                self._attr_entity_registry_enabled_default = False
         if self._attr_translation_key in [
             "zone_scene_unknown",
             "zone_scene_unknown_named",
         ]:
             self._attr_translation_placeholders["group"] = str(self.scene.group)
-        self._attr_should_poll = False
-        self._attr_unique_id: str = (
-            f"{self.scene.zone.apartment.dsuid}_zone{self.scene.zone.zone_id}_group{self.scene.group}_scene{self.scene.number}"
+
+    def update_name(self) -> None:
+        # Home Assistant caches the name built from the translation key, so
+        # the new name is built here and set as the entity name
+        self.set_translation()
+        assert self.platform is not None
+        name = self.platform.platform_translations.get(
+            f"component.{DOMAIN}.entity.{Platform.SCENE}.{self._attr_translation_key}.name"
         )
+        if name is not None:
+            self._attr_name = name.format(**self._attr_translation_placeholders)
+        else:
+            self._attr_name = self.scene.name
+        if self.registry_entry is not None:
+            er.async_get(self.hass).async_update_entity(
+                self.entity_id, original_name=self._attr_name
+            )
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+
+        @callback
+        def update_callback() -> None:
+            # The scene was renamed in the dSS
+            self.update_name()
+            self.async_write_ha_state()
+
+        self.async_on_remove(self.scene.register_update_callback(update_callback))
+        async_remove_on_signal(
+            self,
+            SIGNAL_ZONE_REMOVED.format(
+                self.scene.zone.apartment.dsuid, self.scene.zone.zone_id
+            ),
+        )
+        async_remove_on_signal(self, SIGNAL_SCENE_REMOVED.format(self.unique_id))
+
+        @callback
+        def scene_callback(group_id: int) -> None:
+            if group_id == self.scene.group:
+                self.async_write_ha_state()
+
+        self.async_on_remove(self.scene.zone.register_scene_callback(scene_callback))
+
+    @property
+    @override
+    def extra_state_attributes(self) -> dict[str, Any]:
+        last_called_scene = self.scene.zone.last_called_scenes.get(self.scene.group)
+        return {
+            "active": last_called_scene == self.scene.number,
+            "last_called_scene": last_called_scene,
+        }
 
     @override
     async def async_activate(self, **kwargs: Any) -> None:
@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from typing import Any, override
 
 from homeassistant.components.sensor import (
@@ -12,6 +13,7 @@ from homeassistant.const import (
     DEGREE,
     LIGHT_LUX,
     PERCENTAGE,
+    EntityCategory,
     UnitOfApparentPower,
     UnitOfElectricCurrent,
     UnitOfEnergy,
@@ -27,14 +29,29 @@ from homeassistant.const import (
     UnitOfVolumeFlowRate,
     UnitOfVolumetricFlux,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromMeterSensorChannel, DigitalstromSensorChannel
-from .const import DOMAIN
+from .api.circuit import DigitalstromCircuit
+from .api.client import DigitalstromClient
+from .api.const import EVENT_LISTENER_STATES, TEMPERATURE_CONTROL_NOMINAL_VALUES
+from .api.device import DigitalstromDevice
+from .api.zone import DigitalstromZone
+from .const import (
+    CONF_EXCLUDED_SCENE_GROUPS,
+    DOMAIN,
+    SCENE_GROUPS,
+    SIGNAL_CIRCUIT_REMOVED,
+    SIGNAL_CIRCUITS_ADDED,
+    SIGNAL_DEVICES_ADDED,
+    SIGNAL_ZONE_REMOVED,
+    SIGNAL_ZONES_ADDED,
+)
 from .coordinator import DigitalstromConfigEntry
-from .entity import DigitalstromEntity
+from .entity import DigitalstromEntity, async_remove_on_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -316,6 +333,97 @@ SENSORS_MAP: dict[int, SensorEntityDescription] = {
 }
 
 
+CLIENT_STATS_SENSORS: list[SensorEntityDescription] = [
+    SensorEntityDescription(
+        key="request_count",
+        translation_key="request_count",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="error_count",
+        translation_key="error_count",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="average_latency_ms",
+        translation_key="average_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="events_per_second",
+        translation_key="events_per_second",
+        native_unit_of_measurement="events/s",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="websocket_reconnects",
+        translation_key="websocket_reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="token_renewals",
+        translation_key="token_renewals",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+]
+
+
+ZONE_CONTROL_VALUE_SENSOR = SensorEntityDescription(
+    key="control_value",
+    translation_key="zone_control_value",
+    native_unit_of_measurement=PERCENTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
+
+# Nominal temperature of each operation mode, keys of getTemperatureControlValues
+ZONE_NOMINAL_VALUE_SENSORS: dict[str, SensorEntityDescription] = {
+    key: SensorEntityDescription(
+        key=key,
+        translation_key=f"zone_nominal_value_{key.lower()}",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        entity_registry_enabled_default=False,
+    )
+    for key in TEMPERATURE_CONTROL_NOMINAL_VALUES
+}
+
+# Zone sensor readings, keys of getSensorValues
+ZONE_SENSOR_VALUE_SENSORS: dict[str, SensorEntityDescription] = {
+    "TemperatureValue": SensorEntityDescription(
+        key="TemperatureValue",
+        translation_key="zone_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "HumidityValue": SensorEntityDescription(
+        key="HumidityValue",
+        translation_key="zone_humidity",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "CO2concentrationValue": SensorEntityDescription(
+        key="CO2concentrationValue",
+        translation_key="zone_carbon_dioxide",
+        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+        device_class=SensorDeviceClass.CO2,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "BrightnessValue": SensorEntityDescription(
+        key="BrightnessValue",
+        translation_key="zone_brightness",
+        native_unit_of_measurement=LIGHT_LUX,
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: DigitalstromConfigEntry,
@@ -323,19 +431,112 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
-    circuit_sensors = []
-    for circuit in apartment.circuits.values():
-        for sensor in circuit.sensors.values():
-            circuit_sensors.append(DigitalstromMeterSensor(sensor))
-    _LOGGER.debug("Adding %i circuit sensors", len(circuit_sensors))
-    async_add_entities(circuit_sensors)
 
-    sensors = []
-    for device in apartment.devices.values():
-        for sensor in device.sensors.values():
-            sensors.append(DigitalstromSensor(sensor))
-    _LOGGER.debug("Adding %i sensors", len(sensors))
-    async_add_entities(sensors)
+    @callback
+    def async_add_circuit_sensors(circuits: list[DigitalstromCircuit]) -> None:
+        circuit_sensors = []
+        for circuit in circuits:
+            for sensor in circuit.sensors.values():
+                circuit_sensors.append(DigitalstromMeterSensor(sensor))
+        _LOGGER.debug("Adding %i circuit sensors", len(circuit_sensors))
+        async_add_entities(circuit_sensors)
+
+    async_add_circuit_sensors(list(apartment.circuits.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_CIRCUITS_ADDED.format(entry.entry_id),
+            async_add_circuit_sensors,
+        )
+    )
+
+    @callback
+    def async_add_sensors(devices: list[DigitalstromDevice]) -> None:
+        sensors = []
+        for device in devices:
+            for sensor in device.sensors.values():
+                sensors.append(DigitalstromSensor(sensor))
+        _LOGGER.debug("Adding %i sensors", len(sensors))
+        async_add_entities(sensors)
+
+    async_add_sensors(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_sensors
+        )
+    )
+
+    client_stats_sensors = []
+    for description in CLIENT_STATS_SENSORS:
+        client_stats_sensors.append(
+            DigitalstromClientStatsSensor(
+                hass.data[DOMAIN][entry.unique_id]["client"],
+                apartment.dsuid,
+                description,
+            )
+        )
+    _LOGGER.debug("Adding %i client statistics sensors", len(client_stats_sensors))
+    async_add_entities(client_stats_sensors)
+    added_zone_sensors: set[tuple[int, str | None, str]] = set()
+
+    def get_new_zone_sensors(zone: DigitalstromZone) -> list[SensorEntity]:
+        # Sensors are created once the zone reports their values, which may
+        # only be read after the setup
+        descriptions: list[tuple[SensorEntityDescription, str | None]] = []
+        if zone.climate_control_mode not in [None, 0]:
+            descriptions.append((ZONE_CONTROL_VALUE_SENSOR, None))
+            for key, description in ZONE_NOMINAL_VALUE_SENSORS.items():
+                if key in zone.nominal_values:
+                    descriptions.append((description, "nominal_values"))
+        for key, description in ZONE_SENSOR_VALUE_SENSORS.items():
+            if key in zone.sensor_values:
+                descriptions.append((description, "sensor_values"))
+        zone_sensors: list[SensorEntity] = []
+        for description, value_group in descriptions:
+            if (zone.zone_id, value_group, description.key) in added_zone_sensors:
+                continue
+            added_zone_sensors.add((zone.zone_id, value_group, description.key))
+            zone_sensors.append(DigitalstromZoneSensor(zone, description, value_group))
+        return zone_sensors
+
+    @callback
+    def async_add_zone_sensors(zone: DigitalstromZone) -> None:
+        if zone_sensors := get_new_zone_sensors(zone):
+            _LOGGER.debug("Adding %i zone sensors", len(zone_sensors))
+            async_add_entities(zone_sensors)
+
+    excluded_groups = [
+        int(group) for group in entry.options.get(CONF_EXCLUDED_SCENE_GROUPS, [])
+    ]
+
+    @callback
+    def async_add_zones(zones: list[DigitalstromZone]) -> None:
+        zone_sensors: list[SensorEntity] = []
+        for zone in zones:
+            zone_sensors.extend(get_new_zone_sensors(zone))
+            entry.async_on_unload(
+                zone.register_climate_callback(partial(async_add_zone_sensors, zone))
+            )
+            for group_id in zone.group_ids:
+                if group_id not in excluded_groups:
+                    zone_sensors.append(DigitalstromZoneSceneSensor(zone, group_id))
+        _LOGGER.debug("Adding %i zone sensors", len(zone_sensors))
+        async_add_entities(zone_sensors)
+
+    async_add_zones(list(apartment.zones.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ZONES_ADDED.format(entry.entry_id), async_add_zones
+        )
+    )
+
+    async_add_entities(
+        [
+            DigitalstromEventListenerSensor(
+                hass.data[DOMAIN][entry.unique_id]["client"], apartment.dsuid
+            )
+        ]
+    )
 
 
 class DigitalstromSensor(SensorEntity, DigitalstromEntity):
@@ -444,9 +645,221 @@ class DigitalstromMeterSensor(SensorEntity):
         """Return the state of the sensor."""
         return self._state
 
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        async_remove_on_signal(self, SIGNAL_CIRCUIT_REMOVED.format(self.circuit.dsuid))
+
     async def async_update(self, **kwargs: Any) -> None:
         value = await self.channel.get_value()
         if self.channel.index == "energy" and value is not None:
             self._state = value / 3600000
         else:
             self._state = value
+
+
+class DigitalstromZoneSensor(SensorEntity):
+    def __init__(
+        self,
+        zone: DigitalstromZone,
+        description: SensorEntityDescription,
+        value_group: str | None,
+    ):
+        # value_group is the zone dict holding the value, None for an attribute
+        self.zone = zone
+        self.entity_description = description
+        self.value_group = value_group
+        key = description.key
+        if value_group is not None:
+            key = f"{value_group}_{key}"
+        self._attr_unique_id: str = (
+            f"{zone.apartment.dsuid}_zone{zone.zone_id}_{key.lower()}"
+        )
+        self.entity_id = (
+            f"sensor.{zone.apartment.dsuid}_zone{zone.zone_id}_{key.lower()}"
+        )
+        self._attr_has_entity_name = True
+        self._attr_translation_key = description.translation_key
+        self._attr_suggested_display_precision = 1
+        self._attr_should_poll = False
+
+    @property
+    @override
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={
+                (
+                    DOMAIN,
+                    f"{self.zone.apartment.dsuid}_zone{self.zone.zone_id}",
+                )
+            },
+            name=self.zone.name,
+            model="Zone",
+            manufacturer="digitalSTROM",
+            suggested_area=self.zone.name,
+            via_device=(DOMAIN, self.zone.apartment.dsuid),
+        )
+
+    @property
+    @override
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        if self.value_group is None:
+            return getattr(self.zone, self.entity_description.key)
+        return getattr(self.zone, self.value_group).get(self.entity_description.key)
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+
+        @callback
+        def climate_callback() -> None:
+            self.async_write_ha_state()
+
+        self.async_on_remove(self.zone.register_climate_callback(climate_callback))
+        async_remove_on_signal(
+            self,
+            SIGNAL_ZONE_REMOVED.format(self.zone.apartment.dsuid, self.zone.zone_id),
+        )
+
+
+class DigitalstromZoneSceneSensor(SensorEntity):
+    def __init__(self, zone: DigitalstromZone, group_id: int):
+        self.zone = zone
+        self.group_id = group_id
+        self._attr_unique_id: str = (
+            f"{zone.apartment.dsuid}_zone{zone.zone_id}_group{group_id}_scene"
+        )
+        self.entity_id = (
+            f"sensor.{zone.apartment.dsuid}_zone{zone.zone_id}_group{group_id}_scene"
+        )
+        self._attr_has_entity_name = True
+        self._attr_translation_key = "zone_last_called_scene"
+        self._attr_translation_placeholders = {
+            "group": SCENE_GROUPS.get(str(group_id), str(group_id))
+        }
+        if group_id not in [1, 2]:
+            self._attr_entity_registry_enabled_default = False
+        self._attr_should_poll = False
+
+    @property
+    @override
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={
+                (
+                    DOMAIN,
+                    f"{self.zone.apartment.dsuid}_zone{self.zone.zone_id}",
+                )
+            },
+            name=self.zone.name,
+            model="Zone",
+            manufacturer="digitalSTROM",
+            suggested_area=self.zone.name,
+            via_device=(DOMAIN, self.zone.apartment.dsuid),
+        )
+
+    @property
+    @override
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        return self.zone.last_called_scenes.get(self.group_id)
+
+    @property
+    @override
+    def extra_state_attributes(self) -> dict[str, Any]:
+        scene_id = self.zone.last_called_scenes.get(self.group_id)
+        zone_scene = self.zone.scenes.get(f"{self.group_id}_{scene_id}")
+        return {"scene_name": zone_scene.name if zone_scene is not None else None}
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+
+        @callback
+        def scene_callback(group_id: int) -> None:
+            if group_id == self.group_id:
+                self.async_write_ha_state()
+
+        self.async_on_remove(self.zone.register_scene_callback(scene_callback))
+        async_remove_on_signal(
+            self,
+            SIGNAL_ZONE_REMOVED.format(self.zone.apartment.dsuid, self.zone.zone_id),
+        )
+
+
+class DigitalstromClientStatsSensor(SensorEntity):
+    def __init__(
+        self,
+        client: DigitalstromClient,
+        apartment_dsuid: str,
+        description: SensorEntityDescription,
+    ):
+        self.client = client
+        self.apartment_dsuid = apartment_dsuid
+        self.entity_description = description
+        self._attr_unique_id: str = f"{apartment_dsuid}_stats_{description.key}"
+        self.entity_id = f"sensor.{apartment_dsuid}_stats_{description.key}"
+        self._attr_has_entity_name = True
+        self._attr_translation_key = description.translation_key
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_should_poll = True
+
+    @property
+    @override
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.apartment_dsuid)},
+            name="Apartment",
+            model="Apartment",
+            manufacturer="digitalSTROM",
+        )
+
+    @property
+    @override
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return getattr(self.client.stats, self.entity_description.key)
+
+
+class DigitalstromEventListenerSensor(SensorEntity):
+    def __init__(self, client: DigitalstromClient, apartment_dsuid: str):
+        self.client = client
+        self.apartment_dsuid = apartment_dsuid
+        self._attr_unique_id: str = f"{apartment_dsuid}_event_listener"
+        self.entity_id = f"sensor.{apartment_dsuid}_event_listener"
+        self._attr_has_entity_name = True
+        self._attr_translation_key = "event_listener"
+        self._attr_device_class = SensorDeviceClass.ENUM
+        self._attr_options = EVENT_LISTENER_STATES
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_should_poll = False
+
+    @property
+    @override
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.apartment_dsuid)},
+            name="Apartment",
+            model="Apartment",
+            manufacturer="digitalSTROM",
+        )
+
+    @property
+    @override
+    def native_value(self) -> str:
+        """Return the state of the sensor."""
+        return self.client.event_listener_state
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+
+        @callback
+        def state_callback(state: str) -> None:
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            self.client.register_event_listener_state_callback(state_callback)
+        )
@@ -0,0 +1,40 @@
+"""Persistent cache of the scenes of a digitalSTROM installation."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api.apartment import DigitalstromApartment
+from .const import SCENE_CACHE_KEY, SCENE_CACHE_SAVE_DELAY, SCENE_CACHE_VERSION
+
+
+class DigitalstromSceneStore(Store[dict]):
+    """Store the scene lists and the output values of the called scenes."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, apartment: DigitalstromApartment
+    ) -> None:
+        """Initialize the store."""
+        super().__init__(hass, SCENE_CACHE_VERSION, SCENE_CACHE_KEY.format(entry_id))
+        self.apartment = apartment
+        self.loaded = False
+
+    async def async_load_cache(self) -> None:
+        """Load the cached scenes into the apartment."""
+        if (data := await self.async_load()) is None:
+            return
+        self.apartment.load_scene_lists(data.get("scene_lists", {}))
+        self.apartment.load_scene_values(data.get("scene_values", {}))
+        self.loaded = True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the cache once no further changes follow."""
+        self.async_delay_save(self._cache_data, SCENE_CACHE_SAVE_DELAY.total_seconds())
+
+    def _cache_data(self) -> dict[str, Any]:
+        return {
+            "scene_lists": self.apartment.export_scene_lists(),
+            "scene_values": self.apartment.export_scene_values(),
+        }
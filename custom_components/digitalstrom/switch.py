@@ -3,16 +3,19 @@ from datetime import datetime, timedelta
 from typing import Any, override
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .api.channel import DigitalstromOutputChannel
+from .api.device import DigitalstromDevice
 from .api.scene import DigitalstromApartmentScene
 from .const import (
     APARTMENT_SCENE_UPDATE_INTERVAL,
     APARTMENT_SCENE_UPDATE_INTERVAL_IF_CHANGED,
     DOMAIN,
+    SIGNAL_DEVICES_ADDED,
 )
 from .coordinator import DigitalstromConfigEntry
 from .entity import DigitalstromEntity
@@ -31,13 +34,22 @@ async def async_setup_entry(
     """Set up the switch platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
 
-    switches = []
-    for device in apartment.devices.values():
-        for channel in device.output_channels.values():
-            if channel.channel_type == "powerLevel":
-                switches.append(DigitalstromSwitch(channel))
-    _LOGGER.debug("Adding %i switches", len(switches))
-    async_add_entities(switches)
+    @callback
+    def async_add_switches(devices: list[DigitalstromDevice]) -> None:
+        switches = []
+        for device in devices:
+            for channel in device.output_channels.values():
+                if channel.channel_type == "powerLevel":
+                    switches.append(DigitalstromSwitch(channel))
+        _LOGGER.debug("Adding %i switches", len(switches))
+        async_add_entities(switches)
+
+    async_add_switches(list(apartment.devices.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_switches
+        )
+    )
 
     apartment_scenes = []
     for apartment_scene in apartment.scenes:
@@ -7,13 +7,25 @@ from homeassistant.components.update import (
     UpdateEntity,
     UpdateEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api.circuit import DigitalstromCircuit
-from .const import DOMAIN
-from .coordinator import DigitalstromConfigEntry
+from .api.exceptions import CannotConnect
+from .const import (
+    DOMAIN,
+    FIRMWARE_INSTALL_CHECK_DELAY,
+    FIRMWARE_INSTALL_CHECK_MAX_DELAY,
+    FIRMWARE_INSTALL_TIMEOUT,
+    SIGNAL_CIRCUIT_REMOVED,
+    SIGNAL_CIRCUITS_ADDED,
+)
+from .coordinator import DigitalstromConfigEntry, DigitalstromFirmwareCoordinator
+from .entity import async_remove_on_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +37,42 @@ async def async_setup_entry(
 ) -> None:
     """Set up the update platform."""
     apartment = hass.data[DOMAIN][entry.unique_id]["apartment"]
-    update_entities = []
-    for circuit in apartment.circuits.values():
-        update_entities.append(DigitalstromUpdateEntity(circuit))
-    _LOGGER.debug("Adding %i update entities", len(update_entities))
-    async_add_entities(update_entities)
+    coordinator = DigitalstromFirmwareCoordinator(hass, entry, apartment)
+    await coordinator.async_load()
+
+    @callback
+    def async_add_update_entities(circuits: list[DigitalstromCircuit]) -> None:
+        update_entities = []
+        for circuit in circuits:
+            update_entities.append(DigitalstromUpdateEntity(coordinator, circuit))
+        _LOGGER.debug("Adding %i update entities", len(update_entities))
+        async_add_entities(update_entities)
+        # New circuits are checked right away, all others use the cached results
+        if coordinator.check_due():
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), "digitalstrom_firmware_check"
+            )
+
+    async_add_update_entities(list(apartment.circuits.values()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_CIRCUITS_ADDED.format(entry.entry_id),
+            async_add_update_entities,
+        )
+    )
 
 
-class DigitalstromUpdateEntity(UpdateEntity):
+class DigitalstromUpdateEntity(
+    CoordinatorEntity[DigitalstromFirmwareCoordinator], UpdateEntity
+):
     """Entity representing the update state."""
 
-    def __init__(self, circuit: DigitalstromCircuit) -> None:
+    def __init__(
+        self, coordinator: DigitalstromFirmwareCoordinator, circuit: DigitalstromCircuit
+    ) -> None:
         """Initialize the update entity."""
+        super().__init__(coordinator)
         self.circuit = circuit
         self._attr_unique_id: str = f"{self.circuit.dsuid}_firmware"
         self.entity_id = f"update.{self._attr_unique_id}"
@@ -47,8 +83,7 @@ class DigitalstromUpdateEntity(UpdateEntity):
             UpdateEntityFeature.INSTALL | UpdateEntityFeature.RELEASE_NOTES
         )
         self._attr_in_progress = False
-        self._attr_should_poll = True
-        self._attr_installed_version = self.circuit.sw_version
+        self._update_versions()
 
     @property
     @override
@@ -68,6 +103,29 @@ class DigitalstromUpdateEntity(UpdateEntity):
     def available(self) -> bool:
         return self.circuit.available
 
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        async_remove_on_signal(self, SIGNAL_CIRCUIT_REMOVED.format(self.circuit.dsuid))
+
+    def _update_versions(self) -> None:
+        self._attr_installed_version = self.circuit.sw_version
+        if self.coordinator.data is None or (
+            (status := self.coordinator.data.get(self.circuit.dsuid)) is None
+        ):
+            self._attr_latest_version = None
+        else:
+            self._attr_latest_version = (
+                "Needs Update" if status == "update" else self.circuit.sw_version
+            )
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        self._update_versions()
+        super()._handle_coordinator_update()
+
     @override
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -75,26 +133,47 @@ class DigitalstromUpdateEntity(UpdateEntity):
         """Install an update."""
         _LOGGER.debug(f"{self.circuit.name}: Starting update")
         self._attr_in_progress = True
-        await self.circuit.install_update()
-        while (status := await self.circuit.update_available()) != "ok":
-            _LOGGER.debug(
-                f"{self.circuit.name}: Received status during update: {status}"
-            )
-            await asyncio.sleep(10)
+        self.async_write_ha_state()
+        try:
+            await self.circuit.install_update()
+            await self._async_wait_for_update()
+        finally:
+            self._attr_in_progress = False
+            self.async_write_ha_state()
         _LOGGER.debug(f"{self.circuit.name}: Update done")
         await self.circuit.apartment.get_circuits()
-        self._attr_in_progress = False
+        await self.coordinator.async_request_refresh()
 
-    async def async_update(self) -> None:
-        """Update entity state.
-
-        Update in_progress, installed_version and latest_version.
-        """
-        status = await self.circuit.update_available()
-        self._attr_installed_version = self.circuit.sw_version
-        self._attr_latest_version = (
-            "Needs Update" if status == "update" else self.circuit.sw_version
-        )
+    async def _async_wait_for_update(self) -> None:
+        """Wait until the dSM reports that its firmware is up to date."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + FIRMWARE_INSTALL_TIMEOUT.total_seconds()
+        delay = FIRMWARE_INSTALL_CHECK_DELAY
+        while True:
+            await asyncio.sleep(delay.total_seconds())
+            try:
+                status = await self.circuit.update_available()
+            except CannotConnect:
+                # The dSS may be unreachable while the dSM restarts
+                status = None
+            _LOGGER.debug(
+                f"{self.circuit.name}: Received status during update: {status}"
+            )
+            if status == "ok":
+                return
+            if status == "error":
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="firmware_update_failed",
+                    translation_placeholders={"name": self.circuit.name},
+                )
+            if loop.time() > deadline:
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="firmware_update_timeout",
+                    translation_placeholders={"name": self.circuit.name},
+                )
+            delay = min(delay * 2, FIRMWARE_INSTALL_CHECK_MAX_DELAY)
 
     @override
     async def async_release_notes(self) -> str | None:
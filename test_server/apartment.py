@@ -1,9 +1,82 @@
+import asyncio
+import copy
 import json
 import random
+import re
+import time
+from datetime import datetime, timezone
+
+# Seconds needed to move an output channel over its full range of 0 to 100
+MOVEMENT_DURATIONS = {
+    "brightness": 1.0,
+    "shadePositionOutside": 40.0,
+    "shadePositionIndoor": 20.0,
+    "shadeOpeningAngleOutside": 2.0,
+    "shadeOpeningAngleIndoor": 2.0,
+}
+
+OUTPUT_PATH_REGEX = re.compile(
+    r"/apartment/zones/zone\d+/devices/(?P<dsuid>[0-9a-fA-F]+)/status/outputs/"
+    r"(?P<channel>\w+)/targetValue"
+)
+
+
+def format_timestamp(timestamp):
+    utc = datetime.fromtimestamp(timestamp, timezone.utc)
+    return utc.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class OutputChannelState:
+    def __init__(self, channel_id, value=0.0):
+        self.channel_id = channel_id
+        self.initial_value = value
+        self.target_value = value
+        self.started_at = 0.0
+        self.terminates_at = 0.0
+
+    def value(self, now=None):
+        now = time.time() if now is None else now
+        if now >= self.terminates_at:
+            return self.target_value
+        ratio = (now - self.started_at) / (self.terminates_at - self.started_at)
+        return self.initial_value + (self.target_value - self.initial_value) * ratio
+
+    def is_moving(self, now=None):
+        now = time.time() if now is None else now
+        return now < self.terminates_at
+
+    def move_to(self, value, time_scale=1.0):
+        now = time.time()
+        self.initial_value = self.value(now)
+        self.target_value = value
+        full_range = MOVEMENT_DURATIONS.get(self.channel_id, 0) * time_scale
+        self.started_at = now
+        self.terminates_at = now + full_range * abs(value - self.initial_value) / 100
+        return self.terminates_at - now
+
+    def stop(self):
+        self.target_value = self.value()
+        self.initial_value = self.target_value
+        self.terminates_at = 0.0
+
+    def as_status(self):
+        now = time.time()
+        status = {
+            "id": self.channel_id,
+            "status": "moving" if self.is_moving(now) else "idle",
+            "targetValue": self.target_value,
+        }
+        if self.is_moving(now):
+            status["initialValue"] = self.initial_value
+            status["startedAt"] = format_timestamp(self.started_at)
+            status["terminatesAt"] = format_timestamp(self.terminates_at)
+        return status
 
 
 class Apartment:
-    def __init__(self):
+    def __init__(self, generated=None):
+        # Payloads from generator.generate_apartment, used instead of json/ files
+        self.generated = generated
         self.strings = {
             "/usr/states/hibernation/state": "",
             "/usr/states/presence/state": "",
@@ -18,7 +91,18 @@ class Apartment:
             "/usr/states/hail/state": "",
         }
         self.floats = {}
-        self.device_output_channels = {}
+        # dSUID -> channel id -> OutputChannelState
+        self.outputs = {}
+        # Multiplier for MOVEMENT_DURATIONS, lower values speed up covers
+        self.movement_time_scale = 1.0
+        # Called with websocket events, set by the server
+        self.send_event = None
+        # getReachableScenes results changed with rename_scene
+        self.scene_lists = {}
+        if generated is not None:
+            for device in generated["getDevices"]["result"]:
+                for channel in device["outputChannels"]:
+                    self.output(device["dSUID"], channel["channelId"])
 
     def handle_request(self, request):
         match request.path:
@@ -52,6 +136,10 @@ class Apartment:
                 return self.get_output_channel_value(request)
             case "/json/device/setOutputChannelValue":
                 return self.set_output_channel_value(request)
+            case "/json/device/callScene":
+                return self.device_call_scene(request)
+            case "/api/v1/apartment/status":
+                return self.get_apartment_status(request)
 
         return {"ok": True, "result": {}}
 
@@ -61,7 +149,15 @@ class Apartment:
 
     def get_floating(self, request):
         path = request.query.get("path")
-        return {"ok": True, "result": {"value": 0.0}}
+        if match := OUTPUT_PATH_REGEX.fullmatch(path):
+            outputs = self.outputs.get(match.group("dsuid"), {})
+            if match.group("channel") == "powerState":
+                # Outputs are on if any channel is above zero
+                power_state = any(o.value() > 0 for o in outputs.values())
+                return {"ok": True, "result": {"value": 1.0 if power_state else 0.0}}
+            if (output := outputs.get(match.group("channel"))) is not None:
+                return {"ok": True, "result": {"value": output.value()}}
+        return {"ok": True, "result": {"value": self.floats.get(path, 0.0)}}
 
     def call_scene(self, request):
         scene_number = request.query.get("sceneNumber")
@@ -108,13 +204,41 @@ class Apartment:
     def get_reachable_scenes(self, request):
         zone_id = int(request.query.get("id"))
         group_id = int(request.query.get("groupID"))
-        data = self.read_json_file(
-            f"getReachableScenes?id={zone_id}&groupID={group_id}"
-        )
+        filename = f"getReachableScenes?id={zone_id}&groupID={group_id}"
+        if (data := self.scene_lists.get(filename)) is None:
+            data = self.read_json_file(filename)
         if data is None:
             data = {"ok": True, "result": {}}
         return data
 
+    def rename_scene(self, zone_id, group_id, scene_number, name):
+        # Set the user name of a zone scene, an empty name removes it
+        filename = f"getReachableScenes?id={zone_id}&groupID={group_id}"
+        data = self.scene_lists.get(filename) or self.read_json_file(filename)
+        data = copy.deepcopy(data) if data is not None else {"ok": True}
+        result = data.setdefault("result", {})
+        names = [
+            scene
+            for scene in result.get("userSceneNames", [])
+            if int(scene.get("sceneNr", -1)) != scene_number
+        ]
+        if name:
+            names.append({"sceneNr": scene_number, "sceneName": name})
+        result["userSceneNames"] = names
+        self.scene_lists[filename] = data
+        self.emit(
+            {
+                "name": "sceneNameChanged",
+                "properties": {
+                    "zoneID": str(zone_id),
+                    "groupID": str(group_id),
+                    "sceneID": str(scene_number),
+                    "newSceneName": name,
+                },
+                "source": {},
+            }
+        )
+
     def firmware_check(self, request):
         try:
             dsuid = request.query.get("dsuid")
@@ -142,28 +266,98 @@ class Apartment:
     def get_energy_meter_value(self, request):
         return {"ok": True, "result": {"meterValue": 3600000}}
 
+    def output(self, dsuid, channel_id):
+        if dsuid not in self.outputs:
+            self.outputs[dsuid] = {}
+        if (output := self.outputs[dsuid].get(channel_id)) is None:
+            output = OutputChannelState(channel_id)
+            self.outputs[dsuid][channel_id] = output
+        return output
+
+    def emit(self, event):
+        if self.send_event is not None:
+            self.send_event(event)
+
+    def output_changed(self, dsuid, duration):
+        source = {"dsid": dsuid, "isDevice": True}
+        self.emit(
+            {"name": "apartmentProxyStateChanged", "properties": {}, "source": source}
+        )
+        if duration > 0:
+            # Sent by the dSS when a moving device reached its end position
+            timeout_event = {
+                "name": "apartmentProxyDeviceTimeout",
+                "properties": {},
+                "source": source,
+            }
+            asyncio.get_running_loop().call_later(duration, self.emit, timeout_event)
+
     def get_output_channel_value(self, request):
         dsuid = request.query.get("dsuid")
         channels = request.query.get("channels").split(";")
         result_channels = []
-        if (cv := self.device_output_channels.get(dsuid)) is not None:
+        if (outputs := self.outputs.get(dsuid)) is not None:
             for channel in channels:
-                value = cv.get(channel)
+                value = outputs[channel].value() if channel in outputs else None
                 result_channels.append({"channel": channel, "value": value})
         return {"ok": True, "result": {"channels": result_channels}}
 
     def set_output_channel_value(self, request):
         dsuid = request.query.get("dsuid")
         channelvalues = request.query.get("channelvalues").split(";")
-        if dsuid not in self.device_output_channels:
-            self.device_output_channels[dsuid] = {}
+        duration = 0
         for cv in channelvalues:
             channel, value = cv.split("=")
-            value = float(value)
-            self.device_output_channels[dsuid][channel] = value
+            output = self.output(dsuid, channel)
+            duration = max(
+                duration, output.move_to(float(value), self.movement_time_scale)
+            )
+        self.output_changed(dsuid, duration)
+        return {"ok": True, "result": {}}
+
+    def device_call_scene(self, request):
+        dsuid = request.query.get("dsuid")
+        if int(request.query.get("sceneNumber")) == 15:
+            # Stop scene, keeps moving outputs at their current value
+            for output in self.outputs.get(dsuid, {}).values():
+                output.stop()
+            self.output_changed(dsuid, 0)
         return {"ok": True, "result": {}}
 
+    def get_apartment_status(self, request):
+        if self.generated is None:
+            data = self.read_json_file("apartmentStatus")
+            if data is None:
+                data = {"data": {}}
+            return data
+        ds_devices = []
+        for dsuid, outputs in self.outputs.items():
+            ds_devices.append(
+                {
+                    "type": "dsDeviceStatus",
+                    "id": dsuid,
+                    "attributes": {
+                        "functionBlocks": [
+                            {
+                                "id": dsuid,
+                                "outputs": [o.as_status() for o in outputs.values()],
+                            }
+                        ]
+                    },
+                }
+            )
+        return {
+            "data": {
+                "type": "apartmentStatus",
+                "id": "apartmentStatus",
+                "attributes": {},
+                "included": {"dsDevices": ds_devices, "zones": []},
+            }
+        }
+
     def read_json_file(self, filename):
+        if self.generated is not None:
+            return self.generated.get(filename)
         file_path = f"json/{filename}.json"
         try:
             with open(file_path, "rb") as json_file:
@@ -0,0 +1,304 @@
+"""Load test benchmark for the digitalSTROM integration.
+
+Starts the mock dSS in-process with a generated apartment and drives the real
+DigitalstromClient and DigitalstromApartment against it. Results are printed
+as JSON and can be written to a file to compare runs.
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from aiohttp import web
+
+import apartment
+import faults
+import generator
+import server
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from custom_components.digitalstrom.api.apartment import (  # noqa: E402
+    DigitalstromApartment,
+)
+from custom_components.digitalstrom.api.client import (  # noqa: E402
+    DigitalstromClient,
+)
+from custom_components.digitalstrom.api.decoder import decode_device  # noqa: E402
+from custom_components.digitalstrom.api.json_backend import (  # noqa: E402
+    JSON_BACKEND,
+)
+
+JSON_LIBRARIES = ["json", "orjson", "ujson"]
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    p95_index = min(len(samples) - 1, int(len(samples) * 0.95))
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 2),
+        "p95_ms": round(samples[p95_index] * 1000, 2),
+        "max_ms": round(samples[-1] * 1000, 2),
+    }
+
+
+async def start_server(ssl_ctx):
+    app = await server.init_app()
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=ssl_ctx)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, port
+
+
+async def measure_polls(name, poll, polls):
+    samples = []
+    failures = 0
+    for _ in range(polls):
+        start = time.perf_counter()
+        try:
+            await poll()
+        except Exception:
+            failures += 1
+            continue
+        samples.append(time.perf_counter() - start)
+    result = summarize(samples) if samples else {"count": 0}
+    result["failures"] = failures
+    return name, result
+
+
+def measure_decoder(ds_apartment, data, rounds):
+    # Decode the getDevices response into the existing devices without any
+    # network or server overhead
+    payload = data["getDevices"]["result"]
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for device_data in payload:
+            decode_device(ds_apartment.devices[device_data["dSUID"]], device_data)
+        samples.append(time.perf_counter() - start)
+    result = summarize(samples)
+    result["devices_per_second"] = round(len(payload) / statistics.mean(samples))
+    return result
+
+
+def measure_json_decoding(data, events, rounds):
+    # Decode recorded payloads with every installed JSON library
+    event_generator = generator.EventGenerator(data)
+    payloads = {
+        "getDevices": json.dumps(data["getDevices"]).encode(),
+        "apartmentStatus": json.dumps(server.ap.get_apartment_status(None)).encode(),
+        "events": [
+            json.dumps(event_generator.next_event()) for _ in range(max(events, 1))
+        ],
+    }
+    results = {}
+    for library_name in JSON_LIBRARIES:
+        try:
+            library = importlib.import_module(library_name)
+        except ImportError:
+            continue
+        results[library_name] = {}
+        for name, payload in payloads.items():
+            messages = payload if isinstance(payload, list) else [payload]
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for message in messages:
+                    library.loads(message)
+                samples.append(time.perf_counter() - start)
+            results[library_name][name] = summarize(samples)
+    return results
+
+
+async def measure_events(client, data, events, event_timeout):
+    if events == 0:
+        return None
+    received = 0
+    done = asyncio.get_running_loop().create_future()
+
+    async def count_callback(event):
+        nonlocal received
+        received += 1
+        if received == events and not done.done():
+            done.set_result(None)
+
+    client.register_event_callback(count_callback)
+    listener = asyncio.create_task(client.start_event_listener())
+    while len(server.connected_ws) == 0:
+        await asyncio.sleep(0.01)
+
+    event_generator = generator.EventGenerator(data)
+    messages = [json.dumps(event_generator.next_event()) for _ in range(events)]
+    start = time.perf_counter()
+    for message in messages:
+        for ws in list(server.connected_ws):
+            await ws.send_str(message)
+    try:
+        await asyncio.wait_for(done, timeout=event_timeout)
+    except asyncio.TimeoutError:
+        # Frames may have been dropped by the fault injector
+        pass
+    duration = time.perf_counter() - start
+    client.unregister_event_callback(count_callback)
+    await client.stop_event_listener()
+    listener.cancel()
+    return {
+        "events": events,
+        "received": received,
+        "duration_s": round(duration, 3),
+        "events_per_second": round(received / duration, 1),
+    }
+
+
+async def measure_output_latency(ds_apartment, channel_types, samples):
+    # Time from sending a new output value until it is visible in the status
+    channels = [
+        channel
+        for device in ds_apartment.devices.values()
+        for channel in device.output_channels.values()
+        if channel.channel_type in channel_types
+    ][:samples]
+    latencies = []
+    for channel in channels:
+        target = 0 if (channel.target_value or 0) > 50 else 100
+        start = time.perf_counter()
+        await channel.set_value(target)
+        while channel.target_value != target:
+            await ds_apartment.update_apartment_status()
+            if time.perf_counter() - start > 30:
+                break
+        else:
+            latencies.append(time.perf_counter() - start)
+    if len(latencies) == 0:
+        return None
+    return summarize(latencies)
+
+
+async def run_scenario(ssl_ctx, devices, zones, polls, events):
+    data = generator.generate_apartment(devices=devices, zones=zones)
+    server.ap = apartment.Apartment(data)
+    runner, port = await start_server(ssl_ctx)
+    try:
+        client = DigitalstromClient(host="127.0.0.1", port=port, ssl=False)
+        await client.request_app_token(server.DS_USER, server.DS_PASSWORD)
+
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        ds_apartment = DigitalstromApartment(client, server.DS_SYSTEM_DSUID)
+        await ds_apartment.get_zones()
+        await ds_apartment.get_circuits()
+        await ds_apartment.get_devices()
+        await ds_apartment.get_scenes()
+        setup = time.perf_counter() - start
+        gc.collect()
+        memory_current, memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        poll_results = dict(
+            [
+                await measure_polls(
+                    "apartmentStatus", ds_apartment.update_apartment_status, polls
+                ),
+                await measure_polls("getDevices", ds_apartment.get_devices, polls),
+                await measure_polls(
+                    "getTemperatureControlStatus",
+                    ds_apartment.get_zone_climate_data,
+                    polls,
+                ),
+            ]
+        )
+        decoder_results = measure_decoder(ds_apartment, data, polls)
+        json_results = measure_json_decoding(data, events, polls)
+        output_results = {
+            "light": await measure_output_latency(
+                ds_apartment, ["brightness"], polls
+            ),
+            "cover": await measure_output_latency(
+                ds_apartment, ["shadePositionOutside", "shadePositionIndoor"], polls
+            ),
+        }
+        event_results = await measure_events(
+            client, data, events, 5 if server.fault_injector.ws_drop_rate else 120
+        )
+        return {
+            "devices": devices,
+            "zones": zones,
+            "model_devices": len(ds_apartment.devices),
+            "model_circuits": len(ds_apartment.circuits),
+            "setup_s": round(setup, 3),
+            "memory_bytes": memory_current,
+            "memory_peak_bytes": memory_peak,
+            "polls": poll_results,
+            "decoder": decoder_results,
+            "json_decoding": json_results,
+            "command_to_state_visible": output_results,
+            "events": event_results,
+            "client_stats": client.stats.as_dict(),
+        }
+    finally:
+        await runner.cleanup()
+
+
+async def run(args):
+    ssl_ctx = server.create_ssl_context(server.CERT_PATH, server.KEY_PATH)
+    results = []
+    for devices in args.devices:
+        print(f"Running benchmark with {devices} devices", file=sys.stderr)
+        results.append(
+            await run_scenario(ssl_ctx, devices, args.zones, args.polls, args.events)
+        )
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": JSON_BACKEND,
+        "faults": args.faults,
+        "injected_faults": server.fault_injector.injected,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--zones", type=int, default=100)
+    parser.add_argument("--polls", type=int, default=10)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument(
+        "--faults", help="JSON file with latency and fault injection settings"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(server.CERT_PATH):
+        print("Certificate file not found, see README.md", file=sys.stderr)
+        sys.exit(1)
+    server.VERBOSE = False
+    if args.faults is not None:
+        server.fault_injector = faults.FaultInjector.from_file(args.faults)
+        if server.fault_injector.session_token_lifetime_s:
+            server.ENABLE_AUTH_CHECKS = True
+    result = asyncio.run(run(args))
+    result_json = json.dumps(result, indent=2)
+    print(result_json)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(result_json)
+
+
+if __name__ == "__main__":
+    main()
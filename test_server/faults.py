@@ -0,0 +1,97 @@
+import asyncio
+import json
+import random
+
+from aiohttp import web
+
+# Paths used to control the test server, these are never delayed or failed
+CONTROL_PATHS = [
+    "/send_event",
+    "/start_event_storm",
+    "/stop_event_storm",
+    "/force_disconnect",
+]
+
+
+class FaultInjector:
+    """Degrade the mock dSS according to a fault configuration.
+
+    All settings are optional, an empty configuration behaves like a perfect
+    network. See faults_example.json for the supported keys.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.rng = random.Random(config.get("seed"))
+        self.latency = config.get("latency", {})
+        self.bandwidth_kbps = config.get("bandwidth_kbps")
+        self.error_rate = config.get("error_rate", {})
+        self.auth_error_rate = config.get("auth_error_rate", 0)
+        self.session_token_lifetime_s = config.get("session_token_lifetime_s")
+        self.ws_drop_rate = config.get("ws_drop_rate", 0)
+        self.ws_disconnect_interval_s = config.get("ws_disconnect_interval_s")
+        self.injected = {"errors": 0, "auth_errors": 0, "dropped_frames": 0}
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, "rb") as config_file:
+            return cls(json.load(config_file))
+
+    def _for_path(self, setting, path, default=None):
+        if isinstance(setting, dict):
+            return setting.get(path, setting.get("default", default))
+        return setting if setting is not None else default
+
+    def sample_latency(self, path):
+        latency = self._for_path(self.latency, path)
+        if not latency:
+            return 0
+        mean = latency.get("mean_ms", 0) / 1000
+        match latency.get("distribution", "normal"):
+            case "fixed":
+                value = mean
+            case "exponential":
+                value = self.rng.expovariate(1 / mean) if mean > 0 else 0
+            case _:
+                value = self.rng.gauss(mean, latency.get("jitter_ms", 0) / 1000)
+        return max(0, value)
+
+    def transfer_time(self, size):
+        if not self.bandwidth_kbps:
+            return 0
+        return size * 8 / (self.bandwidth_kbps * 1000)
+
+    def should_fail(self, path):
+        rate = self._for_path(self.error_rate, path, 0)
+        if rate and self.rng.random() < rate:
+            self.injected["errors"] += 1
+            return True
+        return False
+
+    def should_fail_auth(self):
+        if self.auth_error_rate and self.rng.random() < self.auth_error_rate:
+            self.injected["auth_errors"] += 1
+            return True
+        return False
+
+    def should_drop_frame(self):
+        if self.ws_drop_rate and self.rng.random() < self.ws_drop_rate:
+            self.injected["dropped_frames"] += 1
+            return True
+        return False
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        if request.path in CONTROL_PATHS or request.path == "/websocket":
+            return await handler(request)
+        await asyncio.sleep(self.sample_latency(request.path))
+        if self.should_fail_auth():
+            return web.json_response({"message": "authentication failed"}, status=403)
+        if self.should_fail(request.path):
+            return web.json_response(
+                {"ok": False, "message": "Injected server error"}, status=500
+            )
+        response = await handler(request)
+        if (body := getattr(response, "body", None)) is not None:
+            await asyncio.sleep(self.transfer_time(len(body)))
+        return response
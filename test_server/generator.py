@@ -0,0 +1,277 @@
+import random
+
+# Device templates cycled through when generating an apartment. Each template
+# produces a device that exercises a different platform of the integration.
+DEVICE_KINDS = ["light", "cover", "sensor", "binary_input", "button", "switch"]
+
+GROUPS_BY_KIND = {
+    "light": 1,
+    "cover": 2,
+    "sensor": 3,
+    "binary_input": 8,
+    "button": 1,
+    "switch": 8,
+}
+
+HW_INFO_BY_KIND = {
+    "light": "GE-KM200",
+    "cover": "GR-KL200",
+    "sensor": "dS-iSens200",
+    "binary_input": "GE-UMv200",
+    "button": "GE-TKM210",
+    "switch": "SW-ZWS200",
+}
+
+REACHABLE_SCENES_BY_GROUP = {
+    1: [0, 5, 17, 18, 19, 32, 33],
+    2: [0, 5, 15],
+    3: [0, 1, 2, 3, 4],
+    8: [0, 5],
+}
+
+
+def make_dsuid(number, sub_index=0):
+    # Space the generated dSUIDs so that only devices created as split devices
+    # end up close enough together to be merged by find_split_devices
+    return f"{(number << 12) + sub_index:032x}00"
+
+
+def make_dsid(number):
+    return f"{number:024x}"
+
+
+def _output_channels(kind):
+    if kind == "light":
+        return 22, [
+            {
+                "channelIndex": 0,
+                "channelId": "brightness",
+                "channelName": "Brightness",
+                "channelType": "brightness",
+            }
+        ]
+    if kind == "cover":
+        return 33, [
+            {
+                "channelIndex": 0,
+                "channelId": "shadePositionOutside",
+                "channelName": "Shade Position Outside",
+                "channelType": "shadePositionOutside",
+            },
+            {
+                "channelIndex": 1,
+                "channelId": "shadeOpeningAngleOutside",
+                "channelName": "Shade Opening Angle Outside",
+                "channelType": "shadeOpeningAngleOutside",
+            },
+        ]
+    if kind == "switch":
+        return 16, [
+            {
+                "channelIndex": 0,
+                "channelId": "powerLevel",
+                "channelName": "Power Level",
+                "channelType": "powerLevel",
+            }
+        ]
+    return 0, []
+
+
+def generate_device(number, zone_id, meter_dsuid, rng, sub_index=0):
+    kind = DEVICE_KINDS[number % len(DEVICE_KINDS)]
+    output_mode, output_channels = _output_channels(kind)
+    device = {
+        "id": make_dsid(number),
+        "dSUID": make_dsuid(number, sub_index),
+        "name": f"{kind.replace('_', ' ').title()} {number}",
+        "hwInfo": HW_INFO_BY_KIND[kind],
+        "OemProductURL": "https://www.digitalstrom.com",
+        "zoneID": zone_id,
+        "meterDSUID": meter_dsuid,
+        "dSUIDIndex": sub_index,
+        "OemPartNumber": 0,
+        "isPresent": True,
+        "outputMode": output_mode,
+        "outputChannels": output_channels,
+        "buttonUsage": "used" if kind == "button" else "auto_unused",
+        "buttonGroupMembership": GROUPS_BY_KIND[kind],
+        "sensors": [],
+        "binaryInputs": [],
+    }
+    if kind == "sensor":
+        device["sensors"] = [
+            {"type": 9, "valid": True, "value": round(rng.uniform(18, 24), 1)},
+            {"type": 13, "valid": True, "value": round(rng.uniform(30, 60), 1)},
+        ]
+    elif kind == "binary_input":
+        device["binaryInputs"] = [
+            {
+                "targetGroup": 8,
+                "inputType": 13,
+                "inputId": 0,
+                "state": rng.randint(0, 1),
+            }
+        ]
+    return device
+
+
+def generate_apartment(devices=50, zones=10, circuits=None, split_every=10, seed=0):
+    """Generate consistent dSS payloads for an apartment of the given size.
+
+    The result maps the same names used for the files in json/ (for example
+    "getDevices") to the full JSON response of that endpoint.
+    """
+    rng = random.Random(seed)
+    if circuits is None:
+        circuits = max(1, devices // 50)
+
+    circuit_list = []
+    for c in range(circuits):
+        circuit_list.append(
+            {
+                "dSUID": f"{0xC0000000 + c:032x}00",
+                "dsid": f"{0xC0000000 + c:024x}",
+                "name": f"dSM {c + 1}",
+                "hwName": "dSM12",
+                "hwVersionString": "11.1.0.0",
+                "swVersion": "1.46.1.0",
+                "isPresent": True,
+                "hasBlinking": True,
+                "hasMetering": True,
+                "hasMeteringProducerEnabled": False,
+                "isUpToDate": True,
+            }
+        )
+
+    device_list = []
+    zone_groups = {zone_id: set() for zone_id in range(1, zones + 1)}
+    for number in range(devices):
+        zone_id = number % zones + 1
+        meter_dsuid = circuit_list[number % circuits]["dSUID"]
+        device = generate_device(number, zone_id, meter_dsuid, rng)
+        device_list.append(device)
+        zone_groups[zone_id].add(device["buttonGroupMembership"])
+        if split_every and number % split_every == split_every - 1:
+            # Second half of a device with two dSUIDs (e.g. a dual relay)
+            device_list.append(
+                generate_device(number, zone_id, meter_dsuid, rng, sub_index=1)
+            )
+
+    zone_list = []
+    for zone_id, groups in zone_groups.items():
+        zone_list.append(
+            {"zoneID": zone_id, "name": f"Zone {zone_id}", "groups": sorted(groups)}
+        )
+
+    data = {
+        "getDevices": {"ok": True, "result": device_list},
+        "getCircuits": {"ok": True, "result": {"circuits": circuit_list}},
+        "getReachableGroups": {"ok": True, "result": {"zones": zone_list}},
+        "getTemperatureControlStatus": {"ok": True, "result": {"zones": []}},
+    }
+    for zone in zone_list:
+        for group_id in zone["groups"]:
+            data[f"getReachableScenes?id={zone['zoneID']}&groupID={group_id}"] = (
+                generate_reachable_scenes(zone["zoneID"], group_id)
+            )
+    return data
+
+
+def generate_reachable_scenes(zone_id, group_id):
+    reachable_scenes = REACHABLE_SCENES_BY_GROUP.get(group_id, [0, 5])
+    named_scenes = []
+    if group_id == 1 and zone_id % 3 == 0:
+        named_scenes.append({"sceneNr": 5, "sceneName": f"Bright {zone_id}"})
+    return {
+        "ok": True,
+        "result": {
+            "reachableScenes": reachable_scenes,
+            "userSceneNames": named_scenes,
+        },
+    }
+
+
+class EventGenerator:
+    """Produce random websocket events matching the devices of an apartment."""
+
+    def __init__(self, data, seed=0):
+        self.rng = random.Random(seed)
+        devices = data["getDevices"]["result"]
+        self.sensor_devices = [d for d in devices if len(d["sensors"]) > 0]
+        self.binary_input_devices = [d for d in devices if d["binaryInputs"]]
+        self.button_devices = [d for d in devices if d["buttonUsage"] == "used"]
+        self.zones = data["getReachableGroups"]["result"]["zones"]
+        self.generators = []
+        if self.sensor_devices:
+            self.generators.append(self.sensor_event)
+        if self.binary_input_devices:
+            self.generators.append(self.binary_input_event)
+        if self.button_devices:
+            self.generators.append(self.button_event)
+        if self.zones:
+            self.generators.append(self.scene_event)
+
+    def next_event(self):
+        return self.rng.choice(self.generators)()
+
+    def sensor_event(self):
+        device = self.rng.choice(self.sensor_devices)
+        index = self.rng.randrange(len(device["sensors"]))
+        sensor = device["sensors"][index]
+        value = sensor["value"] + self.rng.uniform(-0.5, 0.5)
+        return {
+            "name": "deviceSensorValue",
+            "properties": {
+                "sensorIndex": str(index),
+                "sensorType": str(sensor["type"]),
+                "sensorValueFloat": str(round(value, 2)),
+            },
+            "source": {"dsid": device["dSUID"], "isDevice": True},
+        }
+
+    def binary_input_event(self):
+        device = self.rng.choice(self.binary_input_devices)
+        binary_input = device["binaryInputs"][0]
+        binary_input["state"] = 1 - binary_input["state"]
+        return {
+            "name": "deviceBinaryInputEvent",
+            "properties": {
+                "inputIndex": "0",
+                "inputState": str(binary_input["state"]),
+                "inputType": str(binary_input["inputType"]),
+            },
+            "source": {"dsid": device["dSUID"], "isDevice": True},
+        }
+
+    def button_event(self):
+        device = self.rng.choice(self.button_devices)
+        return {
+            "name": "buttonClick",
+            "properties": {
+                "buttonIndex": "0",
+                "clickType": str(self.rng.choice([0, 1, 4, 6])),
+            },
+            "source": {"dsid": device["dSUID"], "isDevice": True},
+        }
+
+    def scene_event(self):
+        zone = self.rng.choice(self.zones)
+        group_id = self.rng.choice(zone["groups"])
+        scene_id = self.rng.choice(REACHABLE_SCENES_BY_GROUP.get(group_id, [0, 5]))
+        return {
+            "name": "callScene",
+            "properties": {
+                "sceneID": str(scene_id),
+                "groupID": str(group_id),
+                "zoneID": str(zone["zoneID"]),
+                "callOrigin": "1",
+            },
+            "source": {
+                "set": f".zone({zone['zoneID']}).group({group_id})",
+                "groupID": group_id,
+                "zoneID": zone["zoneID"],
+                "isApartment": False,
+                "isGroup": True,
+                "isDevice": False,
+            },
+        }
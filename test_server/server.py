@@ -1,3 +1,4 @@
+import argparse
 import ast
 import asyncio
 import json
@@ -11,6 +12,8 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 
 import apartment
+import faults
+import generator
 
 HOST = "0.0.0.0"
 PORT = 8080
@@ -21,18 +24,25 @@ DS_PASSWORD = "password"
 DS_USER_TOKEN = "test_user_token"
 DS_SYSTEM_DSUID = "TEST_SYSTEM_DSUID"
 ENABLE_AUTH_CHECKS = False
+# Print every request and response, disabled by the benchmark
+VERBOSE = True
 
 APP_TOKENS: dict[str, dict[str, str | bool]] = {}
 SESSION_TOKENS: dict[str, dict[str, str | float]] = {}
 connected_ws = set()
+# Event names subscribed per session token and subscription id
+EVENT_SUBSCRIPTIONS: dict[str, dict[str, set[str]]] = {}
 ap = apartment.Apartment()
+fault_injector = faults.FaultInjector()
+event_storm_task = None
 
 
 def validate_and_get_app_token(session_token):
     if session_token not in SESSION_TOKENS.keys():
         return None
     last_activity = SESSION_TOKENS[session_token]["last_activity"]
-    if datetime.now() > last_activity + timedelta(seconds=60):
+    lifetime = fault_injector.session_token_lifetime_s or 60
+    if datetime.now() > last_activity + timedelta(seconds=lifetime):
         print(f"Deleting expired session token {session_token}")
         del SESSION_TOKENS[session_token]
         return None
@@ -49,6 +59,9 @@ async def auth_middleware(request, handler):
         "/json/system/enableToken",
         "/json/system/loginApplication",
         "/send_event",
+        "/start_event_storm",
+        "/stop_event_storm",
+        "/force_disconnect",
     ]
     if request.path in UNAUTHENTICATED_PATHS:
         return await handler(request)
@@ -111,10 +124,43 @@ async def login_application(request):
     return web.json_response({"ok": True, "result": {"token": session_token}})
 
 
+async def event_subscribe(request):
+    session_token = request.cookies.get("token")
+    subscription_id = request.query.get("subscriptionID")
+    name = request.query.get("name")
+    if subscription_id is None or name is None:
+        return web.json_response({"ok": False, "message": "Missing parameter"})
+    subscriptions = EVENT_SUBSCRIPTIONS.setdefault(session_token, {})
+    subscriptions.setdefault(subscription_id, set()).add(name)
+    if VERBOSE:
+        print(f"Subscribed to {name} ({subscription_id})")
+    return web.json_response({"ok": True})
+
+
+async def event_unsubscribe(request):
+    session_token = request.cookies.get("token")
+    subscription_id = request.query.get("subscriptionID")
+    name = request.query.get("name")
+    subscriptions = EVENT_SUBSCRIPTIONS.get(session_token, {})
+    if subscription_id in subscriptions:
+        subscriptions[subscription_id].discard(name)
+        if len(subscriptions[subscription_id]) == 0:
+            del subscriptions[subscription_id]
+    return web.json_response({"ok": True})
+
+
+def is_subscribed(ws, name):
+    # Connections only receive the events their session token subscribed to
+    subscriptions = EVENT_SUBSCRIPTIONS.get(ws.session_token, {})
+    return any(name in names for names in subscriptions.values())
+
+
 async def json_api(request):
-    print(request.rel_url)
+    if VERBOSE:
+        print(request.rel_url)
     result = ap.handle_request(request)
-    print(result)
+    if VERBOSE:
+        print(result)
     return web.json_response(result)
 
 
@@ -129,8 +175,10 @@ async def websocket_handler(request):
 
     if ENABLE_AUTH_CHECKS:
         ws.session = app_token
+    ws.session_token = request.cookies.get("token")
 
-    print("WS connected")
+    if VERBOSE:
+        print("WS connected")
     connected_ws.add(ws)
 
     try:
@@ -140,7 +188,8 @@ async def websocket_handler(request):
             elif msg.type == WSMsgType.ERROR:
                 print("WS connection closed with exception %s" % ws.exception())
     finally:
-        print("WS disconnected")
+        if VERBOSE:
+            print("WS disconnected")
         connected_ws.discard(ws)
 
     return ws
@@ -182,15 +231,128 @@ async def send_event(request):
         )
 
     if connected_ws:
-        msg_text = json.dumps(event)
-        coros = [ws.send_str(msg_text) for ws in connected_ws if not ws.closed]
-        await asyncio.gather(*coros, return_exceptions=True)
+        await broadcast(json.dumps(event), event["name"])
 
     return web.json_response({"sent": True, "connected_clients": len(connected_ws)})
 
 
+async def broadcast(msg_text, name):
+    coros = [
+        ws.send_str(msg_text)
+        for ws in connected_ws
+        if not ws.closed
+        and is_subscribed(ws, name)
+        and not fault_injector.should_drop_frame()
+    ]
+    await asyncio.gather(*coros, return_exceptions=True)
+
+
+async def close_websockets():
+    coros = [ws.close() for ws in connected_ws if not ws.closed]
+    await asyncio.gather(*coros, return_exceptions=True)
+    return len(coros)
+
+
+async def force_disconnect(request):
+    # This is not part of the DSS API. Closes all websocket connections.
+    closed = await close_websockets()
+    print(f"Forced disconnect of {closed} websocket clients")
+    return web.json_response({"disconnected_clients": closed})
+
+
+async def disconnect_websockets_periodically(app):
+    interval = fault_injector.ws_disconnect_interval_s
+
+    async def disconnect_loop():
+        while True:
+            await asyncio.sleep(interval)
+            if (closed := await close_websockets()) > 0:
+                print(f"Injected disconnect of {closed} websocket clients")
+
+    if interval:
+        task = asyncio.create_task(disconnect_loop())
+        yield
+        task.cancel()
+    else:
+        yield
+
+
+async def run_event_storm(rate, burst, duration, seed):
+    # Send bursts of random events so that the average rate matches `rate`
+    events = generator.EventGenerator(ap.generated, seed)
+    interval = burst / rate
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+    sent = 0
+    next_burst = loop.time()
+    while loop.time() < end:
+        for _ in range(burst):
+            event = events.next_event()
+            await broadcast(json.dumps(event), event["name"])
+        sent += burst
+        next_burst += interval
+        await asyncio.sleep(max(0, next_burst - loop.time()))
+    print(f"Event storm finished, {sent} events sent")
+
+
+async def start_event_storm(request):
+    # This is not part of the DSS API. Streams random events to all connected clients.
+    global event_storm_task
+    if ap.generated is None:
+        return web.json_response(
+            {"error": "Event storms require a generated apartment (--devices)"},
+            status=400,
+        )
+    try:
+        rate = float(request.query.get("rate", 100))
+        burst = int(request.query.get("burst", 1))
+        duration = float(request.query.get("duration", 60))
+        seed = int(request.query.get("seed", 0))
+    except ValueError:
+        return web.json_response({"error": "Invalid parameters"}, status=400)
+    if rate <= 0 or burst <= 0:
+        return web.json_response(
+            {"error": "rate and burst must be positive"}, status=400
+        )
+    if event_storm_task is not None:
+        event_storm_task.cancel()
+    print(f"Starting event storm: {rate} events/s in bursts of {burst}")
+    event_storm_task = asyncio.create_task(run_event_storm(rate, burst, duration, seed))
+    return web.json_response({"started": True, "connected_clients": len(connected_ws)})
+
+
+async def stop_event_storm(request):
+    global event_storm_task
+    stopped = event_storm_task is not None and not event_storm_task.done()
+    if event_storm_task is not None:
+        event_storm_task.cancel()
+        event_storm_task = None
+    return web.json_response({"stopped": stopped})
+
+
+async def rename_scene(request):
+    # This is not part of the DSS API. Changes the user name of a zone scene.
+    try:
+        zone_id = int(request.query.get("zone"))
+        group_id = int(request.query.get("group"))
+        scene_number = int(request.query.get("scene"))
+    except (TypeError, ValueError):
+        return web.json_response(
+            {"error": "Use rename_scene?zone=1&group=1&scene=5&name=Reading"},
+            status=400,
+        )
+    ap.rename_scene(zone_id, group_id, scene_number, request.query.get("name", ""))
+    return web.json_response({"renamed": True, "connected_clients": len(connected_ws)})
+
+
+def send_event_later(event):
+    asyncio.get_running_loop().create_task(broadcast(json.dumps(event), event["name"]))
+
+
 async def init_app():
-    app = web.Application(middlewares=[auth_middleware])
+    ap.send_event = send_event_later
+    app = web.Application(middlewares=[fault_injector.middleware, auth_middleware])
+    app.cleanup_ctx.append(disconnect_websockets_periodically)
     app.router.add_get("/json/system/getDSID", get_dsid)
     app.router.add_get(
         "/json/system/requestApplicationToken", request_application_token
@@ -198,9 +360,16 @@ async def init_app():
     app.router.add_get("/json/system/login", login)
     app.router.add_get("/json/system/enableToken", enable_token)
     app.router.add_get("/json/system/loginApplication", login_application)
+    app.router.add_get("/json/event/subscribe", event_subscribe)
+    app.router.add_get("/json/event/unsubscribe", event_unsubscribe)
     app.router.add_get(r"/json/{path:.*}", json_api)
+    app.router.add_get(r"/api/v1/{path:.*}", json_api)
     app.router.add_get("/websocket", websocket_handler)
     app.router.add_get("/send_event", send_event)
+    app.router.add_get("/start_event_storm", start_event_storm)
+    app.router.add_get("/stop_event_storm", stop_event_storm)
+    app.router.add_get("/force_disconnect", force_disconnect)
+    app.router.add_get("/rename_scene", rename_scene)
     return app
 
 
@@ -221,13 +390,41 @@ def print_login_details(cert_path, username, password):
         exit()
 
 
+def create_ssl_context(cert_path, key_path):
+    ssl_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_ctx.load_cert_chain(cert_path, key_path)
+    ssl_ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    return ssl_ctx
+
+
 def main():
+    global ap, fault_injector, ENABLE_AUTH_CHECKS
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--devices",
+        type=int,
+        help="Serve a generated apartment instead of the files in json/",
+    )
+    parser.add_argument("--zones", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--faults", help="JSON file with latency and fault injection settings"
+    )
+    args = parser.parse_args()
+    if args.faults is not None:
+        fault_injector = faults.FaultInjector.from_file(args.faults)
+        if fault_injector.session_token_lifetime_s:
+            ENABLE_AUTH_CHECKS = True
+    if args.devices is not None:
+        ap = apartment.Apartment(
+            generator.generate_apartment(
+                devices=args.devices, zones=args.zones, seed=args.seed
+            )
+        )
     print_login_details(CERT_PATH, DS_USER, DS_PASSWORD)
     loop = asyncio.new_event_loop()
     app = loop.run_until_complete(init_app())
-    ssl_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-    ssl_ctx.load_cert_chain(CERT_PATH, KEY_PATH)
-    ssl_ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    ssl_ctx = create_ssl_context(CERT_PATH, KEY_PATH)
     web.run_app(app, host=HOST, port=PORT, ssl_context=ssl_ctx)
 
 